@@ -948,20 +948,13 @@ export default function SyntheticVoiceover() {
         formData,
         {
           headers: { 'Content-Type': 'multipart/form-data' },
+          responseType: 'blob',
           timeout: 300000, // 5 minutes
         }
       );
 
-      const videoBase64 = response?.data?.video;
-      if (videoBase64) {
-        const byteCharacters = decodeBase64(videoBase64);
-        const byteNumbers = new Array(byteCharacters.length);
-        for (let i = 0; i < byteCharacters.length; i += 1) {
-          byteNumbers[i] = byteCharacters.charCodeAt(i);
-        }
-        const byteArray = new Uint8Array(byteNumbers);
-        const blob = new Blob([byteArray], { type: 'video/mp4' });
-
+      const blob = response?.data;
+      if (blob && blob.size) {
         if (processedVideoUrl) {
           URL.revokeObjectURL(processedVideoUrl);
         }
@@ -976,7 +969,16 @@ export default function SyntheticVoiceover() {
     } catch (error) {
       console.error('Multi-speaker generation failed', error);
       setStatusError(true);
-      const message = error?.response?.data?.error || error.message || 'Generation failed.';
+      let message = error.message || 'Generation failed.';
+      // The request asks for a blob, so JSON error bodies arrive as a Blob too.
+      const errorBody = error?.response?.data;
+      if (errorBody instanceof Blob) {
+        try {
+          message = JSON.parse(await errorBody.text())?.error || message;
+        } catch (parseError) {
+          // Non-JSON error body; keep the transport message.
+        }
+      }
       setStatus(`Multi-speaker video generation failed: ${message}`);
     } finally {
       setReplacingAudio(false);
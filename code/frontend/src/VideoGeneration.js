@@ -328,7 +328,14 @@ function VideoGeneration() {
           const statusResponse = await axios.get(`${BACKEND_URL}/check-status/${generationId}`);
           const statusData = statusResponse.data;
           
-          if (statusData.status === 'completed') {
+          if (statusData.status === 'completed' && statusData.audio_status === 'pending') {
+            // Show the silent cut right away; keep polling until the audio mux swaps in
+            setMessage({ 
+              type: 'info', 
+              text: 'Video ready. Adding the audio track...' 
+            });
+            setCurrentVideo(statusData);
+          } else if (statusData.status === 'completed') {
             clearInterval(pollInterval);
             setMessage({ 
               type: 'success', 
@@ -433,7 +440,8 @@ function VideoGeneration() {
         {currentVideo && (
           <VideoPreview>
             <VideoTitle>Generated Video</VideoTitle>
-            <VideoPlayer controls autoPlay loop crossOrigin="anonymous">
+            {/* Keyed on the S3 key so the player reloads when the audio mux replaces the silent cut */}
+            <VideoPlayer key={currentVideo.s3_key} controls autoPlay loop>
               <source src={`${BACKEND_URL}/video/${currentVideo.id}`} type="video/mp4" />
               Your browser does not support the video tag.
             </VideoPlayer>
@@ -479,7 +487,7 @@ function VideoGeneration() {
           <HistoryGrid>
             {history.map((item) => (
               <HistoryCard key={item.id} onClick={() => setCurrentVideo(item)}>
-                <HistoryVideoThumb controls crossOrigin="anonymous">
+                <HistoryVideoThumb controls>
                   <source src={`${BACKEND_URL}/video/${item.id}`} type="video/mp4" />
                 </HistoryVideoThumb>
                 <HistoryInfo>
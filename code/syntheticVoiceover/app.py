@@ -1,22 +1,40 @@
 from __future__ import annotations
 
+import atexit
 import os
 import json
+import random
 import base64
 import re
+import string
+import hashlib
 import html
-from functools import lru_cache
-from typing import Any, Dict, Tuple
-from xml.etree import ElementTree as ET
-
-from flask import Flask, jsonify, request
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple
+from xml.parsers import expat
+
+from flask import Flask, jsonify, request, send_file
 from flask_cors import CORS
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import BotoCoreError, ClientError
 from botocore.config import Config
-from difflib import SequenceMatcher
-from collections import Counter
+from collections import Counter, OrderedDict
+from shared.artifact_cleanup import purge_stale_artifacts
 from shared.env_loader import load_environment
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 load_environment()
 
@@ -46,13 +64,60 @@ DEFAULT_MAX_TOKENS = int(os.environ.get("VOICEOVER_MAX_TOKENS", "900"))
 DEFAULT_TEMPERATURE = float(os.environ.get("VOICEOVER_TEMPERATURE", "0.6"))
 DEFAULT_TOP_P = float(os.environ.get("VOICEOVER_TOP_P", "0.9"))
 
+# Bedrock request/response bodies go through orjson when it is installed; the
+# stdlib fallback produces the same UTF-8 bytes.
+if orjson is not None:
+    _json_dumps_bytes = orjson.dumps
+    _json_loads = orjson.loads
+else:  # pragma: no cover - optional dependency
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+# Compiled once at import; these run against multi-KB model output on every request.
+SSML_RE = re.compile(r"<speak>.*?</speak>", re.DOTALL | re.IGNORECASE)
+SPEAK_BLOCK_RE = re.compile(r"<\s*speak\b[^>]*>(.*)</\s*speak\s*>", re.IGNORECASE | re.DOTALL)
+WHITESPACE_RE = re.compile(r"\s+")
+TAG_RE = re.compile(r"<[^>]+>")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+BULLET_SPLIT_RE = re.compile(r"[\n\r•\-]+")
+XML_HEADER_RE = re.compile(r"<\?xml[^>]*>|<!DOCTYPE[^>]*>", re.IGNORECASE)
+RATE_DECIMAL_RE = re.compile(r'rate="([0-9]*\.?[0-9]+)"', re.IGNORECASE)
+# Break-time, decimal-rate and bare-ampersand fixups in a single scan; the
+# outer named group that matched is reported by ``match.lastgroup``.
+SSML_FIXUP_RE = re.compile(
+    r'(?P<break>time="(?P<break_value>[0-9]*\.?[0-9]+)(?P<break_unit>s|ms)")'
+    r'|(?P<rate>rate="(?P<rate_value>[0-9]*\.?[0-9]+)")'
+    r"|(?P<amp>&(?![a-zA-Z]+;|#\d+;|#x[0-9A-Fa-f]+;))",
+    re.IGNORECASE,
+)
+AMAZON_TAG_RE = re.compile(r"<\s*/?amazon:(?:effect|domain|auto-breaths)[^>]*>", re.IGNORECASE)
+RATE_X_RE = re.compile(r'rate="x-(fast|slow)"', re.IGNORECASE)
+VOLUME_X_RE = re.compile(r'volume="x-(loud|soft)"', re.IGNORECASE)
+COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+# Punctuation -> space for tokenizing; "_" stays since it is a word character.
+# Typographic quotes/dashes are included because model output is full of them.
+PUNCT_TO_SPACE = str.maketrans(
+    {char: " " for char in string.punctuation.replace("_", "") + "\u2018\u2019\u201c\u201d\u2013\u2014\u2026\u00ab\u00bb\u00a1\u00bf\u2022"}
+)
+# Same output as html.escape(..., quote=True) in one C-level pass.
+HTML_ESCAPE_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+P_TAG_RE = re.compile(r"<\s*/?p\s*>", re.IGNORECASE)
+S_TAG_RE = re.compile(r"<\s*/?s\s*>", re.IGNORECASE)
+PITCH_ATTR_RE = re.compile(r"\s+pitch=\"[^\"]*\"", re.IGNORECASE)
+
 # FFmpeg paths - check common locations
 FFMPEG_PATH = os.environ.get("FFMPEG_PATH")
 if not FFMPEG_PATH:
     for path in ["/opt/homebrew/bin/ffmpeg", "/usr/local/bin/ffmpeg", "/usr/bin/ffmpeg", "ffmpeg"]:
         try:
-            import subprocess
-            result = subprocess.run([path, "-version"], capture_output=True, timeout=2)
+            result = subprocess.run(
+                [path, "-version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=2,
+            )
             if result.returncode == 0:
                 FFMPEG_PATH = path
                 break
@@ -63,9 +128,411 @@ if not FFMPEG_PATH:
 
 FFPROBE_PATH = FFMPEG_PATH.replace("ffmpeg", "ffprobe") if "ffmpeg" in FFMPEG_PATH else "ffprobe"
 
+_POLLY_MAX_CONCURRENCY = int(os.environ.get("POLLY_MAX_CONCURRENCY", "5"))
+_WORKER_THREADS = int(os.environ.get("VOICEOVER_WORKER_THREADS", "8"))
+
+# boto3 clients are thread-safe and share one urllib3 pool across threads. Size each
+# pool to the number of threads that can call it at once, so concurrent calls reuse
+# warm TLS connections instead of opening extras that urllib3 would then discard.
 bedrock_runtime = boto3.client("bedrock-runtime", region_name=BEDROCK_REGION)
-polly = boto3.client("polly", region_name=POLLY_REGION)
-translate = boto3.client("translate", region_name=DEFAULT_AWS_REGION)
+# Adaptive retry mode adds client-side rate limiting on top of backoff when Polly throttles.
+polly = boto3.client(
+    "polly",
+    region_name=POLLY_REGION,
+    config=Config(
+        retries={"max_attempts": 8, "mode": "adaptive"},
+        max_pool_connections=max(10, _POLLY_MAX_CONCURRENCY),
+        # Fail fast on a stale pooled socket instead of the 60s botocore default;
+        # the adaptive retries above pick the call up on a fresh connection.
+        connect_timeout=2,
+        read_timeout=10,
+        tcp_keepalive=True,
+    ),
+)
+translate = boto3.client(
+    "translate",
+    region_name=DEFAULT_AWS_REGION,
+    config=Config(max_pool_connections=max(10, _WORKER_THREADS)),
+)
+
+# Shared pool for independent AWS calls / probes that can overlap within a request
+# (e.g. ffprobe while Bedrock generates, or translating segments ahead of synthesis).
+_WORKER_POOL = ThreadPoolExecutor(
+    max_workers=_WORKER_THREADS,
+    thread_name_prefix="voiceover",
+)
+
+
+# Idle pooled connections get dropped server-side, and the next synthesis then pays
+# for a fresh TLS handshake. A cheap describe_voices call this often keeps one warm.
+# 0 disables the pinger.
+_POLLY_KEEPALIVE_SECONDS = float(os.environ.get("VOICEOVER_POLLY_KEEPALIVE_SECONDS", "30"))
+
+
+def _polly_keepalive_loop() -> None:
+    while True:
+        time.sleep(_POLLY_KEEPALIVE_SECONDS)
+        try:
+            polly.describe_voices(LanguageCode="en-US")
+        except (BotoCoreError, ClientError):
+            pass
+
+
+if _POLLY_KEEPALIVE_SECONDS > 0:
+    threading.Thread(target=_polly_keepalive_loop, name="polly-keepalive", daemon=True).start()
+
+
+# Multipart settings for Transcribe uploads: 8 MB parts with CPU-scaled concurrency
+# so large audio saturates the link instead of trickling through 5 streams.
+_S3_MULTIPART_CHUNK_BYTES = 8 * 1024 * 1024
+_S3_MAX_CONCURRENCY = min(32, (os.cpu_count() or 4) * 4)
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_S3_MULTIPART_CHUNK_BYTES,
+    multipart_chunksize=_S3_MULTIPART_CHUNK_BYTES,
+    max_concurrency=_S3_MAX_CONCURRENCY,
+    use_threads=True,
+    max_io_queue=1000,
+    io_chunksize=256 * 1024,
+)
+
+
+# Source audio codecs Transcribe can ingest as-is: codec -> (file extension, MediaFormat)
+_TRANSCRIBE_PASSTHROUGH_CODECS = {
+    "aac": ("m4a", "mp4"),
+    "opus": ("ogg", "ogg"),
+}
+
+
+def _probe_audio_codec(path: Any) -> str | None:
+    """Return the codec name of the first audio stream, or None if it cannot be probed."""
+    probe_cmd = [
+        FFPROBE_PATH, "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=codec_name",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        str(path),
+    ]
+    probe_result = subprocess.run(probe_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    codec = (probe_result.stdout or "").strip().lower()
+    return codec or None
+
+
+# Per-request segment synthesis runs on its own short-lived pool so it never waits
+# on translation futures queued behind it in _WORKER_POOL. The semaphore caps
+# concurrent Polly calls process-wide to stay under the account's TPS limit.
+_SEGMENT_SYNTH_WORKERS = int(os.environ.get("VOICEOVER_SEGMENT_WORKERS", "8"))
+_POLLY_SEMAPHORE = threading.BoundedSemaphore(_POLLY_MAX_CONCURRENCY)
+
+_POLLY_THROTTLE_CODES = {"ThrottlingException", "TooManyRequestsException"}
+_POLLY_THROTTLE_RETRIES = 5
+
+
+def _is_transient_polly_error(error: BaseException) -> bool:
+    """Throttling, 5xx and connection errors: the kinds the client's retry handler retries.
+
+    Anything else (InvalidSsmlException, TextLengthExceededException, ...) is a
+    rejection of this particular request and is never retried.
+    """
+    if not isinstance(error, ClientError):
+        return isinstance(error, BotoCoreError)
+    if error.response.get("Error", {}).get("Code") in _POLLY_THROTTLE_CODES:
+        return True
+    return error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500
+
+
+def _polly_synthesize_throttled(**kwargs: Any) -> dict[str, Any]:
+    """Call synthesize_speech under the concurrency cap, retrying throttles with jittered backoff."""
+    attempt = 0
+    while True:
+        try:
+            with _POLLY_SEMAPHORE:
+                return polly.synthesize_speech(**kwargs)
+        except ClientError as error:
+            code = error.response.get("Error", {}).get("Code")
+            if code not in _POLLY_THROTTLE_CODES or attempt >= _POLLY_THROTTLE_RETRIES:
+                raise
+        # Sleep outside the semaphore so other segments can use the slot meanwhile.
+        time.sleep(random.uniform(0, (2 ** attempt) * 0.1))
+        attempt += 1
+
+# Segment audio is requested from Polly as 16-bit mono PCM at this rate (Polly's PCM
+# output supports 8000/16000 Hz) and the whole mix stays at it.
+_SEGMENT_SAMPLE_RATE = 16000
+_WAV_HEADER_BYTES = 44
+
+# Polly bills at most 3000 characters per request (tags excluded) and accepts
+# 6000 characters of SSML in total; batched segment requests stay under both.
+_POLLY_BATCH_BILLED_CHARS = 3000
+_POLLY_BATCH_SSML_CHARS = 6000
+
+# Chunk size for copying Polly's streaming body to disk without buffering it whole.
+_STREAM_COPY_CHUNK_BYTES = 1024 * 1024
+
+# Voices that accept <amazon:domain name="conversational"> for segment narration.
+_CONVERSATIONAL_STYLE_VOICES = frozenset({"Matthew", "Joanna", "Ruth", "Stephen", "Kevin", "Salli", "Joey"})
+
+# Content-addressed cache of synthesized segment WAVs, shared across jobs so
+# repeated utterances skip Polly entirely. Evicts least-recently-used files
+# once the directory exceeds VOICEOVER_AUDIO_CACHE_MAX_MB.
+_AUDIO_CACHE_DIR = Path(
+    os.environ.get("VOICEOVER_AUDIO_CACHE_DIR") or Path(tempfile.gettempdir()) / "voiceover_audio_cache"
+)
+_AUDIO_CACHE_MAX_BYTES = int(float(os.environ.get("VOICEOVER_AUDIO_CACHE_MAX_MB", "512")) * 1024 * 1024)
+_audio_cache_lock = threading.Lock()
+
+
+def _audio_cache_key(params: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _audio_cache_fetch(key: str, destination: Path) -> bool:
+    """Copy a cached WAV to ``destination``; returns False on a miss."""
+    cached = _AUDIO_CACHE_DIR / f"{key}.wav"
+    try:
+        shutil.copyfile(cached, destination)
+        os.utime(cached)  # bump recency for LRU eviction
+    except OSError:
+        return False
+    return True
+
+
+def _audio_cache_store(key: str, source: Path) -> None:
+    cached = _AUDIO_CACHE_DIR / f"{key}.wav"
+    try:
+        _AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write under a unique name, then rename so readers never see a partial file.
+        staging = _AUDIO_CACHE_DIR / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(source, staging)
+        os.replace(staging, cached)
+    except OSError as exc:
+        app.logger.warning("Unable to cache synthesized audio %s: %s", key, exc)
+        return
+    _prune_audio_cache()
+
+
+def _prune_audio_cache() -> None:
+    with _audio_cache_lock:
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        try:
+            with os.scandir(_AUDIO_CACHE_DIR) as scan:
+                for entry in scan:
+                    if not entry.name.endswith(".wav"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+        if total <= _AUDIO_CACHE_MAX_BYTES:
+            return
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= _AUDIO_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+
+def _wav_header(pcm_size: int, sample_rate: int, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """Build a 44-byte RIFF/WAVE header for little-endian signed PCM data."""
+    block_align = channels * bits_per_sample // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + pcm_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        bits_per_sample,
+        b"data",
+        pcm_size,
+    )
+
+
+def _pcm_wav_duration_seconds(path: Any, sample_rate: int, channels: int = 1, bits_per_sample: int = 16) -> float:
+    """Duration of a header-plus-PCM WAV we wrote ourselves, derived from its size (no ffprobe)."""
+    pcm_size = max(0, os.path.getsize(path) - _WAV_HEADER_BYTES)
+    return pcm_size / (sample_rate * channels * bits_per_sample // 8)
+
+
+# Concurrent ffmpeg processes for independent per-segment work within one job.
+_FFMPEG_PARALLELISM = min(8, os.cpu_count() or 1)
+
+# Upper bound on amix inputs per ffmpeg graph; larger mixes are done in groups.
+_AMIX_MAX_INPUTS = 16
+
+
+def _adelay_amix_graph(delays_ms: list[int], first_input: int, output_label: str) -> list[str]:
+    """Filter chains that shift each input by its delay and sum them into ``[output_label]``."""
+    parts = [
+        f"[{first_input + offset}:a]adelay={delay}|{delay}[a{offset}]"
+        for offset, delay in enumerate(delays_ms)
+    ]
+    mix_inputs = "".join(f"[a{offset}]" for offset in range(len(delays_ms)))
+    # normalize=0 keeps each voice at its own level and dropout_transition=0 stops
+    # amix from re-weighting the survivors as inputs end (heard as a fade-up).
+    parts.append(
+        f"{mix_inputs}amix=inputs={len(delays_ms)}:duration=longest"
+        f":dropout_transition=0:normalize=0[{output_label}]"
+    )
+    return parts
+
+
+def _atempo_chain(factor: float) -> str | None:
+    # ffmpeg atempo supports 0.5..2.0 per filter; chain to reach wider ranges.
+    if not factor or factor <= 0:
+        return None
+    if abs(factor - 1.0) < 0.02:
+        return None
+    parts: list[str] = []
+    remaining = float(factor)
+    while remaining < 0.5:
+        parts.append("atempo=0.5")
+        remaining /= 0.5
+    while remaining > 2.0:
+        parts.append("atempo=2.0")
+        remaining /= 2.0
+    parts.append(f"atempo={remaining:.4f}")
+    return ",".join(parts)
+
+
+def _probe_duration_seconds(path: Any) -> float | None:
+    """Return the container duration reported by ffprobe, or None if unavailable."""
+    probe_cmd = [
+        FFPROBE_PATH, "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        str(path),
+    ]
+    probe_result = subprocess.run(probe_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        value = float((probe_result.stdout or "").strip())
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+# Only this much of ffmpeg's stderr is kept for error reporting.
+_FFMPEG_STDERR_TAIL_BYTES = 16 * 1024
+
+
+def _run_ffmpeg(cmd: list[str], check: bool = False) -> subprocess.CompletedProcess:
+    """Run ffmpeg with stdout discarded and stderr sent to an unnamed temp file.
+
+    Nothing is buffered in Python on success; the stderr tail is read back only
+    when the process fails. (A SpooledTemporaryFile would roll over to disk as
+    soon as subprocess asked for its fileno, so a plain TemporaryFile is used.)
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=stderr_file)
+        stderr_text = ""
+        if result.returncode != 0:
+            stderr_file.seek(max(0, stderr_file.seek(0, os.SEEK_END) - _FFMPEG_STDERR_TAIL_BYTES))
+            stderr_text = stderr_file.read().decode("utf-8", errors="replace")
+    if check and result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, cmd, stderr=stderr_text)
+    return subprocess.CompletedProcess(cmd, result.returncode, stdout=None, stderr=stderr_text)
+
+
+# Fragmented MP4 puts an empty moov up front and writes media as it goes, so the
+# final mux never has to go back and rewrite the file (unlike +faststart).
+_FRAGMENTED_MP4_FLAGS = ("-movflags", "+frag_keyframe+empty_moov+default_base_moof")
+
+# Multiple of 3 so each chunk's base64 output concatenates without padding.
+_B64_READ_CHUNK_BYTES = 3 * 1024 * 1024
+
+
+# Polly audio is read off the response in pieces of this size.
+_AUDIO_READ_CHUNK_BYTES = 3 * 16 * 1024
+
+
+def _b64encode_chunks(chunks: Iterable[bytes]) -> tuple[str, int]:
+    """Base64-encode byte chunks as they arrive; returns (encoded, size_in_bytes).
+
+    Only one chunk of raw bytes is held at a time instead of the whole payload
+    alongside its encoding. Chunks may be any length: bytes past the last
+    multiple of 3 carry into the next chunk so the pieces concatenate unpadded.
+    """
+    encoded_parts: list[bytes] = []
+    size = 0
+    carry = b""
+    for chunk in chunks:
+        size += len(chunk)
+        data = memoryview(carry + chunk if carry else chunk)
+        cut = len(data) - len(data) % 3
+        encoded_parts.append(base64.b64encode(data[:cut]))
+        carry = bytes(data[cut:])
+    if carry:
+        encoded_parts.append(base64.b64encode(carry))
+    return b"".join(encoded_parts).decode("ascii"), size
+
+
+def _read_file_base64(path: Any) -> tuple[str, int]:
+    """Base64-encode a file chunk by chunk; returns (encoded, size_in_bytes)."""
+    with open(path, "rb") as handle:
+        return _b64encode_chunks(iter(partial(handle.read, _B64_READ_CHUNK_BYTES), b""))
+
+
+# Temp-dir deletion runs here so large job directories don't delay the response.
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cleanup")
+atexit.register(_CLEANUP_POOL.shutdown)
+
+
+def _schedule_cleanup(path: Any) -> None:
+    """Remove a job's temp directory in the background."""
+    _CLEANUP_POOL.submit(shutil.rmtree, path, ignore_errors=True)
+
+
+# Job temp directories live under one root so a janitor can sweep any that a
+# crashed or killed worker never got to clean up.
+_JOB_TEMP_ROOT = Path(
+    os.environ.get("VOICEOVER_TEMP_ROOT") or Path(tempfile.gettempdir()) / "voiceover_jobs"
+)
+_JOB_TEMP_ROOT.mkdir(parents=True, exist_ok=True)
+ARTIFACT_RETENTION_HOURS = int(os.getenv("ARTIFACT_RETENTION_HOURS", "6"))
+ARTIFACT_CLEANUP_INTERVAL_MINUTES = int(os.getenv("ARTIFACT_CLEANUP_INTERVAL_MINUTES", "30"))
+ENABLE_ARTIFACT_CLEANUP = os.getenv("ENABLE_ARTIFACT_CLEANUP", "1") not in {"0", "false", "False"}
+
+
+def _make_job_temp_dir(prefix: str) -> Path:
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=_JOB_TEMP_ROOT))
+
+
+def _start_artifact_cleanup_thread() -> None:
+    if not ENABLE_ARTIFACT_CLEANUP or ARTIFACT_CLEANUP_INTERVAL_MINUTES <= 0:
+        return
+
+    interval = ARTIFACT_CLEANUP_INTERVAL_MINUTES * 60
+
+    def _loop() -> None:
+        while True:
+            try:
+                purge_stale_artifacts(
+                    [_JOB_TEMP_ROOT],
+                    retention_hours=ARTIFACT_RETENTION_HOURS,
+                    logger=app.logger,
+                )
+            except Exception:  # pragma: no cover - defensive logging
+                app.logger.exception("artifact_cleanup_failed")
+            time.sleep(interval)
+
+    thread = threading.Thread(target=_loop, name="artifact-cleanup", daemon=True)
+    thread.start()
+
+
+_start_artifact_cleanup_thread()
 
 
 def _normalise_bucket_region(region: str | None) -> str:
@@ -115,19 +582,23 @@ def health() -> Any:
     })
 
 
+# The system prompt and the two fixed rules never change per request; only the
+# persona/language/force pieces are appended per attempt.
+_INSTRUCTION_PREFIX = " ".join((
+    SYSTEM_PROMPT.strip(),
+    "Return only valid SSML wrapped in <speak>...</speak> with no commentary or explanations outside the tags.",
+    "Do not repeat the user's prompt verbatim. Transform the ideas into an original spoken narration with multiple sentences.",
+))
+_IS_LLAMA3 = (MODEL_ID or "").lower().startswith("meta.llama3")
+
+
 def _build_instruction_context(
     prompt: str,
     persona: str | None = None,
     language: str | None = None,
     force_speech: bool = False
 ) -> tuple[str, str]:
-    instructions = [SYSTEM_PROMPT.strip()]
-    instructions.append(
-        "Return only valid SSML wrapped in <speak>...</speak> with no commentary or explanations outside the tags."
-    )
-    instructions.append(
-        "Do not repeat the user's prompt verbatim. Transform the ideas into an original spoken narration with multiple sentences."
-    )
+    instructions = [_INSTRUCTION_PREFIX]
     if persona:
         instructions.append(f"Adopt the following tone guidance: {persona.strip()}")
     if language:
@@ -153,9 +624,8 @@ def _compose_prompt(
         language=language,
         force_speech=force_speech,
     )
-    model_id = (MODEL_ID or "").lower()
     # Llama 3 Instruct expects the Llama-3 chat template.
-    if model_id.startswith("meta.llama3"):
+    if _IS_LLAMA3:
         return (
             "<|begin_of_text|>"
             "<|start_header_id|>system<|end_header_id|>\n"
@@ -297,40 +767,60 @@ def _extract_generation_text(response_body: Dict[str, Any]) -> str:
 def _invoke_bedrock(body: Dict[str, Any]) -> Dict[str, Any]:
     response = bedrock_runtime.invoke_model(
         modelId=MODEL_ID,
-        body=json.dumps(body),
+        body=_json_dumps_bytes(body),
         accept="application/json",
         contentType="application/json"
     )
-    return json.loads(response["body"].read())
+    return _json_loads(response["body"].read())
+
+
+_DEBUG_MODEL_RESPONSES = os.environ.get("VOICEOVER_DEBUG", "0") in {"1", "true", "True"}
+
+
+def _response_summary(response: Any, generation: str) -> dict[str, Any]:
+    """Small diagnostic view of a rejected model response; the full body only with VOICEOVER_DEBUG."""
+
+    fields = response if isinstance(response, dict) else {}
+    summary: dict[str, Any] = {
+        "stop_reason": fields.get("stop_reason"),
+        "prompt_token_count": fields.get("prompt_token_count"),
+        "generation_token_count": fields.get("generation_token_count"),
+        "head": generation[:400],
+    }
+    if _DEBUG_MODEL_RESPONSES:
+        try:
+            summary["body"] = _json_dumps_bytes(response).decode("utf-8")
+        except Exception:
+            summary["body"] = str(response)
+    return summary
 
 
 def _fallback_ssml(prompt: str) -> str:
     """Construct a heuristic SSML narration when the model response fails."""
 
-    cleaned = re.sub(r"\s+", " ", (prompt or "").strip())
+    cleaned = WHITESPACE_RE.sub(" ", (prompt or "").strip())
     if not cleaned:
         cleaned = "our story today"
 
-    sentences = re.split(r"(?<=[.!?])\s+", cleaned)
+    sentences = SENTENCE_SPLIT_RE.split(cleaned)
     focus_sentence = sentences[0] if sentences and sentences[0].strip() else cleaned
-    focus_phrase = html.escape(focus_sentence.strip()[:180])
+    focus_phrase = focus_sentence.strip()[:180].translate(HTML_ESCAPE_TRANS)
 
-    bullet_candidates = [part.strip() for part in re.split(r"[\n\r•\-]+", cleaned) if part.strip()]
-    bullet_phrases = [html.escape(candidate[:160]) for candidate in bullet_candidates[:3]]
+    bullet_candidates = filter(None, (part.strip() for part in BULLET_SPLIT_RE.split(cleaned)))
+    bullet_phrases = [candidate[:160].translate(HTML_ESCAPE_TRANS) for candidate in islice(bullet_candidates, 3)]
 
     intro = f"<p><s>Welcome! Let's explore {focus_phrase} from a fresh perspective.</s><break time=\"400ms\"/></p>"
-    body_sentences = []
     if bullet_phrases:
-        for idx, phrase in enumerate(bullet_phrases, start=1):
-            body_sentences.append(
-                f"<s>Key moment {idx}: {phrase}. We'll bring this idea to life with vivid storytelling.</s>"
-            )
+        body_sentences = "<break time=\"250ms\"/>".join(
+            f"<s>Key moment {idx}: {phrase}. We'll bring this idea to life with vivid storytelling.</s>"
+            for idx, phrase in enumerate(bullet_phrases, start=1)
+        )
     else:
-        body_sentences.append(
+        body_sentences = (
             "<s>We'll unfold the main ideas step by step, highlighting the emotions and motivations along the way.</s>"
         )
 
-    body = "<p>" + "<break time=\"250ms\"/>".join(body_sentences) + "</p>"
+    body = f"<p>{body_sentences}</p>"
     outro = (
         "<p><s>Stay tuned as we guide you through the narrative, keeping the energy dynamic and engaging.</s>"
         "<break time=\"350ms\"/><s>Thanks for listening.</s></p>"
@@ -339,58 +829,79 @@ def _fallback_ssml(prompt: str) -> str:
     return f"<speak>{intro}{body}{outro}</speak>"
 
 
+@lru_cache(maxsize=256)
+def _is_well_formed_xml(text: str) -> bool:
+    # expat checks well-formedness without building a tree. Cached because the
+    # same SSML is normalised again on Polly retries and repeated segments.
+    try:
+        expat.ParserCreate().Parse(text, True)
+    except expat.ExpatError:
+        return False
+    return True
+
+
+# The same normalized SSML is stripped repeatedly across the Polly fallback cascade.
+@lru_cache(maxsize=256)
 def _strip_ssml_tags(ssml: str) -> str:
-    no_tags = re.sub(r"<[^>]+>", " ", ssml)
-    return re.sub(r"\s+", " ", no_tags).strip()
+    # split()/join collapses and trims whitespace without a second regex pass.
+    return " ".join(TAG_RE.sub(" ", ssml).split())
 
 
 def _tokenize(text: str) -> list[str]:
-    cleaned = re.sub(r"[^\w\s]", " ", text).lower()
-    tokens = [token for token in cleaned.split() if token]
-    return tokens
+    return text.lower().translate(PUNCT_TO_SPACE).split()
 
 
 def _token_overlap(prompt_tokens: list[str], ssml_tokens: list[str]) -> float:
     if not prompt_tokens or not ssml_tokens:
         return 0.0
-    prompt_counter = Counter(prompt_tokens)
-    ssml_counter = Counter(ssml_tokens)
-    overlap = sum((prompt_counter & ssml_counter).values())
-    return overlap / max(1, len(prompt_tokens))
+    # Multiset intersection size in one pass over the SSML tokens.
+    remaining = Counter(prompt_tokens)
+    overlap = 0
+    for token in ssml_tokens:
+        count = remaining.get(token, 0)
+        if count:
+            remaining[token] = count - 1
+            overlap += 1
+    return overlap / len(prompt_tokens)
 
 
 def _looks_like_prompt_echo(prompt: str, ssml: str) -> bool:
     if not prompt or not ssml:
         return False
-    prompt_clean = re.sub(r"\s+", " ", prompt).strip().lower()
-    ssml_clean = _strip_ssml_tags(ssml).lower()
-    if not prompt_clean or not ssml_clean:
+    # One regex pass drops the tags; split() collapses whitespace, so neither side
+    # needs a separate whitespace-normalising pass.
+    prompt_words = prompt.lower().split()
+    ssml_words = TAG_RE.sub(" ", ssml).lower().split()
+    if not prompt_words or not ssml_words:
         return False
-    if prompt_clean == ssml_clean:
-        return True
+    prompt_clean = " ".join(prompt_words)
+    ssml_clean = " ".join(ssml_words)
 
-    # If the SSML simply repeats the prompt with minimal padding, treat as echo
-    if ssml_clean.startswith(prompt_clean):
-        trailing = ssml_clean[len(prompt_clean):].strip()
-        if not trailing or len(trailing.split()) <= 3:
+    # Verbatim or prompt-plus-a-few-words output; impossible with more than 3 extra words.
+    if len(ssml_words) <= len(prompt_words) + 3:
+        if prompt_clean == ssml_clean:
             return True
-
-    similarity = SequenceMatcher(None, prompt_clean, ssml_clean).ratio()
+        if ssml_clean.startswith(prompt_clean):
+            trailing = ssml_clean[len(prompt_clean):].strip()
+            if not trailing or len(trailing.split()) <= 3:
+                return True
 
     prompt_tokens = _tokenize(prompt_clean)
     ssml_tokens = _tokenize(ssml_clean)
+    if not prompt_tokens or not ssml_tokens:
+        return False
+    # Cheap reject: if the SSML lacks half the prompt's distinct words it is not an
+    # echo, and the multiset overlap below never needs computing.
+    prompt_vocab = set(prompt_tokens)
+    if len(prompt_vocab.intersection(ssml_tokens)) * 2 < len(prompt_vocab):
+        return False
     overlap_ratio = _token_overlap(prompt_tokens, ssml_tokens)
+    length_ratio = min(len(prompt_tokens), len(ssml_tokens)) / max(len(prompt_tokens), len(ssml_tokens))
 
-    length_ratio = 1.0
-    if prompt_tokens and ssml_tokens:
-        length_ratio = min(len(prompt_tokens), len(ssml_tokens)) / max(len(prompt_tokens), len(ssml_tokens))
-
-    # Consider it an echo if overlap is high and lengths are similar,
-    # or the string similarity itself is very high.
-    token_ratio = len(ssml_tokens) / max(1, len(prompt_tokens)) if prompt_tokens else 0.0
+    # Consider it an echo if token overlap is high and lengths are similar. Near-verbatim
+    # echoes land here too, so no character-level (quadratic) similarity pass is needed.
+    token_ratio = len(ssml_tokens) / len(prompt_tokens)
 
-    if similarity >= 0.995 and length_ratio >= 0.97:
-        return True
     if overlap_ratio >= 0.98 and length_ratio >= 0.95:
         return True
     if overlap_ratio >= 0.95 and length_ratio >= 0.9 and token_ratio <= 1.08:
@@ -401,6 +912,69 @@ def _looks_like_prompt_echo(prompt: str, ssml: str) -> bool:
     return False
 
 
+# Retry instructions appended to the user's prompt by the attempt plan.
+_ATTEMPT_PROMPT_FORCE_SPEECH = (
+    "\n\n"
+    "Transform this into a fresh narration script with original phrasing, using expressive SSML tags. "
+    "Deliver 4-6 sentences split across paragraphs with varied pacing cues."
+)
+_ATTEMPT_PROMPT_STORY_ARC = (
+    "\n\n"
+    "Craft a vivid voiceover with an opening hook, middle build, and closing call-to-action. "
+    "Incorporate <p> sections, <break>, and <emphasis> tags. Avoid copying the input sentences directly."
+)
+_ATTEMPT_PROMPT_ESCALATION_TMPL = (
+    "\n\n"
+    "Attempt {n}: Produce an entirely new narration with a cinematic arc, vivid sensory language,"
+    " and varied pacing. Do not mirror the source sentences—paraphrase heavily and introduce fresh connective tissue.\n"
+    "Use multiple <p> blocks, layer in <prosody rate=\"slow\"> and <emphasis> for key beats, and ensure at least five"
+    " sentences total. Close with a motivating call-to-action."
+)
+
+# Regenerating the same clip (e.g. with a different voice) resubmits the same
+# prompt; serve those from memory instead of paying for another Bedrock run.
+_SSML_CACHE_MAX_ENTRIES = 256
+_SSML_CACHE_ENABLED = os.environ.get("VOICEOVER_DISABLE_CACHE", "0") not in {"1", "true", "True"}
+_ssml_cache: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+_ssml_cache_lock = threading.Lock()
+
+
+def _ssml_cache_key(
+    user_prompt: str,
+    persona: str | None,
+    language: str | None,
+    temperature: float,
+    top_p: float,
+) -> str:
+    material = json.dumps(
+        {
+            "p": user_prompt.strip().lower(),
+            "persona": persona,
+            "lang": language,
+            "t": round(temperature, 2),
+            "tp": round(top_p, 2),
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _ssml_cache_get(key: str) -> tuple[str, dict[str, Any]] | None:
+    with _ssml_cache_lock:
+        cached = _ssml_cache.get(key)
+        if cached is not None:
+            _ssml_cache.move_to_end(key)
+        return cached
+
+
+def _ssml_cache_put(key: str, ssml: str, meta: dict[str, Any]) -> None:
+    with _ssml_cache_lock:
+        _ssml_cache[key] = (ssml, meta)
+        _ssml_cache.move_to_end(key)
+        while len(_ssml_cache) > _SSML_CACHE_MAX_ENTRIES:
+            _ssml_cache.popitem(last=False)
+
+
 @app.route("/generate-ssml", methods=["POST"])
 def generate_ssml() -> Any:
     payload: Dict[str, Any] = request.get_json(silent=True) or {}
@@ -416,6 +990,17 @@ def generate_ssml() -> Any:
     base_temperature = float(payload.get("temperature", DEFAULT_TEMPERATURE))
     base_top_p = float(payload.get("top_p", DEFAULT_TOP_P))
 
+    cache_key = (
+        _ssml_cache_key(user_prompt, persona, language, base_temperature, base_top_p)
+        if _SSML_CACHE_ENABLED
+        else None
+    )
+    if cache_key:
+        cached = _ssml_cache_get(cache_key)
+        if cached is not None:
+            cached_ssml, cached_meta = cached
+            return jsonify({"ssml": cached_ssml, "meta": {**cached_meta, "cached": True}})
+
     def _should_retry(current_ssml: str) -> tuple[bool, str | None]:
         if not current_ssml:
             return True, "empty"
@@ -443,11 +1028,7 @@ def generate_ssml() -> Any:
             continue
 
         if attempt_index == 1:
-            prompt_text = (
-                f"{user_prompt}\n\n"
-                "Transform this into a fresh narration script with original phrasing, using expressive SSML tags. "
-                "Deliver 4-6 sentences split across paragraphs with varied pacing cues."
-            )
+            prompt_text = user_prompt + _ATTEMPT_PROMPT_FORCE_SPEECH
             attempt_plan.append({
                 "index": attempt_index + 1,
                 "label": "retry_force_speech",
@@ -463,11 +1044,7 @@ def generate_ssml() -> Any:
             continue
 
         if attempt_index == 2:
-            prompt_text = (
-                f"{user_prompt}\n\n"
-                "Craft a vivid voiceover with an opening hook, middle build, and closing call-to-action. "
-                "Incorporate <p> sections, <break>, and <emphasis> tags. Avoid copying the input sentences directly."
-            )
+            prompt_text = user_prompt + _ATTEMPT_PROMPT_STORY_ARC
             attempt_plan.append({
                 "index": attempt_index + 1,
                 "label": "retry_story_arc",
@@ -484,13 +1061,7 @@ def generate_ssml() -> Any:
 
         # For subsequent attempts, progressively reinforce originality and richness.
         escalation = attempt_index - 2
-        prompt_text = (
-            f"{user_prompt}\n\n"
-            f"Attempt {attempt_index + 1}: Produce an entirely new narration with a cinematic arc, vivid sensory language,"
-            " and varied pacing. Do not mirror the source sentences—paraphrase heavily and introduce fresh connective tissue.\n"
-            "Use multiple <p> blocks, layer in <prosody rate=\"slow\"> and <emphasis> for key beats, and ensure at least five"
-            " sentences total. Close with a motivating call-to-action."
-        )
+        prompt_text = user_prompt + _ATTEMPT_PROMPT_ESCALATION_TMPL.format(n=attempt_index + 1)
         attempt_plan.append({
             "index": attempt_index + 1,
             "label": f"retry_escalation_{attempt_index + 1}",
@@ -508,7 +1079,11 @@ def generate_ssml() -> Any:
     response_body: Dict[str, Any] | None = None
     attempt_logs: list[dict[str, Any]] = []
 
-    for attempt in attempt_plan:
+    def _run_attempt(
+        attempt: dict[str, Any],
+    ) -> tuple[dict[str, Any], str, Dict[str, Any] | None]:
+        """Run one planned attempt; returns (log entry, accepted SSML or "", last response)."""
+        last_response: Dict[str, Any] | None = None
         request_variants: list[tuple[str, Dict[str, Any]]] = [
             (
                 "prompt",
@@ -573,22 +1148,18 @@ def generate_ssml() -> Any:
                 })
                 break
 
-            try:
-                serialized_body = json.dumps(candidate, ensure_ascii=False)
-            except Exception:
-                serialized_body = str(candidate)
             app.logger.warning(
                 "SSML generation attempt '%s' (%s variant) invalid (empty). Response: %s",
                 attempt["label"],
                 variant_label,
-                serialized_body,
+                _response_summary(candidate, raw_candidate),
             )
             variant_attempts.append({
                 "variant": variant_label,
                 "status": "invalid",
                 "generation_length": len(raw_candidate),
             })
-            response_body = candidate
+            last_response = candidate
             last_error = "empty"
 
         if candidate_response is None:
@@ -606,11 +1177,10 @@ def generate_ssml() -> Any:
             else:
                 entry["status"] = "error"
                 entry["error"] = last_error or "Model runtime request failed."
-            attempt_logs.append(entry)
-            continue
+            return entry, "", last_response
 
         needs_retry, retry_reason = _should_retry(raw_generation)
-        attempt_logs.append({
+        entry = {
             "attempt": attempt.get("index"),
             "label": attempt["label"],
             "status": "retry" if needs_retry else "ok",
@@ -621,25 +1191,50 @@ def generate_ssml() -> Any:
             "top_p": attempt["top_p"],
             "inference_variant": variant_used,
             "variant_attempts": variant_attempts,
-        })
+        }
 
         if raw_generation and not needs_retry:
-            generation = raw_generation
-            response_body = candidate_response
-            break
+            return entry, raw_generation, candidate_response
 
-        response_body = candidate_response
         if retry_reason:
-            try:
-                serialized_body = json.dumps(candidate_response, ensure_ascii=False)
-            except Exception:
-                serialized_body = str(candidate_response)
             app.logger.warning(
                 "SSML generation attempt '%s' invalid (%s). Response: %s",
                 attempt["label"],
                 retry_reason,
-                serialized_body,
+                _response_summary(candidate_response, raw_generation),
             )
+        return entry, "", candidate_response
+
+    # The primary attempt runs alone; if it fails validation, the next
+    # VOICEOVER_SPECULATIVE_RETRIES attempts are issued together and the first
+    # passing one wins. 0 restores strictly sequential retries.
+    speculative = min(3, max(1, int(os.environ.get("VOICEOVER_SPECULATIVE_RETRIES", "2"))))
+    pending = list(attempt_plan)
+    while pending and not generation:
+        wave_size = 1 if not attempt_logs else min(speculative, len(pending))
+        wave, pending = pending[:wave_size], pending[wave_size:]
+        if wave_size == 1:
+            results = [_run_attempt(wave[0])]
+        else:
+            results = []
+            executor = ThreadPoolExecutor(max_workers=wave_size, thread_name_prefix="ssml-attempt")
+            try:
+                futures = [executor.submit(_run_attempt, attempt) for attempt in wave]
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    if results[-1][1]:
+                        break
+            finally:
+                # Calls already in flight finish in the background; queued ones are dropped.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        results.sort(key=lambda result: result[0].get("attempt") or 0)
+        for entry, raw_generation, candidate_response in results:
+            attempt_logs.append(entry)
+            if candidate_response is not None and not generation:
+                response_body = candidate_response
+            if raw_generation and not generation:
+                generation = raw_generation
 
     if not generation:
         fallback_ssml = _fallback_ssml(user_prompt)
@@ -664,19 +1259,71 @@ def generate_ssml() -> Any:
             }
         }), 200
 
-    return jsonify({
-        "ssml": generation,
-        "meta": {
-            "prompt_tokens": (response_body or {}).get("prompt_token_count"),
-            "generation_tokens": (response_body or {}).get("generation_token_count"),
-            "attempt_count": len(attempt_logs),
-            "attempts": attempt_logs,
-        }
-    })
+    meta = {
+        "prompt_tokens": (response_body or {}).get("prompt_token_count"),
+        "generation_tokens": (response_body or {}).get("generation_token_count"),
+        "attempt_count": len(attempt_logs),
+        "attempts": attempt_logs,
+    }
+    if cache_key:
+        _ssml_cache_put(cache_key, generation, meta)
+    return jsonify({"ssml": generation, "meta": meta})
+
+
+_VOICES_CACHE_TTL_SECONDS = float(os.environ.get("VOICEOVER_VOICES_CACHE_TTL", "3600"))
+_voices_cache: dict[str, Any] = {"ts": 0.0, "data": None}
+_voices_cache_lock = threading.Lock()
+
+# The catalog changes on the order of weeks, so a fresh worker seeds itself from
+# disk instead of paginating describe_voices for every engine on its first request.
+_VOICES_DISK_CACHE_TTL_SECONDS = float(os.environ.get("VOICEOVER_VOICE_CACHE_TTL", "86400"))
+_VOICES_DISK_CACHE_PATH = (
+    Path(os.environ.get("VOICEOVER_CACHE_DIR") or Path.home() / ".cache" / "psl-media")
+    / f"polly_voices_all_engines_{POLLY_REGION}.json"
+)
+
+
+def _read_voices_disk_cache() -> list[dict[str, Any]] | None:
+    try:
+        if time.time() - _VOICES_DISK_CACHE_PATH.stat().st_mtime >= _VOICES_DISK_CACHE_TTL_SECONDS:
+            return None
+        voices = json.loads(_VOICES_DISK_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return voices if isinstance(voices, list) and voices else None
+
+
+def _write_voices_disk_cache(voices: list[dict[str, Any]]) -> None:
+    try:
+        _VOICES_DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        staging = _VOICES_DISK_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        staging.write_text(json.dumps(voices), encoding="utf-8")
+        os.replace(staging, _VOICES_DISK_CACHE_PATH)
+    except OSError as exc:
+        app.logger.warning("Unable to persist voice catalog cache: %s", exc)
 
 
-@lru_cache(maxsize=1)
 def _list_neural_voices() -> list[dict[str, Any]]:
+    """Return the Polly voice list, refreshing it at most once per TTL window."""
+    cached = _voices_cache["data"]
+    if cached and time.monotonic() - _voices_cache["ts"] < _VOICES_CACHE_TTL_SECONDS:
+        return cached
+    with _voices_cache_lock:
+        cached = _voices_cache["data"]
+        if cached and time.monotonic() - _voices_cache["ts"] < _VOICES_CACHE_TTL_SECONDS:
+            return cached
+        voices = None if cached else _read_voices_disk_cache()
+        if voices is None:
+            voices = _fetch_neural_voices()
+            if voices:
+                _write_voices_disk_cache(voices)
+        # Don't pin an empty list (e.g. transient Polly failure) for the whole TTL.
+        if voices:
+            _voices_cache.update(ts=time.monotonic(), data=voices)
+        return voices
+
+
+def _fetch_neural_voices() -> list[dict[str, Any]]:
     """List all available voices from AWS Polly (neural, long-form, generative engines)."""
     voices_dict: dict[str, dict[str, Any]] = {}
     
@@ -784,17 +1431,30 @@ _AUDIO_MIME = {
 }
 
 
-@lru_cache(maxsize=128)
-def _voice_supported_engines(voice_id: str) -> list[str]:
+@lru_cache(maxsize=256)
+def _describe_voice_engines(voice_id: str) -> frozenset[str]:
+    # Raises on AWS errors so lru_cache only ever pins successful lookups.
+    voices = polly.describe_voices(VoiceId=voice_id).get("Voices", [])
+    engines = (voices[0].get("SupportedEngines", []) or []) if voices else []
+    return frozenset(engine.lower() for engine in engines)
+
+
+def _voice_supported_engines(voice_id: str) -> frozenset[str]:
     try:
-        response = polly.describe_voices(VoiceId=voice_id)
+        return _describe_voice_engines(voice_id)
     except (BotoCoreError, ClientError):
-        return []
-    voices = response.get("Voices", [])
-    if not voices:
-        return []
-    engines = voices[0].get("SupportedEngines", []) or []
-    return [engine.lower() for engine in engines]
+        return frozenset()
+
+
+def _call_polly(base: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+    """synthesize_speech with ``base`` request args, overriding only the given keys."""
+    return polly.synthesize_speech(**{**base, **overrides})
+
+
+def _aws_error_message(error: BaseException) -> str:
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Message", str(error))
+    return str(error)
 
 
 def _get_best_engine_for_voice(voice_id: str) -> str:
@@ -813,13 +1473,16 @@ def _get_best_engine_for_voice(voice_id: str) -> str:
         return "standard" if "standard" in engines else "neural"
 
 
-def _create_natural_ssml(text: str, engine: str = "neural") -> str:
+def _create_natural_ssml_body(text: str, engine: str = "neural") -> str:
     """
     Create natural-sounding SSML with prosody, pauses, and emphasis.
     Makes synthetic speech sound more human-like and conversational.
+
+    Returns the markup without the <speak> wrapper so callers can wrap it once
+    (plain, conversational domain, or batched with marks) in a single f-string.
     """
     if not text or not text.strip():
-        return "<speak></speak>"
+        return ""
     
     text = text.strip()
 
@@ -842,7 +1505,7 @@ def _create_natural_ssml(text: str, engine: str = "neural") -> str:
     text = re.sub(r"\buse\s+cases\b", USE_CASES_TOKEN, text, flags=re.IGNORECASE)
     
     # Build SSML with natural elements
-    ssml_parts = ['<speak>']
+    ssml_parts: list[str] = []
     
     # Split by sentence endings but keep the punctuation
     sentences = re.split(r'([.!?]+\s*)', text)
@@ -931,7 +1594,6 @@ def _create_natural_ssml(text: str, engine: str = "neural") -> str:
         ssml_parts[-1] = last_part
     
     ssml_parts.append('</p>')
-    ssml_parts.append('</speak>')
     return ''.join(ssml_parts)
 
 
@@ -1026,15 +1688,15 @@ def _normalize_transcript_for_voiceover(text: str) -> str:
 def _sanitize_ssml_for_neural(ssml: str) -> str:
     sanitized = ssml
     # Remove amazon-specific tags unsupported by neural voices
-    sanitized = re.sub(r"<\s*/?amazon:(?:effect|domain|auto-breaths)[^>]*>", "", sanitized, flags=re.IGNORECASE)
+    sanitized = AMAZON_TAG_RE.sub("", sanitized)
     # Some Polly engines/voices can be picky; flatten paragraph/sentence wrappers.
-    sanitized = re.sub(r"<\s*/?p\s*>", "", sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r"<\s*/?s\s*>", "", sanitized, flags=re.IGNORECASE)
+    sanitized = P_TAG_RE.sub("", sanitized)
+    sanitized = S_TAG_RE.sub("", sanitized)
     # Remove pitch adjustments if the voice/engine rejects them.
-    sanitized = re.sub(r"\s+pitch=\"[^\"]*\"", "", sanitized, flags=re.IGNORECASE)
+    sanitized = PITCH_ATTR_RE.sub("", sanitized)
     # Simplify prosody attributes that can cause issues (e.g., extreme rates)
-    sanitized = re.sub(r'rate="x-(fast|slow)"', r'rate="\1"', sanitized, flags=re.IGNORECASE)
-    sanitized = re.sub(r'volume="x-(loud|soft)"', r'volume="\1"', sanitized, flags=re.IGNORECASE)
+    sanitized = RATE_X_RE.sub(r'rate="\1"', sanitized)
+    sanitized = VOLUME_X_RE.sub(r'volume="\1"', sanitized)
     def _sanitize_rate_decimal(match: re.Match[str]) -> str:
         value = match.group(1)
         try:
@@ -1048,9 +1710,9 @@ def _sanitize_ssml_for_neural(ssml: str) -> str:
             return f'rate="{percent}%"'
         return match.group(0)
 
-    sanitized = re.sub(r'rate="([0-9]*\.?[0-9]+)"', _sanitize_rate_decimal, sanitized, flags=re.IGNORECASE)
+    sanitized = RATE_DECIMAL_RE.sub(_sanitize_rate_decimal, sanitized)
     # Remove speakable SSML comments if any
-    sanitized = re.sub(r"<!--.*?-->", "", sanitized, flags=re.DOTALL)
+    sanitized = COMMENT_RE.sub("", sanitized)
     return sanitized
 
 
@@ -1067,14 +1729,13 @@ def _normalize_ssml(ssml: str) -> tuple[str, bool, list[str]]:
         return fallback, True, notes
 
     # remove xml declarations or doctypes that the speech service rejects
-    new_candidate = re.sub(r"<\?xml[^>]*>", "", candidate, flags=re.IGNORECASE)
-    new_candidate = re.sub(r"<!DOCTYPE[^>]*>", "", new_candidate, flags=re.IGNORECASE)
+    new_candidate = XML_HEADER_RE.sub("", candidate)
     if new_candidate != candidate:
         notes.append("removed_xml_header")
         candidate = new_candidate.strip()
 
     # Extract the first <speak>...</speak> block if multiple exists
-    speak_match = re.search(r"<\s*speak\b[^>]*>(.*)</\s*speak\s*>", candidate, flags=re.IGNORECASE | re.DOTALL)
+    speak_match = SPEAK_BLOCK_RE.search(candidate)
     if speak_match:
         inner = speak_match.group(1)
         leading = candidate[:speak_match.start()].strip()
@@ -1086,46 +1747,43 @@ def _normalize_ssml(ssml: str) -> tuple[str, bool, list[str]]:
         notes.append("wrapped_in_speak")
         candidate = f"<speak>{candidate}</speak>"
 
-    # Convert break times expressed as fractional seconds to milliseconds (e.g., 0.5s -> 500ms)
-    def _convert_break(match: re.Match[str]) -> str:
-        time_value = match.group(1)
-        suffix = match.group(2).lower()
-        if suffix == "ms":
-            return match.group(0)
-        try:
-            seconds = float(time_value)
-            millis = int(round(seconds * 1000))
-            return f"time=\"{millis}ms\""
-        except ValueError:
-            return match.group(0)
-
-    converted_candidate = re.sub(r'time="([0-9]*\.?[0-9]+)(s|ms)"', _convert_break, candidate, flags=re.IGNORECASE)
-    if converted_candidate != candidate:
-        notes.append("normalized_break_time")
-        candidate = converted_candidate
-
-    # Normalize prosody rate values given as decimals (e.g., 0.9 -> 90%)
-    def _convert_rate(match: re.Match[str]) -> str:
-        value = match.group(1)
-        try:
-            numeric = float(value)
+    # Convert fractional-second break times to milliseconds (0.5s -> 500ms), decimal
+    # prosody rates to percentages (0.9 -> 90%), and escape bare ampersands.
+    fixups: set[str] = set()
+
+    def _apply_fixup(match: re.Match[str]) -> str:
+        kind = match.lastgroup
+        original_text = match.group(0)
+        replacement = original_text
+        if kind == "amp":
+            replacement = "&amp;"
+        elif kind == "break":
+            if match.group("break_unit").lower() != "ms":
+                try:
+                    replacement = f'time="{int(round(float(match.group("break_value")) * 1000))}ms"'
+                except ValueError:
+                    pass
+        elif kind == "rate":
+            try:
+                numeric = float(match.group("rate_value"))
+            except ValueError:
+                numeric = 0.0
             if 0 < numeric < 10:
-                percent = int(round(numeric * 100))
-                return f'rate="{percent}%"'
-        except ValueError:
-            pass
-        return match.group(0)
-
-    converted_rate = re.sub(r'rate="([0-9]*\.?[0-9]+)"', _convert_rate, candidate, flags=re.IGNORECASE)
-    if converted_rate != candidate:
-        notes.append("normalized_rate_decimal")
-        candidate = converted_rate
-
-    # Escape bare ampersands that are not part of an entity reference
-    escaped_candidate = re.sub(r"&(?![a-zA-Z]+;|#\d+;|#x[0-9A-Fa-f]+;)", "&amp;", candidate)
-    if escaped_candidate != candidate:
-        notes.append("escaped_ampersands")
-        candidate = escaped_candidate
+                replacement = f'rate="{int(round(numeric * 100))}%"'
+        if replacement != original_text:
+            fixups.add(kind)
+        return replacement
+
+    # Every fixup needs an '&' or an attribute value; plain narration skips the scan.
+    if "&" in candidate or '="' in candidate:
+        candidate = SSML_FIXUP_RE.sub(_apply_fixup, candidate)
+    for kind, note in (
+        ("break", "normalized_break_time"),
+        ("rate", "normalized_rate_decimal"),
+        ("amp", "escaped_ampersands"),
+    ):
+        if kind in fixups:
+            notes.append(note)
 
     # Ensure the inner text is not entirely whitespace after cleanup
     inner_text = _strip_ssml_tags(candidate)
@@ -1133,11 +1791,12 @@ def _normalize_ssml(ssml: str) -> tuple[str, bool, list[str]]:
         notes.append("empty_after_strip")
         candidate = "<speak></speak>"
 
-    # Validate by parsing; if parsing fails, fall back to a plain escaped narration
-    try:
-        ET.fromstring(candidate)
-    except ET.ParseError:
-        safe_text = html.escape(inner_text or "Narration coming up.")
+    # Validate by parsing; if parsing fails, fall back to a plain escaped narration.
+    # A body with no markup or entity references is well-formed by construction.
+    body = candidate[len("<speak>"):-len("</speak>")]
+    needs_parse = "<" in body or "&" in body
+    if needs_parse and not _is_well_formed_xml(candidate):
+        safe_text = (inner_text or "Narration coming up.").translate(HTML_ESCAPE_TRANS)
         candidate = f"<speak>{safe_text}</speak>"
         notes.append("parse_error_fallback")
 
@@ -1163,7 +1822,8 @@ def synthesize_speech() -> Any:
         return jsonify({"error": "voiceId is required"}), 400
     if not ssml_content:
         return jsonify({"error": "ssml content is required"}), 400
-    if output_format not in _AUDIO_MIME:
+    content_type = _AUDIO_MIME.get(output_format)
+    if content_type is None:
         return jsonify({"error": f"Unsupported output format '{output_format}'"}), 400
 
     # Translate content if enabled
@@ -1172,7 +1832,7 @@ def synthesize_speech() -> Any:
         translated_text = _translate_text(original_plaintext, source_language, target_language)
         app.logger.info(f"Translated text from {source_language} to {target_language}")
         # Wrap translated text in SSML
-        ssml_content = f"<speak>{html.escape(translated_text)}</speak>"
+        ssml_content = f"<speak>{translated_text.translate(HTML_ESCAPE_TRANS)}</speak>"
     
     normalized_ssml, ssml_normalized, normalization_notes = _normalize_ssml(ssml_content)
 
@@ -1215,93 +1875,69 @@ def synthesize_speech() -> Any:
         nonlocal safe_minimal_engine, safe_minimal_mode, error_message, text_fallback_used, text_fallback_text
 
         safe_candidate_text = original_plaintext or _strip_ssml_tags(normalized_ssml) or "Narration coming up."
-        safe_candidate = f"<speak><s>{html.escape(safe_candidate_text[:320])}</s></speak>"
-
-        attempted = False
-        for engine_option in engine_sequence:
-            safe_request = dict(request_args)
-            safe_request["Engine"] = engine_option
-            safe_request["Text"] = safe_candidate
-            safe_request["TextType"] = "ssml"
-            try:
-                response = polly.synthesize_speech(**safe_request)
-                engine_used = engine_option
-                normalized_ssml = safe_candidate
-                safe_minimal_used = True
-                safe_minimal_ssml = safe_candidate
-                safe_minimal_engine = engine_option
-                safe_minimal_mode = "ssml"
-                error_message = None
-                return True
-            except (BotoCoreError, ClientError):
-                attempted = True
-                continue
-
-        if attempted and not safe_minimal_used:
-            error_message = error_message or "Safe minimal SSML attempt failed."
+        safe_candidate = f"<speak><s>{safe_candidate_text[:320].translate(HTML_ESCAPE_TRANS)}</s></speak>"
 
-        # Final attempt: plain text synthesis
-        for engine_option in engine_sequence:
-            text_request = dict(request_args)
-            text_request["Engine"] = engine_option
-            text_request["Text"] = safe_candidate_text
-            text_request["TextType"] = "text"
+        # Minimal SSML on each engine, then plain text as the final attempt.
+        for mode, engine_option in [(mode, engine) for mode in ("ssml", "text") for engine in engine_sequence]:
             try:
-                response = polly.synthesize_speech(**text_request)
-                engine_used = engine_option
-                safe_minimal_used = True
-                safe_minimal_ssml = safe_candidate
-                safe_minimal_engine = engine_option
-                safe_minimal_mode = "text"
+                response = _call_polly(
+                    request_args,
+                    Engine=engine_option,
+                    Text=safe_candidate if mode == "ssml" else safe_candidate_text,
+                    TextType=mode,
+                )
+            except (BotoCoreError, ClientError) as error:
+                if _is_transient_polly_error(error):
+                    # botocore already backed off and retried this; more variants won't help.
+                    break
+                continue
+            engine_used = engine_option
+            normalized_ssml = safe_candidate
+            safe_minimal_used = True
+            safe_minimal_ssml = safe_candidate
+            safe_minimal_engine = engine_option
+            safe_minimal_mode = mode
+            if mode == "text":
                 text_fallback_used = True
                 text_fallback_text = safe_candidate_text
-                normalized_ssml = safe_candidate
-                error_message = None
-                return True
-            except (BotoCoreError, ClientError):
-                continue
+            error_message = None
+            return True
 
+        if engine_sequence:
+            error_message = error_message or "Safe minimal SSML attempt failed."
         return False
 
     try:
         response = polly.synthesize_speech(**request_args)
     except (BotoCoreError, ClientError) as aws_error:
-        error_message = str(aws_error)
+        error_message = _aws_error_message(aws_error)
         error_code = None
         if isinstance(aws_error, ClientError):
             error_code = aws_error.response.get("Error", {}).get("Code")
-            error_message = aws_error.response.get("Error", {}).get("Message", error_message)
+        # Both InvalidSsmlException branches start from the same sanitized candidate.
+        sanitized_candidate = (
+            _sanitize_ssml_for_neural(normalized_ssml) if error_code == "InvalidSsmlException" else normalized_ssml
+        )
 
         if error_code == "InvalidSsmlException" and "unsupported neural feature" in error_message.lower():
-            sanitized_candidate = _sanitize_ssml_for_neural(normalized_ssml)
             if sanitized_candidate != normalized_ssml:
                 try:
-                    request_args["Text"] = sanitized_candidate
-                    response = polly.synthesize_speech(**request_args)
+                    response = _call_polly(request_args, Text=sanitized_candidate)
                     sanitized_used = True
                     sanitized_ssml = sanitized_candidate
                 except (BotoCoreError, ClientError) as retry_error:
-                    # restore original text before exploring other fallbacks
-                    request_args["Text"] = normalized_ssml
-                    if isinstance(retry_error, ClientError):
-                        error_message = retry_error.response.get("Error", {}).get("Message", str(retry_error))
-                    else:
-                        error_message = str(retry_error)
+                    error_message = _aws_error_message(retry_error)
                 else:
                     error_message = None
 
             if not sanitized_used:
                 supported_engines = _voice_supported_engines(voice_id)
                 if "standard" in supported_engines:
-                    fallback_args = dict(request_args)
-                    fallback_args["Engine"] = "standard"
                     engine_used = "standard"
                     try:
-                        response = polly.synthesize_speech(**fallback_args)
+                        response = _call_polly(request_args, Engine="standard")
                     except (BotoCoreError, ClientError) as fallback_error:
-                        fallback_msg = fallback_error
-                        if isinstance(fallback_error, ClientError):
-                            fallback_msg = fallback_error.response.get("Error", {}).get("Message", str(fallback_error))
+                        fallback_msg = _aws_error_message(fallback_error)
                         engine_sequence = ["neural", "standard"]
                         if _try_safe_minimal(engine_sequence):
                             error_message = None
@@ -1325,65 +1961,55 @@ def synthesize_speech() -> Any:
                     else:
                         return jsonify({"error": detail}), 502
         elif error_code == "InvalidSsmlException":
-            sanitized_candidate = _sanitize_ssml_for_neural(normalized_ssml)
             if sanitized_candidate != normalized_ssml:
                 try:
-                    request_args["Text"] = sanitized_candidate
-                    response = polly.synthesize_speech(**request_args)
+                    response = _call_polly(request_args, Text=sanitized_candidate)
                     sanitized_used = True
                     sanitized_ssml = sanitized_candidate
                     normalized_ssml = sanitized_candidate
                     error_message = None
                 except (BotoCoreError, ClientError) as retry_error:
-                    request_args["Text"] = normalized_ssml
-                    if isinstance(retry_error, ClientError):
-                        error_message = retry_error.response.get("Error", {}).get("Message", str(retry_error))
-                    else:
-                        error_message = str(retry_error)
+                    error_message = _aws_error_message(retry_error)
 
             if error_message:
                 plain_text = _strip_ssml_tags(normalized_ssml) or "Narration coming up."
-                plain_candidate = f"<speak>{html.escape(plain_text)}</speak>"
-                normalization_notes.append("plain_ssml_retry")
-                try:
-                    request_args["Text"] = plain_candidate
-                    response = polly.synthesize_speech(**request_args)
-                    plain_retry_used = True
-                    plain_retry_ssml = plain_candidate
-                    normalized_ssml = plain_candidate
-                    error_message = None
-                except (BotoCoreError, ClientError) as plain_error:
-                    request_args["Text"] = normalized_ssml
-
-                    plain_text_payload = _strip_ssml_tags(normalized_ssml) or "Narration coming up."
-                    text_args = dict(request_args)
-                    text_args["Text"] = plain_text_payload
-                    text_args["TextType"] = "text"
+                plain_candidate = f"<speak>{plain_text.translate(HTML_ESCAPE_TRANS)}</speak>"
+                plain_error: BaseException | None = None
+                # Polly just rejected normalized_ssml; when stripping its tags leaves the same
+                # document, resending that as the "plain" retry is bound to fail the same way.
+                if plain_candidate != normalized_ssml:
+                    normalization_notes.append("plain_ssml_retry")
+                    try:
+                        response = _call_polly(request_args, Text=plain_candidate)
+                        plain_retry_used = True
+                        plain_retry_ssml = plain_candidate
+                        normalized_ssml = plain_candidate
+                        error_message = None
+                    except (BotoCoreError, ClientError) as error:
+                        plain_error = error
+                if not plain_retry_used:
+                    # normalized_ssml is unchanged on this path, so the stripped text is too.
+                    plain_text_payload = plain_text
                     try:
-                        response = polly.synthesize_speech(**text_args)
+                        response = _call_polly(request_args, Text=plain_text_payload, TextType="text")
                         text_fallback_used = True
                         text_fallback_text = plain_text_payload
-                        engine_used = text_args.get("Engine", engine_used)
-                        normalized_ssml = f"<speak>{html.escape(plain_text_payload)}</speak>"
+                        engine_used = request_args.get("Engine", engine_used)
+                        normalized_ssml = plain_candidate
                         error_message = None
                     except (BotoCoreError, ClientError):
                         supported_engines = _voice_supported_engines(voice_id)
                         engine_sequence = [request_args.get("Engine", "neural")]
                         if "standard" in supported_engines:
-                            fallback_args = dict(request_args)
-                            fallback_args["Engine"] = "standard"
-                            fallback_args["Text"] = plain_candidate
                             engine_used = "standard"
                             try:
-                                response = polly.synthesize_speech(**fallback_args)
+                                response = _call_polly(request_args, Engine="standard", Text=plain_candidate)
                                 plain_retry_used = True
                                 plain_retry_ssml = plain_candidate
                                 normalized_ssml = plain_candidate
                                 error_message = None
                             except (BotoCoreError, ClientError) as fallback_error:
-                                fallback_msg = fallback_error
-                                if isinstance(fallback_error, ClientError):
-                                    fallback_msg = fallback_error.response.get("Error", {}).get("Message", str(fallback_error))
+                                fallback_msg = _aws_error_message(fallback_error)
                                 engine_sequence.append("standard")
                                 if not _try_safe_minimal(engine_sequence):
                                     return jsonify({
@@ -1413,14 +2039,13 @@ def synthesize_speech() -> Any:
     audio_stream = response.get("AudioStream")
     if not audio_stream:
         return jsonify({"error": "No AudioStream in Polly response"}), 502
-    audio_bytes = audio_stream.read()
-
-    encoded_audio = base64.b64encode(audio_bytes).decode("utf-8")
+    # Encode as the audio arrives rather than reading the whole clip first.
+    encoded_audio, _audio_size = _b64encode_chunks(audio_stream.iter_chunks(chunk_size=_AUDIO_READ_CHUNK_BYTES))
     file_extension = "mp3" if output_format == "mp3" else ("ogg" if output_format == "ogg_vorbis" else "wav")
 
     return jsonify({
         "audio": encoded_audio,
-        "contentType": _AUDIO_MIME[output_format],
+        "contentType": content_type,
         "fileExtension": file_extension,
         "meta": {
             "engineUsed": engine_used,
@@ -1454,8 +2079,6 @@ def replace_video_audio() -> Any:
     - persona: Voice persona/tone (optional)
     - output_format: mp4/mov (optional, default: mp4)
     """
-    import subprocess
-    import tempfile
     import uuid
     from pathlib import Path
     
@@ -1476,7 +2099,7 @@ def replace_video_audio() -> Any:
     
     # Create temp directories
     job_id = uuid.uuid4().hex[:8]
-    temp_dir = Path(tempfile.mkdtemp(prefix=f"voiceover_{job_id}_"))
+    temp_dir = _make_job_temp_dir(f"voiceover_{job_id}_")
     
     try:
         # Save uploaded video
@@ -1485,6 +2108,10 @@ def replace_video_audio() -> Any:
         video_file.save(str(input_video_path))
         
         app.logger.info(f"Job {job_id}: Video saved to {input_video_path}")
+
+        # The duration probe only needs the input video, so run it alongside
+        # extraction/transcription/Bedrock instead of after synthesis.
+        duration_future = _WORKER_POOL.submit(_probe_duration_seconds, input_video_path)
         
         # Step 1: Extract audio from video using FFmpeg
         audio_path = temp_dir / "extracted_audio.wav"
@@ -1498,7 +2125,7 @@ def replace_video_audio() -> Any:
         ]
         
         app.logger.info(f"Job {job_id}: Extracting audio with FFmpeg...")
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
+        result = _run_ffmpeg(ffmpeg_cmd)
         
         if result.returncode != 0 or not audio_path.exists():
             app.logger.error(f"Job {job_id}: FFmpeg audio extraction failed: {result.stderr}")
@@ -1607,11 +2234,12 @@ def replace_video_audio() -> Any:
                 body=request_body,
             )
             
-            response_json = json.loads(bedrock_response["body"].read().decode("utf-8"))
+            # json.loads accepts UTF-8 bytes directly; skip the intermediate str copy.
+            response_json = json.loads(bedrock_response["body"].read())
             generated_text = _extract_generation_text(response_json)
             
             # Extract SSML
-            ssml_match = re.search(r"<speak>.*?</speak>", generated_text, re.DOTALL | re.IGNORECASE)
+            ssml_match = SSML_RE.search(generated_text)
             if ssml_match:
                 ssml_text = ssml_match.group(0)
             else:
@@ -1643,7 +2271,7 @@ def replace_video_audio() -> Any:
                 raise Exception("No audio stream in Polly response")
             
             with open(synth_audio_path, "wb") as f:
-                f.write(audio_stream.read())
+                shutil.copyfileobj(audio_stream, f, _STREAM_COPY_CHUNK_BYTES)
             
             app.logger.info(f"Job {job_id}: Synthetic audio generated")
             
@@ -1654,17 +2282,10 @@ def replace_video_audio() -> Any:
                 "details": str(polly_error)
             }), 500
         
-        # Step 5: Get video duration to match audio
-        probe_cmd = [
-            FFPROBE_PATH, "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(input_video_path)
-        ]
-        probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
+        # Step 5: Get video duration to match audio (probe started in Step 1)
         try:
-            video_duration = float(probe_result.stdout.strip())
-        except:
+            video_duration = duration_future.result() or 0.0
+        except Exception:
             video_duration = 0.0
         
         # Step 6: Replace audio in video using FFmpeg
@@ -1678,11 +2299,12 @@ def replace_video_audio() -> Any:
             "-map", "0:v:0",  # Map video from input 0
             "-map", "1:a:0",  # Map audio from input 1 (synthetic)
             "-shortest",  # End at shortest stream
+            *_FRAGMENTED_MP4_FLAGS,  # Single-pass write, no moov rewrite at the end
             str(output_video_path)
         ]
         
         app.logger.info(f"Job {job_id}: Replacing audio in video...")
-        replace_result = subprocess.run(replace_cmd, capture_output=True, text=True)
+        replace_result = _run_ffmpeg(replace_cmd)
         
         if replace_result.returncode != 0 or not output_video_path.exists():
             app.logger.error(f"Job {job_id}: FFmpeg audio replacement failed: {replace_result.stderr}")
@@ -1694,11 +2316,8 @@ def replace_video_audio() -> Any:
         app.logger.info(f"Job {job_id}: Video with synthetic audio generated successfully")
         
         # Step 7: Read output video and return as base64
-        with open(output_video_path, "rb") as f:
-            video_bytes = f.read()
-        
-        encoded_video = base64.b64encode(video_bytes).decode("utf-8")
-        video_size_mb = len(video_bytes) / (1024 * 1024)
+        encoded_video, video_size = _read_file_base64(output_video_path)
+        video_size_mb = video_size / (1024 * 1024)
         
         return jsonify({
             "success": True,
@@ -1706,7 +2325,7 @@ def replace_video_audio() -> Any:
             "video": encoded_video,
             "contentType": "video/mp4" if output_format == "mp4" else "video/quicktime",
             "fileExtension": output_format,
-            "sizeBytes": len(video_bytes),
+            "sizeBytes": video_size,
             "sizeMB": round(video_size_mb, 2),
             "originalTranscript": transcript_text,
             "ssml": ssml_text,
@@ -1724,12 +2343,8 @@ def replace_video_audio() -> Any:
     
     finally:
         # Cleanup temp files
-        try:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            app.logger.info(f"Job {job_id}: Temp files cleaned up")
-        except:
-            pass
+        _schedule_cleanup(temp_dir)
+        app.logger.info(f"Job {job_id}: Temp file cleanup scheduled")
 
 
 @app.route("/analyze-video-speakers", methods=["POST"])
@@ -1738,11 +2353,8 @@ def analyze_video_speakers() -> Any:
     Analyze video to identify speakers and their characteristics.
     Returns speaker information for voice replacement.
     """
-    import tempfile
-    import shutil
     import subprocess
     import uuid
-    from pathlib import Path
     
     app.logger.info("Received request to analyze video speakers")
     
@@ -1757,7 +2369,7 @@ def analyze_video_speakers() -> Any:
     
     job_id = str(uuid.uuid4())
     app.logger.info(f"Job {job_id}: Starting speaker analysis for file: {video_file.filename}")
-    temp_dir = Path(tempfile.mkdtemp(prefix=f"speaker_analysis_{job_id}_"))
+    temp_dir = _make_job_temp_dir(f"speaker_analysis_{job_id}_")
     
     try:
         # Save uploaded video
@@ -1765,28 +2377,8 @@ def analyze_video_speakers() -> Any:
         video_file.save(str(video_path))
         app.logger.info(f"Job {job_id}: Video saved to {video_path}")
         
-        # Extract audio from video using FFmpeg
-        # Use MP3 for smaller file size (AWS Transcribe supports MP3)
-        audio_path = temp_dir / "extracted_audio.mp3"
-        ffmpeg_cmd = [
-            FFMPEG_PATH, "-i", str(video_path),
-            "-vn", "-acodec", "libmp3lame", "-ar", "16000", "-ac", "1", "-b:a", "64k",
-            str(audio_path), "-y"
-        ]
-        
-        result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            app.logger.error(f"Job {job_id}: FFmpeg extraction failed: {result.stderr}")
-            return jsonify({"error": "Failed to extract audio from video"}), 500
-        
-        app.logger.info(f"Job {job_id}: Audio extracted successfully")
-        
-        # Check audio file size
-        audio_size = audio_path.stat().st_size
-        audio_size_mb = audio_size / (1024 * 1024)
-        app.logger.info(f"Job {job_id}: Audio file size: {audio_size_mb:.2f} MB")
-        
-        # Upload audio to S3 for Transcribe (Transcribe requires S3 input)
+        # Resolve the Transcribe bucket first so extracted audio can be streamed
+        # straight from FFmpeg into S3 (Transcribe requires S3 input).
         bucket_name = os.environ.get("TRANSCRIBE_BUCKET") or os.environ.get("MEDIA_S3_BUCKET")
         if not bucket_name:
             return jsonify({"error": "Set TRANSCRIBE_BUCKET or MEDIA_S3_BUCKET to upload audio for transcription"}), 500
@@ -1804,38 +2396,72 @@ def analyze_video_speakers() -> Any:
             retries={'max_attempts': 3, 'mode': 'standard'},
             connect_timeout=60,
             read_timeout=300,
-            signature_version='s3v4'
+            signature_version='s3v4',
+            max_pool_connections=_S3_MAX_CONCURRENCY + 2,
         )
         s3 = boto3.client("s3", region_name=s3_region, config=s3_config)
-        s3_key = f"speaker-analysis/{job_id}/audio.mp3"
-        
+
+        # Extract audio from video using FFmpeg. If the source codec is one Transcribe
+        # accepts natively, remux it without re-encoding; otherwise fall back to a
+        # small 16kHz mono MP3 (AWS Transcribe supports MP3).
+        source_codec = _probe_audio_codec(video_path)
+        passthrough = _TRANSCRIBE_PASSTHROUGH_CODECS.get(source_codec or "")
+        if passthrough:
+            audio_ext, media_format = passthrough
+            codec_args = ["-c:a", "copy"]
+            app.logger.info(f"Job {job_id}: Remuxing {source_codec} audio without re-encoding")
+        else:
+            audio_ext, media_format = "mp3", "mp3"
+            codec_args = ["-acodec", "libmp3lame", "-ar", "16000", "-ac", "1", "-b:a", "64k"]
+        s3_key = f"speaker-analysis/{job_id}/audio.{audio_ext}"
+
         try:
-            # Use multipart upload for files larger than 10 MB
-            if audio_size_mb > 10:
-                app.logger.info(f"Job {job_id}: Using multipart upload for large file")
-                from boto3.s3.transfer import TransferConfig
-                
-                # Configure multipart upload
-                transfer_config = TransferConfig(
-                    multipart_threshold=10 * 1024 * 1024,  # 10 MB
-                    max_concurrency=5,
-                    multipart_chunksize=10 * 1024 * 1024,  # 10 MB chunks
-                    use_threads=True
-                )
-                
-                s3.upload_file(
-                    str(audio_path), 
-                    bucket_name, 
-                    s3_key,
-                    Config=transfer_config
-                )
+            if audio_ext == "m4a":
+                # The MP4 muxer needs a seekable output, so this path goes via a local file.
+                audio_path = temp_dir / f"extracted_audio.{audio_ext}"
+                ffmpeg_cmd = [
+                    FFMPEG_PATH, "-v", "error", "-i", str(video_path),
+                    "-vn", *codec_args,
+                    str(audio_path), "-y"
+                ]
+                result = _run_ffmpeg(ffmpeg_cmd)
+                if result.returncode != 0:
+                    app.logger.error(f"Job {job_id}: FFmpeg extraction failed: {result.stderr}")
+                    return jsonify({"error": "Failed to extract audio from video"}), 500
+                s3.upload_file(str(audio_path), bucket_name, s3_key, Config=_S3_TRANSFER_CONFIG)
             else:
-                # Standard upload for smaller files
-                app.logger.info(f"Job {job_id}: Using standard upload")
-                s3.upload_file(str(audio_path), bucket_name, s3_key)
-            
+                # Stream FFmpeg stdout into a multipart upload: no temp file write + re-read.
+                ffmpeg_cmd = [
+                    FFMPEG_PATH, "-v", "error", "-i", str(video_path),
+                    "-vn", *codec_args,
+                    "-f", audio_ext, "pipe:1"
+                ]
+                # stderr goes to a temp file (as in _run_ffmpeg): a pipe that nobody
+                # reads until stdout is drained could fill up and stall ffmpeg.
+                with tempfile.TemporaryFile() as stderr_file:
+                    ffmpeg_proc = subprocess.Popen(
+                        ffmpeg_cmd,
+                        stdout=subprocess.PIPE,
+                        stderr=stderr_file,
+                        bufsize=1 << 20,
+                    )
+                    try:
+                        s3.upload_fileobj(ffmpeg_proc.stdout, bucket_name, s3_key, Config=_S3_TRANSFER_CONFIG)
+                    finally:
+                        ffmpeg_proc.stdout.close()
+                        ffmpeg_proc.wait()
+                        stderr_file.seek(max(0, stderr_file.seek(0, os.SEEK_END) - _FFMPEG_STDERR_TAIL_BYTES))
+                        ffmpeg_stderr = stderr_file.read().decode("utf-8", errors="replace")
+                if ffmpeg_proc.returncode != 0:
+                    app.logger.error(f"Job {job_id}: FFmpeg extraction failed: {ffmpeg_stderr}")
+                    try:
+                        s3.delete_object(Bucket=bucket_name, Key=s3_key)
+                    except Exception:
+                        pass
+                    return jsonify({"error": "Failed to extract audio from video"}), 500
+
             s3_uri = f"s3://{bucket_name}/{s3_key}"
-            app.logger.info(f"Job {job_id}: Audio uploaded to {s3_uri}")
+            app.logger.info(f"Job {job_id}: Audio extracted and uploaded to {s3_uri}")
             
         except Exception as e:
             app.logger.error(f"Job {job_id}: S3 upload failed: {str(e)}")
@@ -1843,7 +2469,7 @@ def analyze_video_speakers() -> Any:
             error_msg = str(e)
             if "Connection" in error_msg or "timeout" in error_msg.lower():
                 return jsonify({
-                    "error": f"Network error while uploading to S3. The audio file ({audio_size_mb:.2f} MB) may be too large or the connection timed out. Please try with a shorter video or check your network connection."
+                    "error": "Network error while uploading to S3. The audio file may be too large or the connection timed out. Please try with a shorter video or check your network connection."
                 }), 500
             else:
                 return jsonify({"error": f"Failed to upload audio to S3: {error_msg}"}), 500
@@ -1863,7 +2489,7 @@ def analyze_video_speakers() -> Any:
             transcribe.start_transcription_job(
                 TranscriptionJobName=transcribe_job_name,
                 Media={"MediaFileUri": s3_uri},
-                MediaFormat="mp3",
+                MediaFormat=media_format,
                 LanguageCode="en-US",
                 Settings={
                     "ShowSpeakerLabels": True,
@@ -2096,10 +2722,25 @@ def analyze_video_speakers() -> Any:
     
     finally:
         # Cleanup temp files
-        try:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
+        _schedule_cleanup(temp_dir)
+
+
+# Known Polly voice IDs mapped to suggestion categories. AWS doesn't mark any voices
+# as "older", so those buckets are only filled if entries are added here. Child
+# voices are listed last so they win over the adult lists (Ivy appears in both).
+_VOICE_CATEGORY: dict[str, str] = {
+    **{v: "adult_male" for v in ("Matthew", "Joey", "Stephen", "Kevin", "Gregory", "Brian", "Arthur")},
+    **{
+        v: "adult_female"
+        for v in (
+            "Joanna", "Kendra", "Salli", "Ruth", "Kimberly", "Danielle", "Ivy", "Amy",
+            "Emma", "Olivia", "Aria", "Ayanda", "Kajal", "Niamh", "Jasmine",
+        )
+    },
+    "Justin": "child_male",
+    "Ivy": "child_female",
+}
+_GENDER_CATEGORY = {"Male": "adult_male", "Female": "adult_female"}
 
 
 def _get_suggested_voices_for_speaker(speaker_data: Dict[str, Any]) -> list:
@@ -2124,15 +2765,6 @@ def _get_suggested_voices_for_speaker(speaker_data: Dict[str, Any]) -> list:
         "kids": []
     }
     
-    # Define voice categories
-    adult_male_voices = ["Matthew", "Joey", "Stephen", "Kevin", "Gregory", "Brian", "Arthur"]
-    adult_female_voices = ["Joanna", "Kendra", "Salli", "Ruth", "Kimberly", "Danielle", "Ivy", "Amy", "Emma", "Olivia", "Aria", "Ayanda", "Kajal", "Niamh", "Jasmine"]
-    older_male_voices = []  # AWS doesn't have specific older male voices marked
-    older_female_voices = []  # AWS doesn't have specific older female voices marked
-    child_male_voices = ["Justin"]
-    child_female_voices = ["Ivy"]
-    kids_voices = ["Justin", "Ivy"]
-    
     for voice in english_voices:
         voice_gender = voice.get("gender", "")
         voice_name = voice.get("name", "")
@@ -2154,23 +2786,10 @@ def _get_suggested_voices_for_speaker(speaker_data: Dict[str, Any]) -> list:
             "gender": voice_gender
         }
         
-        # Categorize the voice
-        if voice_id in child_male_voices:
-            voice_categories["child_male"].append(formatted_voice)
-        elif voice_id in child_female_voices:
-            voice_categories["child_female"].append(formatted_voice)
-        elif voice_id in older_male_voices:
-            voice_categories["older_male"].append(formatted_voice)
-        elif voice_id in older_female_voices:
-            voice_categories["older_female"].append(formatted_voice)
-        elif voice_id in adult_male_voices:
-            voice_categories["adult_male"].append(formatted_voice)
-        elif voice_id in adult_female_voices:
-            voice_categories["adult_female"].append(formatted_voice)
-        elif voice_gender == "Male":
-            voice_categories["adult_male"].append(formatted_voice)
-        elif voice_gender == "Female":
-            voice_categories["adult_female"].append(formatted_voice)
+        # Categorize the voice (known voices first, then fall back to the reported gender)
+        category = _VOICE_CATEGORY.get(voice_id) or _GENDER_CATEGORY.get(voice_gender)
+        if category:
+            voice_categories[category].append(formatted_voice)
     
     # Build the final list with category headers
     result = []
@@ -2222,11 +2841,8 @@ def replace_multi_speaker_audio() -> Any:
     Replace audio in video with synthetic voices for multiple speakers.
     Expects JSON with speaker voice mappings.
     """
-    import tempfile
-    import shutil
     import subprocess
     import uuid
-    from pathlib import Path
     
     if "video" not in request.files:
         return jsonify({"error": "No video file provided"}), 400
@@ -2281,13 +2897,14 @@ def replace_multi_speaker_audio() -> Any:
             args: dict[str, Any] = {
                 "Text": text,
                 "TextType": text_type,
-                "OutputFormat": "mp3",
+                "OutputFormat": "pcm",
+                "SampleRate": str(_SEGMENT_SAMPLE_RATE),
                 "VoiceId": voice_id,
                 "Engine": engine_choice,
             }
             if language_code:
                 args["LanguageCode"] = language_code
-            return polly.synthesize_speech(**args)
+            return _polly_synthesize_throttled(**args)
 
         # 1) Try normalized SSML on chosen engine
         try:
@@ -2318,7 +2935,7 @@ def replace_multi_speaker_audio() -> Any:
 
         # 4) Final fallback: plain text minimal SSML
         plain_text = _strip_ssml_tags(normalized_ssml) or "Narration coming up."
-        minimal_ssml = f"<speak>{html.escape(plain_text[:320])}</speak>"
+        minimal_ssml = f"<speak>{plain_text[:320].translate(HTML_ESCAPE_TRANS)}</speak>"
         try:
             return _do_call(minimal_ssml, "ssml", engine)
         except Exception:
@@ -2328,7 +2945,7 @@ def replace_multi_speaker_audio() -> Any:
             return _do_call(plain_text[:320], "text", engine)
     
     job_id = str(uuid.uuid4())
-    temp_dir = Path(tempfile.mkdtemp(prefix=f"multi_speaker_{job_id}_"))
+    temp_dir = _make_job_temp_dir(f"multi_speaker_{job_id}_")
     
     app.logger.info(f"Job {job_id}: Translation enabled: {translate_enabled}, {source_language} -> {target_language}")
     
@@ -2337,6 +2954,8 @@ def replace_multi_speaker_audio() -> Any:
         video_path = temp_dir / "input_video.mp4"
         video_file.save(str(video_path))
         app.logger.info(f"Job {job_id}: Video saved")
+
+        duration_future = _WORKER_POOL.submit(_probe_duration_seconds, video_path)
         
         # Extract audio
         original_audio_path = temp_dir / "original_audio.wav"
@@ -2345,16 +2964,30 @@ def replace_multi_speaker_audio() -> Any:
             "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
             str(original_audio_path), "-y"
         ]
-        subprocess.run(ffmpeg_cmd, capture_output=True, check=True)
+        subprocess.run(ffmpeg_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         app.logger.info(f"Job {job_id}: Audio extracted")
         
         # Get speaker segments from the analysis data passed in speaker_mappings
         # Each mapping should have: speaker_id, voice_id, segments
         
-        # Generate synthetic audio for each speaker's segments
-        synthetic_segments = []
-        
-        for mapping in speaker_mappings:
+        # Normalize every segment up-front and, when translating, fire all Translate
+        # calls into the worker pool so they overlap with Polly synthesis below.
+        segment_texts: dict[tuple[int, int], str] = {}
+        translation_futures: dict[tuple[int, int], Future] = {}
+        for mapping_idx, mapping in enumerate(speaker_mappings):
+            for idx, segment in enumerate(mapping.get("segments", [])):
+                text = _normalize_transcript_for_voiceover(segment.get("text", "").strip())
+                if not text:
+                    continue
+                segment_texts[(mapping_idx, idx)] = text
+                if translate_enabled:
+                    translation_futures[(mapping_idx, idx)] = _WORKER_POOL.submit(
+                        _translate_text, text, source_language, target_language
+                    )
+
+        # Flatten the mappings into independent segment jobs so synthesis can run concurrently.
+        segment_jobs: list[dict[str, Any]] = []
+        for mapping_idx, mapping in enumerate(speaker_mappings):
             speaker_id = mapping.get("speaker_id")
             raw_voice_id = mapping.get("voice_id", "Joanna")
             voice_id = _sanitize_voice_id(raw_voice_id)
@@ -2371,299 +3004,443 @@ def replace_multi_speaker_audio() -> Any:
             app.logger.info(f"Job {job_id}: Processing {len(segments)} segments for {speaker_id} with voice {voice_id}")
             
             for idx, segment in enumerate(segments):
-                text = _normalize_transcript_for_voiceover(segment.get("text", "").strip())
-                start_time = float(segment.get("start", 0))
-                end_time = float(segment.get("end", 0))
-                
-                if not text:
+                if (mapping_idx, idx) not in segment_texts:
                     continue
+                segment_jobs.append({
+                    "key": (mapping_idx, idx),
+                    "idx": idx,
+                    "speaker_id": speaker_id,
+                    "voice_id": voice_id,
+                    "segment": segment,
+                })
+
+        language_code = target_polly_language if translate_enabled and target_polly_language else None
+
+        def _prepare_segment_job(job: dict[str, Any]) -> dict[str, Any] | None:
+            speaker_id = job["speaker_id"]
+            voice_id = job["voice_id"]
+            idx = job["idx"]
+            segment = job["segment"]
+            text = segment_texts[job["key"]]
+
+            # Translate text if enabled
+            if translate_enabled:
+                original_text = text
+                text = translation_futures[job["key"]].result()
+                app.logger.info(f"Job {job_id}: Translated '{original_text[:50]}...' -> '{text[:50]}...'")
+            
+            try:
+                best_engine = _get_best_engine_for_voice(voice_id)
                 
-                # Translate text if enabled
-                if translate_enabled:
-                    original_text = text
-                    text = _translate_text(text, source_language, target_language)
-                    app.logger.info(f"Job {job_id}: Translated '{original_text[:50]}...' -> '{text[:50]}...'")
+                # Create natural-sounding SSML for human-like speech
+                ssml_body = _create_natural_ssml_body(text, best_engine)
+                natural_ssml = f"<speak>{ssml_body}</speak>"
+                use_conversational_style = voice_id in _CONVERSATIONAL_STYLE_VOICES
                 
-                # Synthesize this segment using the best available engine with natural SSML
-                try:
-                    best_engine = _get_best_engine_for_voice(voice_id)
-                    
-                    # Create natural-sounding SSML for human-like speech
-                    natural_ssml = _create_natural_ssml(text, best_engine)
-                    
-                    # Build synthesis parameters
-                    synth_params = {
-                        "Text": natural_ssml,
-                        "TextType": "ssml",
-                        "OutputFormat": "mp3",
-                        "VoiceId": voice_id,
-                        "Engine": best_engine,
-                        "LanguageCode": target_polly_language
-                    }
-                    
-                    # Try with conversational style first for supported voices
-                    synthesis_attempted = False
-                    response = None
-                    
-                    # Voices that support conversational style
-                    if voice_id in ["Matthew", "Joanna", "Ruth", "Stephen", "Kevin", "Salli", "Joey"]:
-                        try:
-                            # Wrap in conversational style for more natural delivery
-                            natural_ssml_with_style = natural_ssml.replace(
-                                '<speak>',
-                                '<speak><amazon:domain name="conversational">'
-                            ).replace('</speak>', '</amazon:domain></speak>')
-                            response = _polly_synthesize_segment(
-                                voice_id=voice_id,
-                                engine=best_engine,
-                                ssml=natural_ssml_with_style,
-                                language_code=(target_polly_language if translate_enabled and target_polly_language else None),
-                            )
-                            synthesis_attempted = True
-                        except Exception as style_error:
-                            app.logger.warning(f"Job {job_id}: Conversational style failed for {voice_id}, trying without style: {str(style_error)}")
-                            synthesis_attempted = False
-                    
-                    # Fallback to regular SSML if style failed or not supported
-                    if not synthesis_attempted:
+                # Everything that determines the synthesized audio; doubles as the cache key.
+                synth_params = {
+                    "Text": natural_ssml,
+                    "TextType": "ssml",
+                    "OutputFormat": "pcm",
+                    "SampleRate": str(_SEGMENT_SAMPLE_RATE),
+                    "VoiceId": voice_id,
+                    "Engine": best_engine,
+                    "LanguageCode": language_code,
+                    "ConversationalStyle": use_conversational_style,
+                }
+                cache_key = _audio_cache_key(synth_params)
+                segment_wav_path = temp_dir / f"segment_{speaker_id}_{idx}.wav"
+                cached = _audio_cache_fetch(cache_key, segment_wav_path)
+                if cached:
+                    app.logger.info(f"Job {job_id}: Reused cached audio for segment {idx} of {speaker_id}")
+            except Exception as e:
+                app.logger.error(f"Job {job_id}: Failed to prepare segment {idx} for {speaker_id}: {str(e)}")
+                return None
+
+            return {
+                "idx": idx,
+                "speaker_id": speaker_id,
+                "voice_id": voice_id,
+                "engine": best_engine,
+                "ssml": natural_ssml,
+                "ssml_body": ssml_body,
+                "conversational": use_conversational_style,
+                "cache_key": cache_key,
+                "wav_file": segment_wav_path,
+                "cached": cached,
+                "start_time": float(segment.get("start", 0)),
+                "end_time": float(segment.get("end", 0)),
+            }
+
+        def _synthesize_single_segment(item: dict[str, Any]) -> bool:
+            speaker_id = item["speaker_id"]
+            voice_id = item["voice_id"]
+            idx = item["idx"]
+            natural_ssml = item["ssml"]
+            try:
+                # Try with conversational style first for supported voices
+                synthesis_attempted = False
+                response = None
+                
+                if item["conversational"]:
+                    try:
+                        # Wrap in conversational style for more natural delivery
+                        natural_ssml_with_style = (
+                            f'<speak><amazon:domain name="conversational">{item["ssml_body"]}</amazon:domain></speak>'
+                        )
                         response = _polly_synthesize_segment(
                             voice_id=voice_id,
-                            engine=best_engine,
-                            ssml=natural_ssml,
-                            language_code=(target_polly_language if translate_enabled and target_polly_language else None),
+                            engine=item["engine"],
+                            ssml=natural_ssml_with_style,
+                            language_code=language_code,
                         )
-                    
-                    # Save segment audio as MP3 first
-                    segment_mp3_path = temp_dir / f"segment_{speaker_id}_{idx}.mp3"
-                    with open(segment_mp3_path, "wb") as f:
-                        f.write(response["AudioStream"].read())
-                    
-                    # Convert MP3 to WAV with consistent format (16kHz, mono)
-                    segment_wav_path = temp_dir / f"segment_{speaker_id}_{idx}.wav"
-                    convert_cmd = [
-                        FFMPEG_PATH, "-i", str(segment_mp3_path),
-                        "-ar", "22050", "-ac", "1", "-acodec", "pcm_s16le",
-                        str(segment_wav_path), "-y"
-                    ]
-                    subprocess.run(convert_cmd, capture_output=True, check=True)
-
-                    # Force the segment audio to fit exactly within the original time window.
-                    # This prevents "drift" and keeps speech aligned to the on-screen speaker.
-                    target_duration = max(0.12, end_time - start_time)
-
-                    def _probe_duration_seconds(path: Path) -> float | None:
-                        probe_cmd = [
-                            FFPROBE_PATH, "-v", "error",
-                            "-show_entries", "format=duration",
-                            "-of", "default=noprint_wrappers=1:nokey=1",
-                            str(path),
-                        ]
-                        probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-                        try:
-                            value = float((probe_result.stdout or "").strip())
-                        except (TypeError, ValueError):
-                            return None
-                        return value if value > 0 else None
-
-                    def _atempo_chain(factor: float) -> str | None:
-                        # ffmpeg atempo supports 0.5..2.0 per filter; chain to reach wider ranges.
-                        if not factor or factor <= 0:
-                            return None
-                        if abs(factor - 1.0) < 0.02:
-                            return None
-                        parts: list[str] = []
-                        remaining = float(factor)
-                        while remaining < 0.5:
-                            parts.append("atempo=0.5")
-                            remaining /= 0.5
-                        while remaining > 2.0:
-                            parts.append("atempo=2.0")
-                            remaining /= 2.0
-                        parts.append(f"atempo={remaining:.4f}")
-                        return ",".join(parts)
-
-                    actual_duration = _probe_duration_seconds(segment_wav_path)
-                    if actual_duration and target_duration:
-                        # Only speed up when the synthesized segment is too long for the window.
-                        # Do NOT slow down short segments (that sounds unnatural and causes "slow voiceover").
-                        speed_factor = actual_duration / target_duration
-                        atempo = None
-                        if speed_factor > 1.05:
-                            speed_factor = min(speed_factor, 1.45)
-                            atempo = _atempo_chain(speed_factor)
-                        # Pad (if short) and trim (if long) to exact window.
-                        segment_fitted_path = temp_dir / f"segment_{speaker_id}_{idx}_fit.wav"
-                        filters: list[str] = []
-                        if atempo:
-                            filters.append(atempo)
-                        filters.append(f"apad=pad_dur={target_duration + 0.75:.3f}")
-                        filter_str = ",".join(filters)
-                        fit_cmd = [
-                            FFMPEG_PATH, "-i", str(segment_wav_path),
-                            "-filter:a", filter_str,
-                            "-t", f"{target_duration:.3f}",
-                            "-ar", "22050", "-ac", "1", "-acodec", "pcm_s16le",
-                            str(segment_fitted_path), "-y",
-                        ]
-                        fit_result = subprocess.run(fit_cmd, capture_output=True, text=True)
-                        if fit_result.returncode == 0 and segment_fitted_path.exists():
-                            segment_wav_path = segment_fitted_path
-                        else:
-                            app.logger.warning(
-                                "Job %s: Failed to time-fit segment %s (%s). Using original segment audio.",
-                                job_id,
-                                idx,
-                                fit_result.stderr[-600:] if fit_result.stderr else "unknown error",
-                            )
-                    
-                    synthetic_segments.append({
-                        "audio_file": segment_wav_path,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "speaker_id": speaker_id,
-                    })
-                    
-                except Exception as e:
-                    app.logger.error(f"Job {job_id}: Failed to synthesize segment {idx} for {speaker_id}: {str(e)}")
-                    # Log more details about the error
-                    import traceback
-                    app.logger.error(f"Job {job_id}: Traceback: {traceback.format_exc()}")
+                        synthesis_attempted = True
+                    except Exception as style_error:
+                        app.logger.warning(f"Job {job_id}: Conversational style failed for {voice_id}, trying without style: {str(style_error)}")
+                        synthesis_attempted = False
+                
+                # Fallback to regular SSML if style failed or not supported
+                if not synthesis_attempted:
+                    response = _polly_synthesize_segment(
+                        voice_id=voice_id,
+                        engine=item["engine"],
+                        ssml=natural_ssml,
+                        language_code=language_code,
+                    )
+                
+                # Polly returns raw 16-bit mono PCM; prepend a RIFF header and it is a WAV.
+                # The PCM is streamed straight to disk and the header sizes patched afterwards.
+                with open(item["wav_file"], "wb") as f:
+                    f.write(_wav_header(0, _SEGMENT_SAMPLE_RATE))
+                    shutil.copyfileobj(response["AudioStream"], f, _STREAM_COPY_CHUNK_BYTES)
+                    pcm_size = f.tell() - _WAV_HEADER_BYTES
+                    f.seek(0)
+                    f.write(_wav_header(pcm_size, _SEGMENT_SAMPLE_RATE))
+                # The key records the conversational style; plain fallback audio must not answer for it.
+                if synthesis_attempted or not item["conversational"]:
+                    _audio_cache_store(item["cache_key"], item["wav_file"])
+                return True
+                
+            except Exception as e:
+                app.logger.error(f"Job {job_id}: Failed to synthesize segment {idx} for {speaker_id}: {str(e)}")
+                # Log more details about the error
+                import traceback
+                app.logger.error(f"Job {job_id}: Traceback: {traceback.format_exc()}")
+                return False
+
+        def _synthesize_segment_batch(block: list[dict[str, Any]]) -> bool:
+            """Synthesize a block of same-voice segments with one PCM request.
+
+            Each segment is preceded by an SSML <mark/>; a speech-marks request for
+            the same SSML gives the mark offsets, which slice the PCM per segment.
+            """
+            first = block[0]
+            marked_body = "".join(f'<mark name="seg_{pos}"/>{item["ssml_body"]}' for pos, item in enumerate(block))
+            bytes_per_ms = _SEGMENT_SAMPLE_RATE * 2 // 1000
+
+            for conversational in ([True, False] if first["conversational"] else [False]):
+                if conversational:
+                    batch_ssml = f'<speak><amazon:domain name="conversational">{marked_body}</amazon:domain></speak>'
+                else:
+                    batch_ssml = f"<speak>{marked_body}</speak>"
+                request_args: dict[str, Any] = {
+                    "Text": batch_ssml,
+                    "TextType": "ssml",
+                    "VoiceId": first["voice_id"],
+                    "Engine": first["engine"],
+                }
+                if language_code:
+                    request_args["LanguageCode"] = language_code
+                try:
+                    marks_response = _polly_synthesize_throttled(
+                        OutputFormat="json", SpeechMarkTypes=["ssml"], **request_args
+                    )
+                    mark_offsets: dict[str, int] = {}
+                    for line in marks_response["AudioStream"].read().decode("utf-8").splitlines():
+                        if not line.strip():
+                            continue
+                        mark = json.loads(line)
+                        if mark.get("type") == "ssml":
+                            mark_offsets[mark["value"]] = int(mark["time"])
+                    bounds = [mark_offsets[f"seg_{pos}"] * bytes_per_ms for pos in range(len(block))]
+                    if any(later < earlier for earlier, later in zip(bounds, bounds[1:])):
+                        raise ValueError("speech mark offsets are not monotonic")
+                    pcm_response = _polly_synthesize_throttled(
+                        OutputFormat="pcm", SampleRate=str(_SEGMENT_SAMPLE_RATE), **request_args
+                    )
+                    pcm_bytes = pcm_response["AudioStream"].read()
+                except Exception as batch_error:
+                    app.logger.warning(
+                        "Job %s: Batched synthesis of %d segments for %s failed (%s)",
+                        job_id,
+                        len(block),
+                        first["speaker_id"],
+                        batch_error,
+                    )
                     continue
-        
-        app.logger.info(f"Job {job_id}: Generated {len(synthetic_segments)} synthetic audio segments")
-        
-        if not synthetic_segments:
-            app.logger.error(f"Job {job_id}: No segments were successfully synthesized")
-            return jsonify({"error": "Failed to synthesize any audio segments. Check if text content is valid."}), 500
-        
-        # Build FFmpeg complex filter to mix all segments at their timestamps
-        # This is complex - we'll create a silent audio track and overlay each segment
-        
-        # Get video duration
-        probe_cmd = [
-            FFPROBE_PATH, "-v", "error", "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1", str(video_path)
+
+                bounds.append(len(pcm_bytes))
+                pcm_view = memoryview(pcm_bytes)
+                for pos, item in enumerate(block):
+                    segment_pcm = pcm_view[bounds[pos]:max(bounds[pos], bounds[pos + 1])]
+                    with open(item["wav_file"], "wb") as f:
+                        f.write(_wav_header(len(segment_pcm), _SEGMENT_SAMPLE_RATE))
+                        f.write(segment_pcm)
+                    if conversational == item["conversational"]:
+                        _audio_cache_store(item["cache_key"], item["wav_file"])
+                return True
+            return False
+
+        def _synthesize_block(block: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            if len(block) > 1 and _synthesize_segment_batch(block):
+                return block
+            return [item for item in block if _synthesize_single_segment(item)]
+
+        # Segments are independent Polly round-trips; overlap them (Polly TPS is
+        # bounded separately by _POLLY_SEMAPHORE). map() keeps the original order.
+        with ThreadPoolExecutor(
+            max_workers=_SEGMENT_SYNTH_WORKERS,
+            thread_name_prefix="segment-synth",
+        ) as segment_pool:
+            prepared = [item for item in segment_pool.map(_prepare_segment_job, segment_jobs) if item is not None]
+
+            # Uncached segments sharing a speaker and voice settings are packed into
+            # blocks under Polly's per-request limits, so a speaker's many short lines
+            # cost a couple of requests instead of one each.
+            blocks: list[list[dict[str, Any]]] = []
+            open_blocks: dict[tuple[Any, ...], tuple[list[dict[str, Any]], list[int]]] = {}
+            for item in prepared:
+                if item["cached"]:
+                    continue
+                group = (item["speaker_id"], item["voice_id"], item["engine"], item["conversational"])
+                billed_chars = len(_strip_ssml_tags(item["ssml"]))
+                ssml_chars = len(item["ssml"]) + 64  # room for the mark and wrapper tags
+                block, totals = open_blocks.get(group, (None, [0, 0]))
+                if (
+                    block is None
+                    or totals[0] + billed_chars > _POLLY_BATCH_BILLED_CHARS
+                    or totals[1] + ssml_chars > _POLLY_BATCH_SSML_CHARS
+                ):
+                    block, totals = [], [0, 0]
+                    blocks.append(block)
+                    open_blocks[group] = (block, totals)
+                block.append(item)
+                totals[0] += billed_chars
+                totals[1] += ssml_chars
+
+            synthesized_ids = {
+                id(item)
+                for block_result in segment_pool.map(_synthesize_block, blocks)
+                for item in block_result
+            }
+
+        synthesized = [
+            {
+                "wav_file": item["wav_file"],
+                "duration": _pcm_wav_duration_seconds(item["wav_file"], _SEGMENT_SAMPLE_RATE),
+                "idx": item["idx"],
+                "start_time": item["start_time"],
+                "end_time": item["end_time"],
+                "speaker_id": item["speaker_id"],
+            }
+            for item in prepared
+            if item["cached"] or id(item) in synthesized_ids
         ]
-        duration_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        video_duration = float(duration_result.stdout.strip())
-        
-        # Instead of complex filter, use a simpler approach:
-        # For each segment, create a full-length audio file with silence and the segment at the right time
-        app.logger.info(f"Job {job_id}: Creating positioned audio segments...")
-        
-        positioned_segments = []
-        for idx, segment in enumerate(synthetic_segments):
-            positioned_path = temp_dir / f"positioned_{idx}.wav"
-            start_time = segment['start_time']
 
-            # Use the intended window duration to ensure alignment.
-            try:
-                segment_duration = max(0.12, float(segment['end_time']) - float(segment['start_time']))
-            except Exception:
-                segment_duration = 0.12
-            
-            # Calculate silence after
-            end_time = start_time + segment_duration
-            silence_after = max(0.1, video_duration - end_time)
-            
-            # Create a file with silence before the segment, then the audio, then silence after
-            # Handle case where segment starts at beginning (no silence before)
-            if start_time < 0.1:  # Starts at beginning
-                position_cmd = [
-                    FFMPEG_PATH,
-                    "-i", str(segment['audio_file']),  # The actual audio
-                    "-f", "lavfi", "-t", str(silence_after), "-i", "anullsrc=r=22050:cl=mono",  # Silence after
-                    "-filter_complex", "[0:a][1:a]concat=n=2:v=0:a=1[outa]",
-                    "-map", "[outa]",
-                    "-t", str(video_duration),
-                    str(positioned_path), "-y"
-                ]
-            else:  # Segment starts later, need silence before
-                position_cmd = [
-                    FFMPEG_PATH,
-                    "-f", "lavfi", "-t", str(start_time), "-i", "anullsrc=r=22050:cl=mono",  # Silence before
-                    "-i", str(segment['audio_file']),  # The actual audio
-                    "-f", "lavfi", "-t", str(silence_after), "-i", "anullsrc=r=22050:cl=mono",  # Silence after
-                    "-filter_complex", "[0:a][1:a][2:a]concat=n=3:v=0:a=1[outa]",
-                    "-map", "[outa]",
-                    "-t", str(video_duration),
-                    str(positioned_path), "-y"
+        def _fit_segment(item: dict[str, Any]) -> dict[str, Any]:
+            idx = item["idx"]
+            speaker_id = item["speaker_id"]
+            start_time = item["start_time"]
+            end_time = item["end_time"]
+            segment_wav_path = item["wav_file"]
+            segment_duration = item["duration"]
+
+            # Force the segment audio to fit exactly within the original time window.
+            # This prevents "drift" and keeps speech aligned to the on-screen speaker.
+            target_duration = max(0.12, end_time - start_time)
+
+            actual_duration = item["duration"]
+            if actual_duration and target_duration:
+                # Only speed up when the synthesized segment is too long for the window.
+                # Do NOT slow down short segments (that sounds unnatural and causes "slow voiceover").
+                speed_factor = actual_duration / target_duration
+                atempo = None
+                if speed_factor > 1.05:
+                    speed_factor = min(speed_factor, 1.45)
+                    atempo = _atempo_chain(speed_factor)
+                # Pad (if short) and trim (if long) to exact window.
+                segment_fitted_path = temp_dir / f"segment_{speaker_id}_{idx}_fit.wav"
+                filters: list[str] = []
+                if atempo:
+                    filters.append(atempo)
+                filters.append(f"apad=pad_dur={target_duration + 0.75:.3f}")
+                filter_str = ",".join(filters)
+                fit_cmd = [
+                    FFMPEG_PATH, "-i", str(segment_wav_path),
+                    "-filter:a", filter_str,
+                    "-t", f"{target_duration:.3f}",
+                    "-ar", str(_SEGMENT_SAMPLE_RATE), "-ac", "1", "-acodec", "pcm_s16le",
+                    str(segment_fitted_path), "-y",
                 ]
+                fit_result = _run_ffmpeg(fit_cmd)
+                if fit_result.returncode == 0 and segment_fitted_path.exists():
+                    segment_wav_path = segment_fitted_path
+                    segment_duration = target_duration
+                else:
+                    app.logger.warning(
+                        "Job %s: Failed to time-fit segment %s (%s). Using original segment audio.",
+                        job_id,
+                        idx,
+                        fit_result.stderr[-600:] if fit_result.stderr else "unknown error",
+                    )
             
-            result = subprocess.run(position_cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                positioned_segments.append(positioned_path)
-                app.logger.info(f"Job {job_id}: Positioned segment {idx} at {start_time}s (duration: {segment_duration}s)")
-            else:
-                app.logger.error(f"Job {job_id}: Failed to position segment {idx}: {result.stderr}")
-                app.logger.error(f"Job {job_id}: FFmpeg command: {' '.join(position_cmd)}")
-        
-        if not positioned_segments:
-            app.logger.error(f"Job {job_id}: No segments could be positioned out of {len(synthetic_segments)} synthesized segments")
-            return jsonify({"error": f"No audio segments could be positioned. Synthesized {len(synthetic_segments)} segments but positioning failed. Check video format and audio compatibility."}), 500
-        
-        # Now mix all positioned segments together using amix
-        app.logger.info(f"Job {job_id}: Mixing {len(positioned_segments)} positioned segments...")
-        
-        mixed_audio = temp_dir / "mixed_synthetic.wav"
-        mix_cmd = [FFMPEG_PATH]
+            return {
+                "audio_file": segment_wav_path,
+                "duration": segment_duration,
+                "start_time": start_time,
+                "end_time": end_time,
+                "speaker_id": speaker_id,
+            }
+
+        # Each fit is an independent ffmpeg process over its own files; run them side by side.
+        with ThreadPoolExecutor(
+            max_workers=_FFMPEG_PARALLELISM,
+            thread_name_prefix="segment-fit",
+        ) as fit_pool:
+            synthetic_segments = list(fit_pool.map(_fit_segment, synthesized))
         
-        # Add all positioned segments as inputs
-        for seg_file in positioned_segments:
-            mix_cmd.extend(["-i", str(seg_file)])
+        app.logger.info(f"Job {job_id}: Generated {len(synthetic_segments)} synthetic audio segments")
         
-        # Build the amix filter
-        if len(positioned_segments) == 1:
-            # Just copy the single segment
-            mix_cmd.extend(["-c:a", "pcm_s16le", "-ar", "22050", str(mixed_audio), "-y"])
-        else:
-            # Mix all inputs
-            filter_str = f"amix=inputs={len(positioned_segments)}:duration=longest:normalize=0"
-            mix_cmd.extend([
-                "-filter_complex", filter_str,
-                "-c:a", "pcm_s16le", "-ar", "22050",
-                str(mixed_audio), "-y"
-            ])
+        if not synthetic_segments:
+            app.logger.error(f"Job {job_id}: No segments were successfully synthesized")
+            return jsonify({"error": "Failed to synthesize any audio segments. Check if text content is valid."}), 500
         
-        subprocess.run(mix_cmd, capture_output=True, check=True)
-        app.logger.info(f"Job {job_id}: Mixed synthetic audio created")
+        # Get video duration (probe started right after the upload was saved)
+        video_duration = duration_future.result()
+        if video_duration is None:
+            raise ValueError("Unable to determine video duration")
+        
+        # Build the voice track in one ffmpeg pass. When no two segments overlap (the
+        # usual case) they are concatenated in order with generated silence between
+        # them, which costs O(track length) regardless of segment count. Overlapping
+        # segments fall back to adelay + amix. apad + -t keep the track as long as the video.
+        app.logger.info(f"Job {job_id}: Mixing {len(synthetic_segments)} segments at their timestamps...")
+        
+        synthetic_segments.sort(key=lambda segment: float(segment["start_time"]))
+        segments_disjoint = all(
+            float(nxt["start_time"]) >= float(cur["start_time"]) + cur["duration"]
+            for cur, nxt in zip(synthetic_segments, synthetic_segments[1:])
+        )
         
-        # Replace audio in video
+        # The video is input 0 and segment N is input N + 1: the voice track is built
+        # and muxed against the copied video stream in the same ffmpeg run.
         output_video = temp_dir / "output_with_synthetic_audio.mp4"
-        replace_cmd = [
-            FFMPEG_PATH, "-i", str(video_path), "-i", str(mixed_audio),
-            "-c:v", "copy", "-map", "0:v:0", "-map", "1:a:0",
-            "-shortest", str(output_video), "-y"
-        ]
-        subprocess.run(replace_cmd, capture_output=True, check=True)
-        app.logger.info(f"Job {job_id}: Audio replaced in video")
-        
-        # Read output video and return as base64
-        with open(output_video, "rb") as f:
-            video_data = f.read()
-        
-        video_base64 = base64.b64encode(video_data).decode("utf-8")
-        
-        return jsonify({
-            "job_id": job_id,
-            "status": "completed",
-            "video": video_base64,
-            "video_size_bytes": len(video_data),
-            "segments_processed": len(synthetic_segments),
-            "message": "Multi-speaker audio replacement completed successfully"
-        }), 200
+        mix_cmd = [FFMPEG_PATH, "-y", "-i", str(video_path)]
+        filter_parts: list[str] = []
+        
+        if segments_disjoint:
+            for segment in synthetic_segments:
+                mix_cmd.extend(["-i", str(segment["audio_file"])])
+            concat_inputs: list[str] = []
+            gaps: list[tuple[str, float]] = []
+            cursor = 0.0
+            for input_idx, segment in enumerate(synthetic_segments):
+                gap = float(segment["start_time"]) - cursor
+                if gap >= 0.001:
+                    gaps.append((f"g{input_idx}", gap))
+                    concat_inputs.append(f"[g{input_idx}]")
+                concat_inputs.append(f"[{input_idx + 1}:a]")
+                cursor = float(segment["start_time"]) + segment["duration"]
+            if gaps:
+                # Every gap is cut from one looped second of silence written by hand,
+                # rather than a separate generator source per gap.
+                silence_path = temp_dir / "silence_1s.wav"
+                silence_bytes = _SEGMENT_SAMPLE_RATE * 2
+                with open(silence_path, "wb") as f:
+                    f.write(_wav_header(silence_bytes, _SEGMENT_SAMPLE_RATE))
+                    f.write(bytes(silence_bytes))
+                silence_input = len(synthetic_segments) + 1
+                mix_cmd.extend(["-stream_loop", "-1", "-i", str(silence_path)])
+                split_labels = "".join(f"[{label}_src]" for label, _gap in gaps)
+                filter_parts.append(f"[{silence_input}:a]asplit={len(gaps)}{split_labels}")
+                for label, gap in gaps:
+                    filter_parts.append(f"[{label}_src]atrim=duration={gap:.3f},asetpts=N/SR/TB[{label}]")
+            filter_parts.append(
+                f"{''.join(concat_inputs)}concat=n={len(concat_inputs)}:v=0:a=1,apad[outa]"
+            )
+        else:
+            mix_sources = [
+                (segment["audio_file"], max(0, int(round(float(segment["start_time"]) * 1000))))
+                for segment in synthetic_segments
+            ]
+            if len(mix_sources) > _AMIX_MAX_INPUTS:
+                # ffmpeg's amix/pan graphs misbehave somewhere past 32 inputs, so large
+                # overlapping timelines are pre-mixed in groups and the groups mixed last.
+                group_cmds: list[list[str]] = []
+                grouped_sources: list[tuple[Any, int]] = []
+                for group_start in range(0, len(mix_sources), _AMIX_MAX_INPUTS):
+                    group = mix_sources[group_start:group_start + _AMIX_MAX_INPUTS]
+                    group_path = temp_dir / f"mix_group_{group_start // _AMIX_MAX_INPUTS}.wav"
+                    group_cmd = [FFMPEG_PATH, "-y"]
+                    for source_path, _delay in group:
+                        group_cmd.extend(["-i", str(source_path)])
+                    group_cmd.extend([
+                        "-filter_complex", ";".join(_adelay_amix_graph([delay for _path, delay in group], 0, "mix")),
+                        "-map", "[mix]",
+                        "-c:a", "pcm_s16le", "-ar", str(_SEGMENT_SAMPLE_RATE),
+                        str(group_path),
+                    ])
+                    group_cmds.append(group_cmd)
+                    grouped_sources.append((group_path, 0))
+                with ThreadPoolExecutor(
+                    max_workers=_FFMPEG_PARALLELISM,
+                    thread_name_prefix="mix-group",
+                ) as group_pool:
+                    # list() drains the results so a failed group raises CalledProcessError here.
+                    list(group_pool.map(lambda cmd: _run_ffmpeg(cmd, check=True), group_cmds))
+                mix_sources = grouped_sources
+            for source_path, _delay in mix_sources:
+                mix_cmd.extend(["-i", str(source_path)])
+            filter_parts.extend(_adelay_amix_graph([delay for _path, delay in mix_sources], 1, "mix"))
+            filter_parts.append("[mix]apad[outa]")
+        
+        mix_cmd.extend([
+            "-filter_complex", ";".join(filter_parts),
+            "-map", "0:v:0", "-map", "[outa]",
+            "-t", f"{video_duration:.3f}",
+            "-c:v", "copy",
+            "-c:a", "aac", "-b:a", "128k", "-ar", str(_SEGMENT_SAMPLE_RATE),
+            *_FRAGMENTED_MP4_FLAGS,
+            str(output_video),
+        ])
+        
+        _run_ffmpeg(mix_cmd, check=True)
+        app.logger.info(f"Job {job_id}: Synthetic audio mixed and muxed into video")
+        
+        # Stream the MP4 back as-is rather than inlining it as base64 JSON. send_file
+        # opens the file before returning, so the deferred temp-dir cleanup cannot
+        # pull it out from under the response.
+        response = send_file(
+            output_video,
+            mimetype="video/mp4",
+            as_attachment=True,
+            download_name=f"{job_id}.mp4",
+        )
+        response.headers["X-Job-Id"] = job_id
+        response.headers["X-Segments-Processed"] = str(len(synthetic_segments))
+        return response
         
     except subprocess.CalledProcessError as e:
-        app.logger.error(f"Job {job_id}: FFmpeg error: {e.stderr}")
-        return jsonify({"error": f"FFmpeg processing failed: {e.stderr}"}), 500
+        ffmpeg_error = (
+            e.stderr.decode("utf-8", errors="replace") if isinstance(e.stderr, bytes) else (e.stderr or str(e))
+        )
+        app.logger.error(f"Job {job_id}: FFmpeg error: {ffmpeg_error}")
+        return jsonify({"error": f"FFmpeg processing failed: {ffmpeg_error}"}), 500
     except Exception as e:
         app.logger.error(f"Job {job_id}: Unexpected error: {str(e)}")
         return jsonify({"error": f"Processing failed: {str(e)}"}), 500
     finally:
-        try:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
+        _schedule_cleanup(temp_dir)
 
 
 if __name__ == "__main__":
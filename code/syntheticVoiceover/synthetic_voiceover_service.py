@@ -1,18 +1,141 @@
 from __future__ import annotations
 
-import html
+import hashlib
 import json
 import os
 import re
-from collections import Counter
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Match
+import string
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields, replace
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, Match
+from xml.parsers import expat
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Bedrock request/response bodies go through orjson when it is installed; the
+# stdlib fallback produces the same UTF-8 bytes.
+if orjson is not None:
+    _json_dumps_bytes = orjson.dumps
+    _json_loads = orjson.loads
+else:  # pragma: no cover - optional dependency
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+# One pooled client serves the whole synthesize_speech fallback cascade. Short
+# connect/read timeouts stop a stale socket from stalling a retry for the 60s
+# botocore default; keepalive keeps the pooled TLS connections usable.
+_POLLY_CLIENT_CONFIG = Config(
+    max_pool_connections=16,
+    connect_timeout=2,
+    read_timeout=10,
+    retries={"max_attempts": 3, "mode": "standard"},
+    tcp_keepalive=True,
+)
+
+_POLLY_THROTTLE_CODES = {"ThrottlingException", "TooManyRequestsException"}
+
+# Idle pooled connections get dropped server-side, and the next synthesis then pays
+# for a fresh TLS handshake. A cheap describe_voices call this often keeps one warm.
+# 0 disables the pinger.
+_POLLY_KEEPALIVE_SECONDS = float(os.environ.get("VOICEOVER_POLLY_KEEPALIVE_SECONDS", "30"))
+
+
+def _is_transient_polly_error(error: BaseException) -> bool:
+    """Throttling, 5xx and connection errors: the kinds the client's retry handler retries.
+
+    Anything else (InvalidSsmlException, TextLengthExceededException, ...) is a
+    rejection of this particular request and is never retried.
+    """
+    if not isinstance(error, ClientError):
+        return isinstance(error, BotoCoreError)
+    if error.response.get("Error", {}).get("Code") in _POLLY_THROTTLE_CODES:
+        return True
+    return error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500
+
+# Worker threads for callers that want synthesis off their own thread; threads are
+# only started once work is submitted.
+_SYNTHESIS_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="voiceover-synth")
+
+# Compiled once at import; the SSML checks run on every generation attempt and Polly retry.
+WHITESPACE_RE = re.compile(r"\s+")
+TAG_RE = re.compile(r"<[^>]+>")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+BULLET_SPLIT_RE = re.compile(r"[\n\r•\-]+")
+XML_HEADER_RE = re.compile(r"<\?xml[^>]*>|<!DOCTYPE[^>]*>", re.IGNORECASE)
+RATE_DECIMAL_RE = re.compile(r'rate="([0-9]*\.?[0-9]+)"', re.IGNORECASE)
+# Break-time, decimal-rate and bare-ampersand fixups in a single scan; the
+# outer named group that matched is reported by ``match.lastgroup``.
+SSML_FIXUP_RE = re.compile(
+    r'(?P<break>time="(?P<break_value>[0-9]*\.?[0-9]+)(?P<break_unit>s|ms)")'
+    r'|(?P<rate>rate="(?P<rate_value>[0-9]*\.?[0-9]+)")'
+    r"|(?P<amp>&(?![a-zA-Z]+;|#\d+;|#x[0-9A-Fa-f]+;))",
+    re.IGNORECASE,
+)
+AMAZON_TAG_RE = re.compile(r"<\s*/?amazon:(?:effect|domain|auto-breaths)[^>]*>", re.IGNORECASE)
+RATE_X_RE = re.compile(r'rate="x-(fast|slow)"', re.IGNORECASE)
+VOLUME_X_RE = re.compile(r'volume="x-(loud|soft)"', re.IGNORECASE)
+COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+# Punctuation -> space for tokenizing; "_" stays since it is a word character.
+# Typographic quotes/dashes are included because model output is full of them.
+PUNCT_TO_SPACE = str.maketrans(
+    {char: " " for char in string.punctuation.replace("_", "") + "\u2018\u2019\u201c\u201d\u2013\u2014\u2026\u00ab\u00bb\u00a1\u00bf\u2022"}
+)
+# Same output as html.escape(..., quote=True) in one C-level pass.
+HTML_ESCAPE_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+# Candidate split points for streamed synthesis: after a paragraph or sentence
+# element, or between plain-text sentences.
+SSML_CHUNK_BOUNDARY_RE = re.compile(r"(?<=</p>)|(?<=</s>)|(?<=[.!?])\s+", re.IGNORECASE)
+SPEAK_BLOCK_RE = re.compile(r"<\s*speak\b[^>]*>(.*)</\s*speak\s*>", re.IGNORECASE | re.DOTALL)
+
+
+# Retry instructions appended to the user's prompt by the attempt plan.
+_ATTEMPT_PROMPT_FORCE_SPEECH = (
+    "\n\n"
+    "Transform this into a fresh narration script with original phrasing, using expressive SSML tags. "
+    "Deliver 4-6 sentences split across paragraphs with varied pacing cues."
+)
+_ATTEMPT_PROMPT_STORY_ARC = (
+    "\n\n"
+    "Craft a vivid voiceover with an opening hook, middle build, and closing call-to-action. "
+    "Incorporate <p> sections, <break>, and <emphasis> tags. Avoid copying the input sentences directly."
+)
+_ATTEMPT_PROMPT_ESCALATION_TMPL = (
+    "\n\n"
+    "Attempt {n}: Produce an entirely new narration with a cinematic arc, vivid sensory language,"
+    " and varied pacing. Do not mirror the source sentences—paraphrase heavily and introduce fresh connective tissue.\n"
+    "Use multiple <p> blocks, layer in <prosody rate=\"slow\"> and <emphasis> for key beats, and ensure at least five"
+    " sentences total. Close with a motivating call-to-action."
+)
+
+
+@lru_cache(maxsize=256)
+def _is_well_formed_xml(text: str) -> bool:
+    # expat checks well-formedness without building a tree. Cached because the
+    # same SSML is normalised again on Polly retries and repeated segments.
+    try:
+        expat.ParserCreate().Parse(text, True)
+    except expat.ExpatError:
+        return False
+    return True
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoiceoverAttempt:
     index: int
     label: str
@@ -23,9 +146,61 @@ class VoiceoverAttempt:
     notes: str
 
 
+@dataclass(slots=True)
+class SynthesisMetadata:
+    engine: str
+    normalized: bool
+    normalization_notes: List[str]
+    sanitized: bool
+    sanitized_ssml: Optional[str]
+    plain_retry: bool
+    plain_retry_ssml: Optional[str]
+    text_fallback: bool
+    text_fallback_text: Optional[str]
+    safe_minimal: bool
+    safe_minimal_ssml: Optional[str]
+    safe_minimal_engine: Optional[str]
+    safe_minimal_mode: Optional[str]
+    content_type: str
+    cached: bool = False
+    coalesced: bool = False
+
+
+_SYNTHESIS_METADATA_FIELDS = frozenset(field.name for field in fields(SynthesisMetadata))
+
+
+def _polly_keepalive_loop(service_ref: "weakref.ReferenceType[SyntheticVoiceoverService]") -> None:
+    # Holds only a weak reference between pings so the service can still be collected.
+    while True:
+        time.sleep(_POLLY_KEEPALIVE_SECONDS)
+        service = service_ref()
+        if service is None:
+            return
+        try:
+            service.polly.describe_voices(LanguageCode="en-US")
+        except (BotoCoreError, ClientError):
+            pass
+        del service
+
+
 class SyntheticVoiceoverService:
     """Reusable orchestration layer for SSML generation and neural speech synthesis."""
 
+    # Successful generations per (prompt, persona, language, sampling) so
+    # regenerating the same clip does not pay for another Bedrock run.
+    _SSML_CACHE_MAX_ENTRIES = 256
+    # Synthesized audio per (voice, engine, format, sample rate, normalized SSML);
+    # the hottest entries stay in memory, the rest are content-addressed on disk.
+    _SPEECH_CACHE_MAX_ENTRIES = 256
+    # Total audio bytes held in memory; long scripts make multi-MB blobs, so the
+    # entry cap alone doesn't bound memory.
+    _SPEECH_MEMORY_CACHE_MAX_BYTES = int(
+        float(os.environ.get("VOICEOVER_AUDIO_MEMORY_CACHE_MAX_MB", "64")) * 1024 * 1024
+    )
+    _SPEECH_CACHE_MAX_BYTES = int(float(os.environ.get("VOICEOVER_AUDIO_CACHE_MAX_MB", "512")) * 1024 * 1024)
+    # Supported engines per voice ID, bounded so a long-lived worker cannot grow it forever.
+    _VOICE_ENGINE_CACHE_MAX_ENTRIES = 256
+
     def __init__(
         self,
         *,
@@ -54,15 +229,49 @@ class SyntheticVoiceoverService:
                 "and other supported neural speech effects where appropriate."
             ),
         )
+        # Per-instance constants for _compose_prompt, which runs once per attempt.
+        self._instruction_prefix = " ".join((
+            self.system_prompt.strip(),
+            "Return only valid SSML wrapped in <speak>...</speak> with no commentary or explanations outside the tags.",
+            "Do not repeat the user's prompt verbatim. Transform the ideas into an original spoken narration with multiple sentences.",
+        ))
+        self._is_llama3 = (self.model_id or "").lower().startswith("meta.llama3")
         self.max_tokens = max_tokens
         self.default_temperature = temperature
         self.default_top_p = top_p
 
-        self.bedrock = bedrock_client or boto3.client("bedrock-runtime", region_name=self.bedrock_region)
-        self.polly = polly_client or boto3.client("polly", region_name=self.polly_region)
+        # Clients are built on first use: loading a boto3 service model is slow and
+        # most callers only need one of the two.
+        self._bedrock_client = bedrock_client
+        self._polly_client = polly_client
 
         self._voice_cache: Optional[List[Dict[str, Any]]] = None
-        self._voice_engine_cache: Dict[str, List[str]] = {}
+        self._ssml_cache: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._ssml_cache_lock = threading.Lock()
+        self._cache_enabled = os.environ.get("VOICEOVER_DISABLE_CACHE", "0") not in {"1", "true", "True"}
+        self._speech_cache: "OrderedDict[str, Tuple[SynthesisMetadata, bytes]]" = OrderedDict()
+        self._speech_cache_bytes = 0
+        self._speech_cache_lock = threading.Lock()
+        self._inflight_speech: Dict[str, "Future[Tuple[SynthesisMetadata, Any]]"] = {}
+        self._inflight_lock = threading.Lock()
+        self._voice_engine_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._voice_engine_cache_lock = threading.Lock()
+
+    @property
+    def bedrock(self) -> Any:
+        if self._bedrock_client is None:
+            self._bedrock_client = boto3.client("bedrock-runtime", region_name=self.bedrock_region)
+        return self._bedrock_client
+
+    @property
+    def polly(self) -> Any:
+        if self._polly_client is None:
+            self._polly_client = boto3.client("polly", region_name=self.polly_region, config=_POLLY_CLIENT_CONFIG)
+            if _POLLY_KEEPALIVE_SECONDS > 0:
+                threading.Thread(
+                    target=_polly_keepalive_loop, args=(weakref.ref(self),), name="polly-keepalive", daemon=True
+                ).start()
+        return self._polly_client
 
     # ------------------------------------------------------------------
     # Prompt + generation helpers
@@ -76,13 +285,7 @@ class SyntheticVoiceoverService:
         language: Optional[str] = None,
         force_speech: bool = False,
     ) -> str:
-        instructions = [self.system_prompt.strip()]
-        instructions.append(
-            "Return only valid SSML wrapped in <speak>...</speak> with no commentary or explanations outside the tags."
-        )
-        instructions.append(
-            "Do not repeat the user's prompt verbatim. Transform the ideas into an original spoken narration with multiple sentences."
-        )
+        instructions = [self._instruction_prefix]
         if persona:
             instructions.append(f"Adopt the following tone guidance: {persona.strip()}")
         if language:
@@ -92,13 +295,7 @@ class SyntheticVoiceoverService:
 
         system_block = " ".join(instructions)
         clean_prompt = prompt.strip()
-        return (
-            "<s>[INST] <<SYS>>"
-            f" {system_block} "
-            "<</SYS>> "
-            f"{clean_prompt}"
-        model_id = (self.model_id or "").lower()
-        if model_id.startswith("meta.llama3"):
+        if self._is_llama3:
             return (
                 "<|begin_of_text|>"
                 "<|start_header_id|>system<|end_header_id|>\n"
@@ -117,6 +314,9 @@ class SyntheticVoiceoverService:
             f"{clean_prompt}\n"
             "[/INST]"
         )
+
+    @staticmethod
+    def _extract_generation_text(response_body: Dict[str, Any]) -> str:
         def _collect_from_content(content: Any) -> str:
             if isinstance(content, list):
                 parts: List[str] = []
@@ -187,40 +387,40 @@ class SyntheticVoiceoverService:
     def _invoke_bedrock(self, body: Dict[str, Any]) -> Dict[str, Any]:
         response = self.bedrock.invoke_model(
             modelId=self.model_id,
-            body=json.dumps(body),
+            body=_json_dumps_bytes(body),
             accept="application/json",
             contentType="application/json",
         )
         payload = response["body"].read()
-        return json.loads(payload)
+        return _json_loads(payload)
 
     @staticmethod
     def _fallback_ssml(prompt: str) -> str:
-        cleaned = re.sub(r"\s+", " ", (prompt or "").strip())
+        cleaned = WHITESPACE_RE.sub(" ", (prompt or "").strip())
         if not cleaned:
             cleaned = "our story today"
 
-        sentences = re.split(r"(?<=[.!?])\s+", cleaned)
+        sentences = SENTENCE_SPLIT_RE.split(cleaned)
         focus_sentence = sentences[0] if sentences and sentences[0].strip() else cleaned
-        focus_phrase = html.escape(focus_sentence.strip()[:180])
+        focus_phrase = focus_sentence.strip()[:180].translate(HTML_ESCAPE_TRANS)
 
-        bullet_candidates = [part.strip() for part in re.split(r"[\n\r•\-]+", cleaned) if part.strip()]
-        bullet_phrases = [html.escape(candidate[:160]) for candidate in bullet_candidates[:3]]
+        bullet_candidates = filter(None, (part.strip() for part in BULLET_SPLIT_RE.split(cleaned)))
+        bullet_phrases = [candidate[:160].translate(HTML_ESCAPE_TRANS) for candidate in islice(bullet_candidates, 3)]
 
         intro = (
             f"<p><s>Welcome! Let's explore {focus_phrase} from a fresh perspective.</s>"
             "<break time=\"400ms\"/></p>"
         )
         if bullet_phrases:
-            body_sentences = [
+            body_sentences = "<break time=\"250ms\"/>".join(
                 f"<s>Key moment {idx}: {phrase}. We'll bring this idea to life with vivid storytelling.</s>"
                 for idx, phrase in enumerate(bullet_phrases, start=1)
-            ]
+            )
         else:
-            body_sentences = [
+            body_sentences = (
                 "<s>We'll unfold the main ideas step by step, highlighting the emotions and motivations along the way.</s>"
-            ]
-        body = "<p>" + "<break time=\"250ms\"/>".join(body_sentences) + "</p>"
+            )
+        body = f"<p>{body_sentences}</p>"
         outro = (
             "<p><s>Stay tuned as we guide you through the narrative, keeping the energy dynamic and engaging.</s>"
             "<break time=\"350ms\"/><s>Thanks for listening.</s></p>"
@@ -228,59 +428,67 @@ class SyntheticVoiceoverService:
         return f"<speak>{intro}{body}{outro}</speak>"
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _strip_ssml_tags(ssml: str) -> str:
-        no_tags = re.sub(r"<[^>]+>", " ", ssml)
-        return re.sub(r"\s+", " ", no_tags).strip()
+        # Cached: the same normalized SSML is stripped repeatedly across the fallback
+        # cascade. split()/join collapses and trims whitespace without a second regex pass.
+        return " ".join(TAG_RE.sub(" ", ssml).split())
 
     @staticmethod
     def _tokenize(text: str) -> List[str]:
-        cleaned = re.sub(r"[^\w\s]", " ", text).lower()
-        return [token for token in cleaned.split() if token]
+        return text.lower().translate(PUNCT_TO_SPACE).split()
 
     @classmethod
     def _token_overlap(cls, prompt_tokens: List[str], ssml_tokens: List[str]) -> float:
         if not prompt_tokens or not ssml_tokens:
             return 0.0
-        prompt_counter = Counter(prompt_tokens)
-        ssml_counter = Counter(ssml_tokens)
-        overlap = sum((prompt_counter & ssml_counter).values())
-        return overlap / max(1, len(prompt_tokens))
+        # Multiset intersection size in one pass over the SSML tokens.
+        remaining = Counter(prompt_tokens)
+        overlap = 0
+        for token in ssml_tokens:
+            count = remaining.get(token, 0)
+            if count:
+                remaining[token] = count - 1
+                overlap += 1
+        return overlap / len(prompt_tokens)
 
     def _looks_like_prompt_echo(self, prompt: str, ssml: str) -> bool:
         if not prompt or not ssml:
             return False
-        prompt_clean = re.sub(r"\s+", " ", prompt).strip().lower()
-        ssml_clean = self._strip_ssml_tags(ssml).lower()
-        if not prompt_clean or not ssml_clean:
+        # One regex pass drops the tags; split() collapses whitespace, so neither side
+        # needs a separate whitespace-normalising pass.
+        prompt_words = prompt.lower().split()
+        ssml_words = TAG_RE.sub(" ", ssml).lower().split()
+        if not prompt_words or not ssml_words:
             return False
-        if prompt_clean == ssml_clean:
-            return True
+        prompt_clean = " ".join(prompt_words)
+        ssml_clean = " ".join(ssml_words)
 
-        if ssml_clean.startswith(prompt_clean):
-            trailing = ssml_clean[len(prompt_clean):].strip()
-            if not trailing or len(trailing.split()) <= 3:
+        # Verbatim or prompt-plus-a-few-words output; impossible with more than 3 extra words.
+        if len(ssml_words) <= len(prompt_words) + 3:
+            if prompt_clean == ssml_clean:
                 return True
-
-        similarity = 0.0
-        try:
-            from difflib import SequenceMatcher
-
-            similarity = SequenceMatcher(None, prompt_clean, ssml_clean).ratio()
-        except Exception:
-            similarity = 0.0
+            if ssml_clean.startswith(prompt_clean):
+                trailing = ssml_clean[len(prompt_clean):].strip()
+                if not trailing or len(trailing.split()) <= 3:
+                    return True
 
         prompt_tokens = self._tokenize(prompt_clean)
         ssml_tokens = self._tokenize(ssml_clean)
+        if not prompt_tokens or not ssml_tokens:
+            return False
+        # Cheap reject: if the SSML lacks half the prompt's distinct words it is not an
+        # echo, and the multiset overlap below never needs computing.
+        prompt_vocab = set(prompt_tokens)
+        if len(prompt_vocab.intersection(ssml_tokens)) * 2 < len(prompt_vocab):
+            return False
         overlap_ratio = self._token_overlap(prompt_tokens, ssml_tokens)
+        length_ratio = min(len(prompt_tokens), len(ssml_tokens)) / max(len(prompt_tokens), len(ssml_tokens))
 
-        length_ratio = 1.0
-        if prompt_tokens and ssml_tokens:
-            length_ratio = min(len(prompt_tokens), len(ssml_tokens)) / max(len(prompt_tokens), len(ssml_tokens))
-
-        token_ratio = len(ssml_tokens) / max(1, len(prompt_tokens)) if prompt_tokens else 0.0
+        # Near-verbatim echoes score high on token overlap as well, so no
+        # character-level (quadratic) similarity pass is needed.
+        token_ratio = len(ssml_tokens) / len(prompt_tokens)
 
-        if similarity >= 0.995 and length_ratio >= 0.97:
-            return True
         if overlap_ratio >= 0.98 and length_ratio >= 0.95:
             return True
         if overlap_ratio >= 0.95 and length_ratio >= 0.9 and token_ratio <= 1.08:
@@ -320,11 +528,7 @@ class SyntheticVoiceoverService:
                 continue
 
             if attempt_index == 1:
-                prompt_text = (
-                    f"{user_prompt}\n\n"
-                    "Transform this into a fresh narration script with original phrasing, using expressive SSML tags. "
-                    "Deliver 4-6 sentences split across paragraphs with varied pacing cues."
-                )
+                prompt_text = user_prompt + _ATTEMPT_PROMPT_FORCE_SPEECH
                 plan.append(
                     VoiceoverAttempt(
                         index=attempt_index + 1,
@@ -344,11 +548,7 @@ class SyntheticVoiceoverService:
                 continue
 
             if attempt_index == 2:
-                prompt_text = (
-                    f"{user_prompt}\n\n"
-                    "Craft a vivid voiceover with an opening hook, middle build, and closing call-to-action. "
-                    "Incorporate <p> sections, <break>, and <emphasis> tags. Avoid copying the input sentences directly."
-                )
+                prompt_text = user_prompt + _ATTEMPT_PROMPT_STORY_ARC
                 plan.append(
                     VoiceoverAttempt(
                         index=attempt_index + 1,
@@ -368,13 +568,7 @@ class SyntheticVoiceoverService:
                 continue
 
             escalation = attempt_index - 2
-            prompt_text = (
-                f"{user_prompt}\n\n"
-                f"Attempt {attempt_index + 1}: Produce an entirely new narration with a cinematic arc, vivid sensory language,"
-                " and varied pacing. Do not mirror the source sentences—paraphrase heavily and introduce fresh connective tissue.\n"
-                "Use multiple <p> blocks, layer in <prosody rate=\"slow\"> and <emphasis> for key beats, and ensure at least five"
-                " sentences total. Close with a motivating call-to-action."
-            )
+            prompt_text = user_prompt + _ATTEMPT_PROMPT_ESCALATION_TMPL.format(n=attempt_index + 1)
             plan.append(
                 VoiceoverAttempt(
                     index=attempt_index + 1,
@@ -414,6 +608,20 @@ class SyntheticVoiceoverService:
         base_top_p = top_p if top_p is not None else self.default_top_p
         attempt_limit = max(4, max_attempts or int(os.environ.get("VOICEOVER_MAX_ATTEMPTS", "7")))
 
+        cache_key = (
+            self._ssml_cache_key(user_prompt, persona, language, base_temperature, base_top_p)
+            if self._cache_enabled
+            else None
+        )
+        if cache_key:
+            with self._ssml_cache_lock:
+                cached = self._ssml_cache.get(cache_key)
+                if cached is not None:
+                    self._ssml_cache.move_to_end(cache_key)
+            if cached is not None:
+                cached_ssml, cached_metadata = cached
+                return cached_ssml, {**cached_metadata, "cached": True}
+
         attempt_plan = self._build_attempt_plan(
             user_prompt,
             persona,
@@ -427,61 +635,35 @@ class SyntheticVoiceoverService:
         response_body: Optional[Dict[str, Any]] = None
         attempt_logs: List[Dict[str, Any]] = []
 
-        for attempt in attempt_plan:
-            body = {
-                "prompt": attempt.prompt,
-                "max_gen_len": self.max_tokens,
-                "temperature": attempt.temperature,
-                "top_p": attempt.top_p,
-            }
-            try:
-                candidate_response = self._invoke_bedrock(body)
-            except (BotoCoreError, ClientError) as aws_error:
-                attempt_logs.append(
-                    {
-                        "attempt": attempt.index,
-                        "label": attempt.label,
-                        "status": "error",
-                        "error": f"Model runtime request failed: {aws_error}",
-                    }
-                )
-                continue
-            except Exception as runtime_error:
-                attempt_logs.append(
-                    {
-                        "attempt": attempt.index,
-                        "label": attempt.label,
-                        "status": "error",
-                        "error": f"Unexpected language runtime error: {runtime_error}",
-                    }
-                )
-                continue
-
-            raw_generation = self._extract_generation_text(candidate_response).strip()
-            needs_retry, retry_reason = self._should_retry(user_prompt, raw_generation)
-            attempt_logs.append(
-                {
-                    "attempt": attempt.index,
-                    "label": attempt.label,
-                    "status": "retry" if needs_retry else "ok",
-                    "reason": retry_reason,
-                    "notes": attempt.notes,
-                    "generation_length": len(raw_generation),
-                    "temperature": attempt.temperature,
-                    "top_p": attempt.top_p,
-                }
-            )
-
-            if raw_generation and not needs_retry:
-                generation = raw_generation
-                response_body = candidate_response
-                break
-
-            try:
-                serialized_body = json.dumps(candidate_response, ensure_ascii=False)
-            except Exception:
-                serialized_body = str(candidate_response)
-            attempt_logs[-1]["response"] = serialized_body[:1600]
+        # The primary attempt runs alone; if it fails validation, the next
+        # VOICEOVER_SPECULATIVE_RETRIES attempts are issued together and the first
+        # passing one wins. 0 restores strictly sequential retries.
+        speculative = min(3, max(1, int(os.environ.get("VOICEOVER_SPECULATIVE_RETRIES", "2"))))
+        pending = list(attempt_plan)
+        while pending and not generation:
+            wave_size = 1 if not attempt_logs else min(speculative, len(pending))
+            wave, pending = pending[:wave_size], pending[wave_size:]
+            if wave_size == 1:
+                results = [self._run_attempt(user_prompt, wave[0])]
+            else:
+                results = []
+                executor = ThreadPoolExecutor(max_workers=wave_size, thread_name_prefix="ssml-attempt")
+                try:
+                    futures = [executor.submit(self._run_attempt, user_prompt, attempt) for attempt in wave]
+                    for future in as_completed(futures):
+                        results.append(future.result())
+                        if results[-1][1]:
+                            break
+                finally:
+                    # Calls already in flight finish in the background; queued ones are dropped.
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            results.sort(key=lambda result: result[0]["attempt"])
+            for log_entry, raw_generation, candidate_response in results:
+                attempt_logs.append(log_entry)
+                if raw_generation and not generation:
+                    generation = raw_generation
+                    response_body = candidate_response
 
         if not generation:
             fallback_ssml = self._fallback_ssml(user_prompt)
@@ -510,7 +692,103 @@ class SyntheticVoiceoverService:
             "attempt_count": len(attempt_logs),
             "attempts": attempt_logs,
         }
-        return generation, metadata
+        if cache_key:
+            with self._ssml_cache_lock:
+                self._ssml_cache[cache_key] = (generation, metadata)
+                self._ssml_cache.move_to_end(cache_key)
+                while len(self._ssml_cache) > self._SSML_CACHE_MAX_ENTRIES:
+                    self._ssml_cache.popitem(last=False)
+        return generation, {**metadata}
+
+    @staticmethod
+    def _ssml_cache_key(
+        user_prompt: str,
+        persona: Optional[str],
+        language: Optional[str],
+        temperature: float,
+        top_p: float,
+    ) -> str:
+        material = json.dumps(
+            {
+                "p": user_prompt.strip().lower(),
+                "persona": persona,
+                "lang": language,
+                "t": round(temperature, 2),
+                "tp": round(top_p, 2),
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _run_attempt(
+        self, user_prompt: str, attempt: VoiceoverAttempt
+    ) -> Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]:
+        """Invoke one planned attempt; returns (log entry, accepted generation or "", response)."""
+        body = {
+            "prompt": attempt.prompt,
+            "max_gen_len": self.max_tokens,
+            "temperature": attempt.temperature,
+            "top_p": attempt.top_p,
+        }
+        try:
+            candidate_response = self._invoke_bedrock(body)
+        except (BotoCoreError, ClientError) as aws_error:
+            return (
+                {
+                    "attempt": attempt.index,
+                    "label": attempt.label,
+                    "status": "error",
+                    "error": f"Model runtime request failed: {aws_error}",
+                },
+                "",
+                None,
+            )
+        except Exception as runtime_error:
+            return (
+                {
+                    "attempt": attempt.index,
+                    "label": attempt.label,
+                    "status": "error",
+                    "error": f"Unexpected language runtime error: {runtime_error}",
+                },
+                "",
+                None,
+            )
+
+        raw_generation = self._extract_generation_text(candidate_response).strip()
+        needs_retry, retry_reason = self._should_retry(user_prompt, raw_generation)
+        log_entry: Dict[str, Any] = {
+            "attempt": attempt.index,
+            "label": attempt.label,
+            "status": "retry" if needs_retry else "ok",
+            "reason": retry_reason,
+            "notes": attempt.notes,
+            "generation_length": len(raw_generation),
+            "temperature": attempt.temperature,
+            "top_p": attempt.top_p,
+        }
+        if raw_generation and not needs_retry:
+            return log_entry, raw_generation, candidate_response
+
+        log_entry["response_summary"] = self._response_summary(candidate_response, raw_generation)
+        return log_entry, "", candidate_response
+
+    @staticmethod
+    def _response_summary(response: Any, generation: str) -> Dict[str, Any]:
+        fields = response if isinstance(response, dict) else {}
+        summary: Dict[str, Any] = {
+            "stop_reason": fields.get("stop_reason"),
+            "prompt_token_count": fields.get("prompt_token_count"),
+            "generation_token_count": fields.get("generation_token_count"),
+            "head": generation[:400],
+        }
+        # The full model response only goes into attempt logs when explicitly debugging.
+        if os.environ.get("VOICEOVER_DEBUG", "0") in {"1", "true", "True"}:
+            try:
+                summary["body"] = _json_dumps_bytes(response).decode("utf-8")
+            except Exception:
+                summary["body"] = str(response)
+        return summary
 
     def _should_retry(self, user_prompt: str, ssml: str) -> Tuple[bool, Optional[str]]:
         if not ssml:
@@ -523,10 +801,27 @@ class SyntheticVoiceoverService:
     # Polly helpers
     # ------------------------------------------------------------------
 
+    def _voice_disk_cache_path(self) -> Path:
+        cache_dir = os.environ.get("VOICEOVER_CACHE_DIR") or Path.home() / ".cache" / "psl-media"
+        return Path(cache_dir) / f"polly_voices_{self.polly_region}.json"
+
     def _list_neural_voices(self) -> List[Dict[str, Any]]:
         if self._voice_cache is not None:
             return self._voice_cache
 
+        # The catalog changes on the order of weeks; reuse the last listing from disk
+        # rather than paginating describe_voices on every cold start.
+        cache_path = self._voice_disk_cache_path()
+        cache_ttl = float(os.environ.get("VOICEOVER_VOICE_CACHE_TTL", "86400"))
+        try:
+            if time.time() - cache_path.stat().st_mtime < cache_ttl:
+                cached_voices = json.loads(cache_path.read_text(encoding="utf-8"))
+                if isinstance(cached_voices, list) and cached_voices:
+                    self._voice_cache = cached_voices
+                    return cached_voices
+        except (OSError, ValueError):
+            pass
+
         paginator = self.polly.get_paginator("describe_voices")
         voices: List[Dict[str, Any]] = []
         for page in paginator.paginate(Engine="neural"):
@@ -544,29 +839,44 @@ class SyntheticVoiceoverService:
                     )
         voices.sort(key=lambda v: (v.get("language_name", ""), v.get("name", "")))
         self._voice_cache = voices
+        if voices:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                staging = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                staging.write_text(json.dumps(voices), encoding="utf-8")
+                os.replace(staging, cache_path)
+            except OSError:
+                pass
         return voices
 
     def list_voices(self) -> List[Dict[str, Any]]:
         return self._list_neural_voices()
 
     def _voice_supported_engines(self, voice_id: str) -> List[str]:
-        if voice_id in self._voice_engine_cache:
-            return self._voice_engine_cache[voice_id]
+        with self._voice_engine_cache_lock:
+            cached = self._voice_engine_cache.get(voice_id)
+            if cached is not None:
+                self._voice_engine_cache.move_to_end(voice_id)
+                return cached
         try:
             response = self.polly.describe_voices(VoiceId=voice_id)
         except (BotoCoreError, ClientError):
-            engines: List[str] = []
-        else:
-            voices = response.get("Voices", [])
-            engines = [engine.lower() for engine in (voices[0].get("SupportedEngines", []) if voices else [])]
-        self._voice_engine_cache[voice_id] = engines
+            # Don't pin a transient failure; the next rejection retries the lookup.
+            return []
+        voices = response.get("Voices", [])
+        engines = [engine.lower() for engine in (voices[0].get("SupportedEngines", []) if voices else [])]
+        with self._voice_engine_cache_lock:
+            self._voice_engine_cache[voice_id] = engines
+            self._voice_engine_cache.move_to_end(voice_id)
+            while len(self._voice_engine_cache) > self._VOICE_ENGINE_CACHE_MAX_ENTRIES:
+                self._voice_engine_cache.popitem(last=False)
         return engines
 
     @staticmethod
     def _sanitize_ssml_for_neural(ssml: str) -> str:
-        sanitized = re.sub(r"<\s*/?amazon:(?:effect|domain|auto-breaths)[^>]*>", "", ssml, flags=re.IGNORECASE)
-        sanitized = re.sub(r'rate="x-(fast|slow)"', r'rate="\1"', sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r'volume="x-(loud|soft)"', r'volume="\1"', sanitized, flags=re.IGNORECASE)
+        sanitized = AMAZON_TAG_RE.sub("", ssml)
+        sanitized = RATE_X_RE.sub(r'rate="\1"', sanitized)
+        sanitized = VOLUME_X_RE.sub(r'volume="\1"', sanitized)
 
         def _sanitize_rate_decimal(match: Match[str]) -> str:
             value = match.group(1)
@@ -581,8 +891,8 @@ class SyntheticVoiceoverService:
                 return f'rate="{percent}%"'
             return match.group(0)
 
-        sanitized = re.sub(r'rate="([0-9]*\.?[0-9]+)"', _sanitize_rate_decimal, sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r"<!--.*?-->", "", sanitized, flags=re.DOTALL)
+        sanitized = RATE_DECIMAL_RE.sub(_sanitize_rate_decimal, sanitized)
+        sanitized = COMMENT_RE.sub("", sanitized)
         return sanitized
 
     def _normalize_ssml(self, ssml: str) -> Tuple[str, bool, List[str]]:
@@ -595,13 +905,12 @@ class SyntheticVoiceoverService:
             notes.append("empty_input")
             return fallback, True, notes
 
-        new_candidate = re.sub(r"<\?xml[^>]*>", "", candidate, flags=re.IGNORECASE)
-        new_candidate = re.sub(r"<!DOCTYPE[^>]*>", "", new_candidate, flags=re.IGNORECASE)
+        new_candidate = XML_HEADER_RE.sub("", candidate)
         if new_candidate != candidate:
             notes.append("removed_xml_header")
             candidate = new_candidate.strip()
 
-        speak_match = re.search(r"<\s*speak\b[^>]*>(.*)</\s*speak\s*>", candidate, flags=re.IGNORECASE | re.DOTALL)
+        speak_match = SPEAK_BLOCK_RE.search(candidate)
         if speak_match:
             inner = speak_match.group(1)
             leading = candidate[: speak_match.start()].strip()
@@ -613,57 +922,52 @@ class SyntheticVoiceoverService:
             notes.append("wrapped_in_speak")
             candidate = f"<speak>{candidate}</speak>"
 
-        def _convert_break(match: Match[str]) -> str:
-            time_value = match.group(1)
-            suffix = match.group(2).lower()
-            if suffix == "ms":
-                return match.group(0)
-            try:
-                seconds = float(time_value)
-                millis = int(round(seconds * 1000))
-                return f'time="{millis}ms"'
-            except ValueError:
-                return match.group(0)
-
-        converted_candidate = re.sub(
-            r'time="([0-9]*\.?[0-9]+)(s|ms)"', _convert_break, candidate, flags=re.IGNORECASE
-        )
-        if converted_candidate != candidate:
-            notes.append("normalized_break_time")
-            candidate = converted_candidate
+        fixups: set[str] = set()
 
-        def _convert_rate(match: Match[str]) -> str:
-            value = match.group(1)
-            try:
-                numeric = float(value)
+        def _apply_fixup(match: Match[str]) -> str:
+            kind = match.lastgroup
+            original_text = match.group(0)
+            replacement = original_text
+            if kind == "amp":
+                replacement = "&amp;"
+            elif kind == "break":
+                if match.group("break_unit").lower() != "ms":
+                    try:
+                        replacement = f'time="{int(round(float(match.group("break_value")) * 1000))}ms"'
+                    except ValueError:
+                        pass
+            elif kind == "rate":
+                try:
+                    numeric = float(match.group("rate_value"))
+                except ValueError:
+                    numeric = 0.0
                 if 0 < numeric < 10:
-                    percent = int(round(numeric * 100))
-                    return f'rate="{percent}%"'
-            except ValueError:
-                pass
-            return match.group(0)
-
-        converted_rate = re.sub(r'rate="([0-9]*\.?[0-9]+)"', _convert_rate, candidate, flags=re.IGNORECASE)
-        if converted_rate != candidate:
-            notes.append("normalized_rate_decimal")
-            candidate = converted_rate
-
-        escaped_candidate = re.sub(r"&(?![a-zA-Z]+;|#\d+;|#x[0-9A-Fa-f]+;)", "&amp;", candidate)
-        if escaped_candidate != candidate:
-            notes.append("escaped_ampersands")
-            candidate = escaped_candidate
+                    replacement = f'rate="{int(round(numeric * 100))}%"'
+            if replacement != original_text:
+                fixups.add(kind)
+            return replacement
+
+        # Every fixup needs an '&' or an attribute value; plain narration skips the scan.
+        if "&" in candidate or '="' in candidate:
+            candidate = SSML_FIXUP_RE.sub(_apply_fixup, candidate)
+        for kind, note in (
+            ("break", "normalized_break_time"),
+            ("rate", "normalized_rate_decimal"),
+            ("amp", "escaped_ampersands"),
+        ):
+            if kind in fixups:
+                notes.append(note)
 
         inner_text = self._strip_ssml_tags(candidate)
         if not inner_text:
             notes.append("empty_after_strip")
             candidate = "<speak></speak>"
 
-        try:
-            from xml.etree import ElementTree as ET
-
-            ET.fromstring(candidate)
-        except ET.ParseError:
-            safe_text = html.escape(inner_text or "Narration coming up.")
+        # A body with no markup or entity references is well-formed by construction.
+        body = candidate[len("<speak>"):-len("</speak>")]
+        needs_parse = "<" in body or "&" in body
+        if needs_parse and not _is_well_formed_xml(candidate):
+            safe_text = (inner_text or "Narration coming up.").translate(HTML_ESCAPE_TRANS)
             candidate = f"<speak>{safe_text}</speak>"
             notes.append("parse_error_fallback")
 
@@ -676,6 +980,28 @@ class SyntheticVoiceoverService:
         "pcm": "audio/wav",
     }
 
+    _AUDIO_CHUNK_BYTES = 64 * 1024
+
+    def _call_polly(self, base: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+        """synthesize_speech with ``base`` request args, overriding only the given keys."""
+        return self.polly.synthesize_speech(**{**base, **overrides})
+
+    @staticmethod
+    def _aws_error_message(error: BaseException) -> str:
+        if isinstance(error, ClientError):
+            return error.response.get("Error", {}).get("Message", str(error))
+        return str(error)
+
+    def _audio_payload(
+        self, response: Optional[Dict[str, Any]], stream: bool
+    ) -> Optional[Union[bytes, Iterator[bytes]]]:
+        audio_stream = response.get("AudioStream") if response else None
+        if audio_stream is None:
+            return None
+        if stream:
+            return audio_stream.iter_chunks(chunk_size=self._AUDIO_CHUNK_BYTES)
+        return audio_stream.read()
+
     def synthesize_speech(
         self,
         *,
@@ -683,15 +1009,71 @@ class SyntheticVoiceoverService:
         ssml: str,
         output_format: str = "mp3",
         sample_rate: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], bytes]:
+        stream: bool = False,
+    ) -> Tuple[SynthesisMetadata, Union[bytes, Iterator[bytes]]]:
+        """Synthesize ``ssml`` with Polly, falling back through simpler inputs on rejection.
+
+        With ``stream=True`` the audio is returned as an iterator of chunks read
+        straight off Polly's response so callers can stream it without holding
+        the whole clip in memory.
+        """
         if not voice_id:
             raise ValueError("voiceId is required")
         if not ssml:
             raise ValueError("ssml content is required")
         fmt = output_format.lower()
-        if fmt not in self.AUDIO_MIME:
+        content_type = self.AUDIO_MIME.get(fmt)
+        if content_type is None:
             raise ValueError(f"Unsupported output format '{output_format}'")
+        if not self._cache_enabled:
+            return self._synthesize_speech_uncached(voice_id, ssml, fmt, content_type, sample_rate, stream)
+
+        # Normalization is deterministic, so the raw SSML identifies the request as well
+        # as the normalized form does, and a hit skips normalizing altogether.
+        speech_cache_key = self._speech_cache_key(voice_id, "neural", fmt, sample_rate, ssml)
+        cached_speech = self._speech_cache_get(speech_cache_key, fmt)
+        if cached_speech is not None:
+            cached_metadata, cached_audio = cached_speech
+            return replace(cached_metadata, cached=True), (iter((cached_audio,)) if stream else cached_audio)
+        if stream:
+            # Streamed audio is handed to the caller unread, so it is neither cached nor shared.
+            return self._synthesize_speech_uncached(voice_id, ssml, fmt, content_type, sample_rate, stream)
+
+        # Identical requests already in flight share one Polly synthesis instead of
+        # each paying for their own.
+        with self._inflight_lock:
+            pending = self._inflight_speech.get(speech_cache_key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight_speech[speech_cache_key] = Future()
+        if not owner:
+            shared_metadata, shared_audio = pending.result()
+            return replace(shared_metadata, coalesced=True), shared_audio
+
+        try:
+            result_metadata, audio_bytes = self._synthesize_speech_uncached(
+                voice_id, ssml, fmt, content_type, sample_rate, stream
+            )
+        except BaseException as exc:
+            with self._inflight_lock:
+                self._inflight_speech.pop(speech_cache_key, None)
+            pending.set_exception(exc)
+            raise
+        self._speech_cache_put(speech_cache_key, fmt, result_metadata, audio_bytes)
+        with self._inflight_lock:
+            self._inflight_speech.pop(speech_cache_key, None)
+        pending.set_result((result_metadata, audio_bytes))
+        return result_metadata, audio_bytes
 
+    def _synthesize_speech_uncached(
+        self,
+        voice_id: str,
+        ssml: str,
+        fmt: str,
+        content_type: str,
+        sample_rate: Optional[str],
+        stream: bool,
+    ) -> Tuple[SynthesisMetadata, Union[bytes, Iterator[bytes]]]:
         normalized_ssml, ssml_normalized, normalization_notes = self._normalize_ssml(ssml)
         original_plaintext = self._strip_ssml_tags(ssml)
 
@@ -719,7 +1101,7 @@ class SyntheticVoiceoverService:
         response: Optional[Dict[str, Any]] = None
         error_message: Optional[str] = None
 
-        audio_bytes: Optional[bytes] = None
+        audio_bytes: Optional[Union[bytes, Iterator[bytes]]] = None
 
         def _try_safe_minimal(engine_sequence: List[str]) -> bool:
             nonlocal response, engine_used, normalized_ssml, safe_minimal_used
@@ -729,106 +1111,91 @@ class SyntheticVoiceoverService:
             safe_candidate_text = (
                 original_plaintext or self._strip_ssml_tags(normalized_ssml) or "Narration coming up."
             )
-            safe_candidate = f"<speak><s>{html.escape(safe_candidate_text[:320])}</s></speak>"
-
-            attempted = False
-            for engine_option in engine_sequence:
-                safe_request = dict(request_args)
-                safe_request["Engine"] = engine_option
-                safe_request["Text"] = safe_candidate
-                safe_request["TextType"] = "ssml"
-                try:
-                    response = self.polly.synthesize_speech(**safe_request)
-                    engine_used = engine_option
-                    normalized_ssml = safe_candidate
-                    safe_minimal_used = True
-                    safe_minimal_ssml = safe_candidate
-                    safe_minimal_engine = engine_option
-                    safe_minimal_mode = "ssml"
-                    error_message = None
-                    audio_bytes = response.get("AudioStream").read() if response else None
-                    return audio_bytes is not None
-                except (BotoCoreError, ClientError):
-                    attempted = True
-                    continue
-
-            if attempted and not safe_minimal_used:
-                error_message = error_message or "Safe minimal SSML attempt failed."
+            safe_candidate = f"<speak><s>{safe_candidate_text[:320].translate(HTML_ESCAPE_TRANS)}</s></speak>"
 
-            for engine_option in engine_sequence:
-                text_request = dict(request_args)
-                text_request["Engine"] = engine_option
-                text_request["Text"] = safe_candidate_text
-                text_request["TextType"] = "text"
+            # Minimal SSML on each engine, then plain text as the final attempt.
+            for mode, engine_option in [(mode, engine) for mode in ("ssml", "text") for engine in engine_sequence]:
                 try:
-                    response = self.polly.synthesize_speech(**text_request)
-                    engine_used = engine_option
-                    safe_minimal_used = True
-                    safe_minimal_ssml = safe_candidate
-                    safe_minimal_engine = engine_option
-                    safe_minimal_mode = "text"
+                    response = self._call_polly(
+                        request_args,
+                        Engine=engine_option,
+                        Text=safe_candidate if mode == "ssml" else safe_candidate_text,
+                        TextType=mode,
+                    )
+                    audio_bytes = self._audio_payload(response, stream)
+                except (BotoCoreError, ClientError) as error:
+                    if _is_transient_polly_error(error):
+                        # botocore already backed off and retried this; more variants won't help.
+                        break
+                    continue
+                engine_used = engine_option
+                normalized_ssml = safe_candidate
+                safe_minimal_used = True
+                safe_minimal_ssml = safe_candidate
+                safe_minimal_engine = engine_option
+                safe_minimal_mode = mode
+                if mode == "text":
                     text_fallback_used = True
                     text_fallback_text = safe_candidate_text
-                    normalized_ssml = safe_candidate
-                    audio_bytes = response.get("AudioStream").read() if response else None
-                    error_message = None
-                    return audio_bytes is not None
-                except (BotoCoreError, ClientError):
-                    continue
+                error_message = None
+                return audio_bytes is not None
 
+            if engine_sequence:
+                error_message = error_message or "Safe minimal SSML attempt failed."
             return False
 
         try:
             response = self.polly.synthesize_speech(**request_args)
-            audio_bytes = response.get("AudioStream").read() if response else None
+            audio_bytes = self._audio_payload(response, stream)
         except (BotoCoreError, ClientError) as aws_error:
-            error_message = str(aws_error)
+            error_message = self._aws_error_message(aws_error)
             error_code = None
             if isinstance(aws_error, ClientError):
                 error_code = aws_error.response.get("Error", {}).get("Code")
-                error_message = aws_error.response.get("Error", {}).get("Message", error_message)
+            # Both InvalidSsmlException branches start from the same sanitized candidate.
+            sanitized_candidate = (
+                self._sanitize_ssml_for_neural(normalized_ssml)
+                if error_code == "InvalidSsmlException"
+                else normalized_ssml
+            )
 
             if error_code == "InvalidSsmlException" and "unsupported neural feature" in error_message.lower():
-                sanitized_candidate = self._sanitize_ssml_for_neural(normalized_ssml)
+                # Sanitized SSML on neural and the original SSML on standard do not depend on
+                # each other, so both go to Polly at once and the first accepted one wins.
+                has_standard = "standard" in self._voice_supported_engines(voice_id)
+                fallbacks: List[Tuple[str, Dict[str, Any]]] = []
                 if sanitized_candidate != normalized_ssml:
-                    try:
-                        request_args["Text"] = sanitized_candidate
-                        response = self.polly.synthesize_speech(**request_args)
+                    fallbacks.append(("sanitized", {**request_args, "Text": sanitized_candidate}))
+                if has_standard:
+                    fallbacks.append(("standard", {**request_args, "Engine": "standard"}))
+
+                winner, fallback_errors = self._first_successful_synthesis(fallbacks, stream)
+                if winner is not None:
+                    winner_label, response, audio_bytes = winner
+                    error_message = None
+                    if winner_label == "sanitized":
                         sanitized_used = True
                         sanitized_ssml = sanitized_candidate
-                        audio_bytes = response.get("AudioStream").read() if response else None
-                    except (BotoCoreError, ClientError) as retry_error:
-                        request_args["Text"] = normalized_ssml
-                        if isinstance(retry_error, ClientError):
-                            error_message = retry_error.response.get("Error", {}).get("Message", str(retry_error))
-                        else:
-                            error_message = str(retry_error)
                     else:
-                        error_message = None
-
-                if audio_bytes is None:
-                    supported_engines = self._voice_supported_engines(voice_id)
-                    if "standard" in supported_engines:
-                        fallback_args = dict(request_args)
-                        fallback_args["Engine"] = "standard"
                         engine_used = "standard"
-                        try:
-                            response = self.polly.synthesize_speech(**fallback_args)
-                            audio_bytes = response.get("AudioStream").read() if response else None
-                        except (BotoCoreError, ClientError) as fallback_error:
-                            fallback_msg = (
-                                fallback_error.response.get("Error", {}).get("Message", str(fallback_error))
-                                if isinstance(fallback_error, ClientError)
-                                else str(fallback_error)
-                            )
-                            engine_sequence = ["neural", "standard"]
-                            if not _try_safe_minimal(engine_sequence):
-                                raise RuntimeError(
-                                    "Voice synthesis failed: neural engine rejected SSML and standard fallback "
-                                    f"also failed ({fallback_msg})"
-                                ) from fallback_error
-                        else:
-                            error_message = None
+                else:
+                    sanitized_error = fallback_errors.get("sanitized")
+                    if sanitized_error is not None:
+                        error_message = self._aws_error_message(sanitized_error)
+                    if has_standard:
+                        engine_used = "standard"
+                        fallback_error = fallback_errors.get("standard")
+                        fallback_msg = (
+                            self._aws_error_message(fallback_error)
+                            if fallback_error is not None
+                            else "no audio stream received"
+                        )
+                        engine_sequence = ["neural", "standard"]
+                        if not _try_safe_minimal(engine_sequence):
+                            raise RuntimeError(
+                                "Voice synthesis failed: neural engine rejected SSML and standard fallback "
+                                f"also failed ({fallback_msg})"
+                            ) from fallback_error
                     else:
                         detail = (
                             "Voice does not support the standard engine and neural synthesis rejected SSML. "
@@ -840,48 +1207,40 @@ class SyntheticVoiceoverService:
                         if not _try_safe_minimal(engine_sequence):
                             raise RuntimeError(detail)
             elif error_code == "InvalidSsmlException":
-                sanitized_candidate = self._sanitize_ssml_for_neural(normalized_ssml)
                 if sanitized_candidate != normalized_ssml:
                     try:
-                        request_args["Text"] = sanitized_candidate
-                        response = self.polly.synthesize_speech(**request_args)
+                        response = self._call_polly(request_args, Text=sanitized_candidate)
                         sanitized_used = True
                         sanitized_ssml = sanitized_candidate
                         normalized_ssml = sanitized_candidate
-                        audio_bytes = response.get("AudioStream").read() if response else None
+                        audio_bytes = self._audio_payload(response, stream)
                         error_message = None
                     except (BotoCoreError, ClientError) as retry_error:
-                        request_args["Text"] = normalized_ssml
-                        error_message = (
-                            retry_error.response.get("Error", {}).get("Message", str(retry_error))
-                            if isinstance(retry_error, ClientError)
-                            else str(retry_error)
-                        )
+                        error_message = self._aws_error_message(retry_error)
 
                 if audio_bytes is None and error_message:
                     plain_text = self._strip_ssml_tags(normalized_ssml) or "Narration coming up."
-                    plain_candidate = f"<speak>{html.escape(plain_text)}</speak>"
-                    normalization_notes.append("plain_ssml_retry")
-                    try:
-                        request_args["Text"] = plain_candidate
-                        response = self.polly.synthesize_speech(**request_args)
-                        plain_retry_used = True
-                        plain_retry_ssml = plain_candidate
-                        normalized_ssml = plain_candidate
-                        audio_bytes = response.get("AudioStream").read() if response else None
-                        error_message = None
-                    except (BotoCoreError, ClientError) as plain_error:
-                        request_args["Text"] = normalized_ssml
-                        plain_text_payload = (
-                            self._strip_ssml_tags(normalized_ssml) or "Narration coming up."
-                        )
-                        text_args = dict(request_args)
-                        text_args["Text"] = plain_text_payload
-                        text_args["TextType"] = "text"
+                    plain_candidate = f"<speak>{plain_text.translate(HTML_ESCAPE_TRANS)}</speak>"
+                    # Polly just rejected normalized_ssml; when stripping its tags leaves the same
+                    # document, resending that as the "plain" retry is bound to fail the same way.
+                    if plain_candidate != normalized_ssml:
+                        normalization_notes.append("plain_ssml_retry")
+                        try:
+                            response = self._call_polly(request_args, Text=plain_candidate)
+                            plain_retry_used = True
+                            plain_retry_ssml = plain_candidate
+                            normalized_ssml = plain_candidate
+                            audio_bytes = self._audio_payload(response, stream)
+                            error_message = None
+                        except (BotoCoreError, ClientError):
+                            pass  # fall through to the text request below
+                    if not plain_retry_used:
+                        # normalized_ssml is unchanged on this path, so the stripped text is too.
+                        plain_text_payload = plain_text
                         try:
-                            response = self.polly.synthesize_speech(**text_args)
+                            response = self._call_polly(request_args, Text=plain_text_payload, TextType="text")
                             normalized_ssml = plain_candidate
-                            audio_bytes = response.get("AudioStream").read() if response else None
+                            audio_bytes = self._audio_payload(response, stream)
                             text_fallback_used = True
                             text_fallback_text = plain_text_payload
                             error_message = None
@@ -903,24 +1262,231 @@ class SyntheticVoiceoverService:
             if not _try_safe_minimal(engine_sequence):
                 raise RuntimeError("Failed to synthesize speech; no audio stream received")
 
-        result_metadata = {
-            "engine": engine_used,
-            "normalized": ssml_normalized,
-            "normalization_notes": normalization_notes,
-            "sanitized": sanitized_used,
-            "sanitized_ssml": sanitized_ssml,
-            "plain_retry": plain_retry_used,
-            "plain_retry_ssml": plain_retry_ssml,
-            "text_fallback": text_fallback_used,
-            "text_fallback_text": text_fallback_text,
-            "safe_minimal": safe_minimal_used,
-            "safe_minimal_ssml": safe_minimal_ssml,
-            "safe_minimal_engine": safe_minimal_engine,
-            "safe_minimal_mode": safe_minimal_mode,
-            "content_type": self.AUDIO_MIME[fmt],
-        }
+        result_metadata = SynthesisMetadata(
+            engine=engine_used,
+            normalized=ssml_normalized,
+            normalization_notes=normalization_notes,
+            sanitized=sanitized_used,
+            sanitized_ssml=sanitized_ssml,
+            plain_retry=plain_retry_used,
+            plain_retry_ssml=plain_retry_ssml,
+            text_fallback=text_fallback_used,
+            text_fallback_text=text_fallback_text,
+            safe_minimal=safe_minimal_used,
+            safe_minimal_ssml=safe_minimal_ssml,
+            safe_minimal_engine=safe_minimal_engine,
+            safe_minimal_mode=safe_minimal_mode,
+            content_type=content_type,
+        )
         return result_metadata, audio_bytes
 
+    def _first_successful_synthesis(
+        self, variants: List[Tuple[str, Dict[str, Any]]], stream: bool
+    ) -> Tuple[Optional[Tuple[str, Dict[str, Any], Any]], Dict[str, Exception]]:
+        """Send independent Polly requests concurrently; returns the first that yields audio.
+
+        The result is ``((label, response, audio), errors_by_label)`` with ``None`` in
+        place of the winner when every variant failed. Requests still queued once a
+        winner is found are cancelled; the audio streams of the others are closed so
+        their pooled connections are released.
+        """
+        errors: Dict[str, Exception] = {}
+        if not variants:
+            return None, errors
+
+        def _call(label: str, args: Dict[str, Any]) -> Tuple[str, Dict[str, Any], Any]:
+            response = self.polly.synthesize_speech(**args)
+            return label, response, self._audio_payload(response, stream)
+
+        def _close_loser(future: "Future[Tuple[str, Dict[str, Any], Any]]") -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            audio_stream = future.result()[1].get("AudioStream")
+            if audio_stream is not None:
+                audio_stream.close()
+
+        executor = ThreadPoolExecutor(max_workers=len(variants), thread_name_prefix="polly-fallback")
+        try:
+            futures = {executor.submit(_call, label, args): label for label, args in variants}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except (BotoCoreError, ClientError) as exc:
+                    errors[futures[future]] = exc
+                    continue
+                if result[2] is not None:
+                    for other in futures:
+                        if other is not future:
+                            other.add_done_callback(_close_loser)
+                    return result, errors
+            return None, errors
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit_synthesis(self, **kwargs: Any) -> "Future[Tuple[SynthesisMetadata, Union[bytes, Iterator[bytes]]]]":
+        """Run :meth:`synthesize_speech` on the shared worker pool.
+
+        The Polly call and every fallback block on network I/O; submitting them
+        keeps request threads (or an event loop, via ``asyncio.wrap_future``) free.
+        """
+        return _SYNTHESIS_POOL.submit(self.synthesize_speech, **kwargs)
+
+    def _speech_cache_dir(self) -> Path:
+        cache_dir = os.environ.get("VOICEOVER_CACHE_DIR") or Path.home() / ".cache" / "psl-media"
+        return Path(cache_dir) / "speech"
+
+    @staticmethod
+    def _speech_cache_key(
+        voice_id: str, engine: str, fmt: str, sample_rate: Optional[str], ssml: str
+    ) -> str:
+        # The engine is part of the key: the same SSML sounds different on neural and standard.
+        material = f"{voice_id}|{engine}|{fmt}|{sample_rate or ''}|{ssml}"
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _speech_cache_get(self, key: str, fmt: str) -> Optional[Tuple[SynthesisMetadata, bytes]]:
+        with self._speech_cache_lock:
+            cached = self._speech_cache.get(key)
+            if cached is not None:
+                self._speech_cache.move_to_end(key)
+                return cached
+
+        cache_dir = self._speech_cache_dir()
+        audio_path = cache_dir / f"{key}.{fmt}"
+        metadata_path = cache_dir / f"{key}.json"
+        try:
+            stored = json.loads(metadata_path.read_text(encoding="utf-8"))
+            metadata = SynthesisMetadata(
+                **{name: value for name, value in stored.items() if name in _SYNTHESIS_METADATA_FIELDS}
+            )
+            audio = audio_path.read_bytes()
+            # Bump recency of both files for size-based eviction.
+            os.utime(audio_path)
+            os.utime(metadata_path)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+        self._speech_cache_remember(key, metadata, audio)
+        return metadata, audio
+
+    def _speech_cache_put(self, key: str, fmt: str, metadata: SynthesisMetadata, audio: bytes) -> None:
+        self._speech_cache_remember(key, metadata, audio)
+        cache_dir = self._speech_cache_dir()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write under unique names, then rename so readers never see a partial file.
+            # Audio lands before its metadata, so a metadata hit always has audio.
+            for suffix, payload in ((fmt, audio), ("json", json.dumps(asdict(metadata)).encode("utf-8"))):
+                staging = cache_dir / f".{key}.{suffix}.{os.getpid()}.{threading.get_ident()}.tmp"
+                staging.write_bytes(payload)
+                os.replace(staging, cache_dir / f"{key}.{suffix}")
+        except (OSError, TypeError, ValueError):
+            return
+        self._prune_speech_cache_dir(cache_dir)
+
+    def _speech_cache_remember(self, key: str, metadata: SynthesisMetadata, audio: bytes) -> None:
+        # Blobs too big for the memory budget are served from the disk cache only.
+        if len(audio) > self._SPEECH_MEMORY_CACHE_MAX_BYTES:
+            return
+        with self._speech_cache_lock:
+            previous = self._speech_cache.pop(key, None)
+            if previous is not None:
+                self._speech_cache_bytes -= len(previous[1])
+            self._speech_cache[key] = (metadata, audio)
+            self._speech_cache_bytes += len(audio)
+            while (
+                len(self._speech_cache) > self._SPEECH_CACHE_MAX_ENTRIES
+                or self._speech_cache_bytes > self._SPEECH_MEMORY_CACHE_MAX_BYTES
+            ):
+                _key, (_metadata, evicted) = self._speech_cache.popitem(last=False)
+                self._speech_cache_bytes -= len(evicted)
+
+    def _prune_speech_cache_dir(self, cache_dir: Path) -> None:
+        entries: List[Tuple[float, int, str]] = []
+        total = 0
+        try:
+            with os.scandir(cache_dir) as scan:
+                for entry in scan:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+        if total <= self._SPEECH_CACHE_MAX_BYTES:
+            return
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= self._SPEECH_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+    # Later stream chunks are grouped up to roughly this size; the first is emitted
+    # as soon as it is well-formed so audio starts after one sentence.
+    _STREAM_CHUNK_MIN_CHARS = 400
+
+    def _ssml_stream_chunks(self, ssml: str) -> List[str]:
+        normalized_ssml, _, _ = self._normalize_ssml(ssml)
+        body = normalized_ssml[len("<speak>"):-len("</speak>")]
+        chunks: List[str] = []
+        pending = ""
+        for piece in SSML_CHUNK_BOUNDARY_RE.split(body):
+            pending = f"{pending} {piece}" if pending and not pending.endswith(">") else pending + piece
+            if chunks and len(pending) < self._STREAM_CHUNK_MIN_CHARS:
+                continue
+            # A piece may close an element opened several pieces back (e.g. a <prosody>
+            # spanning paragraphs); keep accumulating until the chunk stands alone.
+            candidate = f"<speak>{pending}</speak>"
+            if self._strip_ssml_tags(candidate) and _is_well_formed_xml(candidate):
+                chunks.append(candidate)
+                pending = ""
+        if pending.strip():
+            if chunks and not _is_well_formed_xml(f"<speak>{pending}</speak>"):
+                chunks[-1] = f"{chunks[-1][:-len('</speak>')]} {pending}</speak>"
+            else:
+                chunks.append(f"<speak>{pending}</speak>")
+        return chunks or [normalized_ssml]
+
+    def synthesize_speech_stream(
+        self,
+        *,
+        voice_id: str,
+        ssml: str,
+        output_format: str = "mp3",
+        sample_rate: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """Yield audio chunk by chunk, synthesizing later chunks while earlier ones play.
+
+        The SSML is split at sentence/paragraph boundaries into standalone documents
+        that are synthesized on a small pool and yielded in order, so the first bytes
+        arrive after the first sentence instead of the whole narration. MP3 and raw
+        PCM chunks concatenate directly.
+        """
+        chunks = self._ssml_stream_chunks(ssml)
+        executor = ThreadPoolExecutor(max_workers=min(4, len(chunks)), thread_name_prefix="polly-stream")
+        try:
+            futures = [
+                executor.submit(
+                    self.synthesize_speech,
+                    voice_id=voice_id,
+                    ssml=chunk,
+                    output_format=output_format,
+                    sample_rate=sample_rate,
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                _chunk_meta, audio = future.result()
+                yield audio
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def generate_voiceover(
         self,
         *,
@@ -949,6 +1515,6 @@ class SyntheticVoiceoverService:
         return {
             "ssml": ssml,
             "ssml_meta": ssml_meta,
-            "audio_meta": audio_meta,
+            "audio_meta": asdict(audio_meta),
             "audio_bytes": audio_bytes,
         }
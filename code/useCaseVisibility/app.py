@@ -1,10 +1,19 @@
+import hashlib
 import json
 import os
 import threading
 from datetime import datetime, timezone
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+try:
+    from waitress import serve
+except ImportError:  # pragma: no cover - optional dependency
+    serve = None
 
 app = Flask(__name__)
 CORS(app)
@@ -18,56 +27,109 @@ DEFAULT_VISIBILITY_FILE = os.getenv(
 _file_lock = threading.Lock()
 
 
+def _dumps_state(state: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2).encode('utf-8')
+
+
+def _dumps_body(state: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_state(raw: bytes):
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# Parsed state, its serialized response body and ETag, keyed by the file's mtime,
+# so GET /visibility costs a stat() until the file actually changes.
+_state_cache = {"mtime_ns": None, "value": None, "body": b"", "etag": ""}
+_state_cache_lock = threading.Lock()
+
+
 def _ensure_directory_exists(path: str) -> None:
     directory = os.path.dirname(path)
     if directory and not os.path.exists(directory):
         os.makedirs(directory, exist_ok=True)
 
 
+def _unique_ids(items) -> list:
+    """String IDs from ``items`` with duplicates dropped, first occurrence order kept."""
+    return list(dict.fromkeys(item for item in items if isinstance(item, str)))
+
+
+def _state_entry(mtime_ns, state: dict) -> dict:
+    body = _dumps_body(state)
+    return {
+        "mtime_ns": mtime_ns,
+        "value": state,
+        "body": body,
+        "etag": hashlib.blake2b(body, digest_size=8).hexdigest(),
+    }
+
+
+def _remember_state(mtime_ns: int, state: dict) -> dict:
+    entry = _state_entry(mtime_ns, state)
+    with _state_cache_lock:
+        _state_cache.update(entry)
+    return entry
+
+
 def _load_state() -> dict:
-    if not os.path.exists(DEFAULT_VISIBILITY_FILE):
-        return {"hidden": [], "updatedAt": None}
+    """Current state as a cache entry: ``value`` plus its response ``body`` and ``etag``."""
+    try:
+        mtime_ns = os.stat(DEFAULT_VISIBILITY_FILE).st_mtime_ns
+    except OSError:
+        return _state_entry(None, {"hidden": [], "updatedAt": None})
+
+    with _state_cache_lock:
+        if _state_cache["mtime_ns"] == mtime_ns:
+            return dict(_state_cache)
 
+    # Only the read needs the file lock; parsing happens outside it.
     try:
-        with _file_lock, open(DEFAULT_VISIBILITY_FILE, 'r', encoding='utf-8') as handle:
-            data = json.load(handle)
+        with _file_lock, open(DEFAULT_VISIBILITY_FILE, 'rb') as handle:
+            raw = handle.read()
+        data = _loads_state(raw)
     except (OSError, ValueError):
-        return {"hidden": [], "updatedAt": None}
+        return _state_entry(None, {"hidden": [], "updatedAt": None})
 
     hidden = data.get('hidden') or []
     if not isinstance(hidden, list):
         hidden = []
 
-    normalized = []
-    seen = set()
-    for item in hidden:
-        if isinstance(item, str):
-            if item not in seen:
-                normalized.append(item)
-                seen.add(item)
+    normalized = _unique_ids(hidden)
 
-    return {
+    state = {
         "hidden": normalized,
         "updatedAt": data.get('updatedAt')
     }
+    return _remember_state(mtime_ns, state)
 
 
 def _write_state(hidden_ids):
-    sanitized = []
-    seen = set()
-    for item in hidden_ids:
-        if isinstance(item, str) and item not in seen:
-            sanitized.append(item)
-            seen.add(item)
+    sanitized = _unique_ids(hidden_ids)
 
     state = {
         "hidden": sanitized,
         "updatedAt": datetime.now(timezone.utc).isoformat()
     }
 
+    payload = _dumps_state(state)
     _ensure_directory_exists(DEFAULT_VISIBILITY_FILE)
-    with _file_lock, open(DEFAULT_VISIBILITY_FILE, 'w', encoding='utf-8') as handle:
-        json.dump(state, handle, indent=2)
+    # Write and fsync a private temp file outside the lock, then swap it in with an
+    # atomic rename: readers never see a truncated file, and a crash mid-write
+    # leaves the previous state intact.
+    tmp_path = f"{DEFAULT_VISIBILITY_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    with _file_lock:
+        os.replace(tmp_path, DEFAULT_VISIBILITY_FILE)
+        _remember_state(os.stat(DEFAULT_VISIBILITY_FILE).st_mtime_ns, state)
 
     return state
 
@@ -83,7 +145,14 @@ def health_check():
 
 @app.get('/visibility')
 def get_visibility():
-    return jsonify(_load_state())
+    entry = _load_state()
+    # Polling clients that already hold this state get a bodyless 304.
+    if request.if_none_match.contains(entry["etag"]):
+        response = Response(status=304)
+    else:
+        response = Response(entry["body"], mimetype='application/json')
+    response.set_etag(entry["etag"])
+    return response
 
 
 @app.post('/visibility')
@@ -106,4 +175,8 @@ def update_visibility():
 
 if __name__ == '__main__':
     port = int(os.getenv('USECASE_VISIBILITY_PORT', '5012'))
-    app.run(host='0.0.0.0', port=port)
+    if serve is not None:
+        # Production WSGI server with a worker thread pool; the dev server is the fallback.
+        serve(app, host='0.0.0.0', port=port, threads=int(os.getenv('USECASE_VISIBILITY_THREADS', '8')))
+    else:
+        app.run(host='0.0.0.0', port=port, threaded=True)
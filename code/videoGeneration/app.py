@@ -4,26 +4,58 @@ Generates videos from text prompts and stores them in S3
 """
 
 import os
+import re
+import io
+import base64
+import random
+import hashlib
+import contextlib
 import uuid
 import logging
 import traceback
 import tempfile
 import subprocess
 import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional
 import json
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, redirect, Response
 from flask_cors import CORS
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from botocore.config import Config
 from shared.env_loader import load_environment
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+try:
+    from waitress import serve
+except ImportError:  # pragma: no cover - optional dependency
+    serve = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+# Request records, Bedrock bodies and ffprobe output go through orjson when it
+# is installed; the stdlib fallback produces the same UTF-8 bytes.
+if orjson is not None:
+    _json_dumps_bytes = orjson.dumps
+    _json_loads = orjson.loads
+else:  # pragma: no cover - optional dependency
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    _json_loads = json.loads
+
 app = Flask(__name__)
 CORS(app)
 
@@ -40,25 +72,97 @@ S3_BUCKET = os.getenv('VIDEO_GEN_S3_BUCKET', DEFAULT_MEDIA_BUCKET)
 if not S3_BUCKET:
     raise RuntimeError("Set VIDEO_GEN_S3_BUCKET or MEDIA_S3_BUCKET before starting video generation service")
 
-# Initialize AWS clients with conservative timeouts so startup doesn't hang
+# Initialize AWS clients with conservative timeouts so startup doesn't hang.
+# The upload, media, finalize and poller threads share these clients, so the
+# per-client connection pool is sized well above botocore's default of 10.
 AWS_CLIENT_CONFIG = Config(
     connect_timeout=int(os.getenv('AWS_CONNECT_TIMEOUT_SECONDS', '5')),
     read_timeout=int(os.getenv('AWS_READ_TIMEOUT_SECONDS', '30')),
-    retries={'max_attempts': int(os.getenv('AWS_MAX_ATTEMPTS', '3'))},
+    retries={
+        'max_attempts': int(os.getenv('AWS_MAX_ATTEMPTS', '3')),
+        'mode': os.getenv('AWS_RETRY_MODE', 'standard'),
+    },
+    max_pool_connections=int(os.getenv('AWS_MAX_POOL', '50')),
+    tcp_keepalive=True,
 )
 
-bedrock_runtime = boto3.client('bedrock-runtime', region_name=AWS_REGION, config=AWS_CLIENT_CONFIG)
-s3_client = boto3.client('s3', region_name=AWS_REGION, config=AWS_CLIENT_CONFIG)
+_aws_session = boto3.session.Session()
+bedrock_runtime = _aws_session.client('bedrock-runtime', region_name=AWS_REGION, config=AWS_CLIENT_CONFIG)
+s3_client = _aws_session.client('s3', region_name=AWS_REGION, config=AWS_CLIENT_CONFIG)
 POLLY_REGION = (os.getenv('POLLY_REGION') or AWS_REGION).strip()
-polly_client = boto3.client('polly', region_name=POLLY_REGION, config=AWS_CLIENT_CONFIG)
+polly_client = _aws_session.client('polly', region_name=POLLY_REGION, config=AWS_CLIENT_CONFIG)
+
+# Generated videos move to and from S3 as parallel 8 MB parts instead of one stream.
+_S3_MULTIPART_CHUNK_BYTES = 8 * 1024 * 1024
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_S3_MULTIPART_CHUNK_BYTES,
+    multipart_chunksize=_S3_MULTIPART_CHUNK_BYTES,
+    max_concurrency=int(os.getenv('VIDEO_GEN_S3_UPLOAD_CONCURRENCY', '10')),
+    use_threads=True,
+    io_chunksize=1024 * 1024,
+)
+# A muxed 6-second 720p clip is a few MB; below this it goes up as one PUT
+# instead of paying for multipart create/complete round-trips.
+_S3_SINGLE_PUT_MAX_BYTES = 16 * 1024 * 1024
+# Stamped on every muxed upload so later ensure-audio checks can answer from a
+# HEAD request instead of running ffprobe against the object.
+_MUXED_VIDEO_METADATA = {'has-audio': 'true'}
+
+
+def _upload_video_file(path: Path, bucket: str, key: str) -> None:
+    """Upload a local MP4, with a single MD5-checked PUT when it is small."""
+    if path.stat().st_size >= _S3_SINGLE_PUT_MAX_BYTES:
+        s3_client.upload_file(
+            str(path),
+            bucket,
+            key,
+            ExtraArgs={'ContentType': 'video/mp4', 'Metadata': _MUXED_VIDEO_METADATA},
+            Config=_S3_TRANSFER_CONFIG,
+        )
+        return
+    with open(path, 'rb') as body:
+        digest = hashlib.md5(usedforsecurity=False)
+        for chunk in iter(lambda: body.read(1024 * 1024), b''):
+            digest.update(chunk)
+        body.seek(0)
+        s3_client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=body,
+            ContentType='video/mp4',
+            Metadata=_MUXED_VIDEO_METADATA,
+            ContentMD5=base64.b64encode(digest.digest()).decode('ascii'),
+        )
+
 
-# In-memory storage for generation history
-GENERATION_HISTORY = []
+# In-memory generation history keyed by id, oldest first; capped so a long-running
+# service doesn't grow without bound. Entries are also written through to a
+# SQLite file so they survive restarts (see _open_history_db).
+GENERATION_HISTORY: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+MAX_HISTORY = int(os.getenv('VIDEO_GEN_MAX_HISTORY', '500'))
+_history_lock = threading.Lock()
+# Entries still waiting on Bedrock, so the status poller doesn't scan the whole history.
+_PENDING_GENERATIONS: Dict[str, Dict[str, Any]] = {}
+# format_history_entry output per id, tagged with the entry revision it was built
+# from; every history write bumps the revision so stale copies are never served.
+_HISTORY_REVISIONS: Dict[str, int] = {}
+_FORMATTED_HISTORY: Dict[str, tuple[tuple[int, int], Dict[str, Any]]] = {}
+# Completed/failed entries read back from disk; they no longer change on their
+# own, so repeat status checks skip the SQLite read and JSON decode.
+_TERMINAL_DISK_ENTRIES: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+VIDEO_GEN_HISTORY_DB = os.getenv('VIDEO_GEN_HISTORY_DB', '/var/lib/video_gen/history.db').strip()
+# Completed/failed rows older than this are dropped from the database at startup;
+# 0 keeps them forever.
+VIDEO_GEN_HISTORY_RETENTION_DAYS = float(os.getenv('VIDEO_GEN_HISTORY_RETENTION_DAYS', '0'))
 MAX_REFERENCE_IMAGES = int(os.getenv('VIDEO_GEN_MAX_REFERENCE_IMAGES', '4'))
+# Reference images go to S3 in parallel, one worker per allowed image.
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=max(1, MAX_REFERENCE_IMAGES), thread_name_prefix='video-gen-upload')
 REFERENCE_URL_TTL = int(os.getenv('VIDEO_GEN_REFERENCE_TTL_SECONDS', str(3600 * 24 * 7)))
 DEFAULT_VIDEO_DURATION = int(os.getenv('VIDEO_GEN_DEFAULT_DURATION', '6'))
 MIN_VIDEO_DURATION = int(os.getenv('VIDEO_GEN_MIN_DURATION', '3'))
 MAX_VIDEO_DURATION = int(os.getenv('VIDEO_GEN_MAX_DURATION', '6'))
+# Nova Reel seeds must be in [0, 2147483646].
+_SEED_RNG = random.Random()
 
 # Audio handling
 VIDEO_GEN_ENSURE_AUDIO = os.getenv('VIDEO_GEN_ENSURE_AUDIO', '1') not in {'0', 'false', 'False'}
@@ -94,28 +198,53 @@ FFMPEG_BIN = os.getenv('VIDEO_GEN_FFMPEG') or _which('ffmpeg')
 FFPROBE_BIN = os.getenv('VIDEO_GEN_FFPROBE') or _which('ffprobe')
 
 
-def _probe_has_audio(video_path: Path) -> bool:
-    """Return True if the media file has at least one audio stream."""
+def _scratch_root() -> str | None:
+    # Intermediate MP4/MP3 files are written, read back and deleted within one
+    # request, so keep them on tmpfs when it is available.
+    candidate = os.getenv('VIDEO_GEN_TMPDIR', '/dev/shm').strip()
+    if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK | os.X_OK):
+        return candidate
+    return None
+
+
+VIDEO_GEN_TMPDIR = _scratch_root()
+
+
+def _probe_audio_and_duration(video_path: Path | str) -> tuple[bool, Optional[float]]:
+    """Return (has_audio, duration_seconds) from a single ffprobe run.
+
+    If the file can't be probed, it is reported as having no audio (so audio
+    gets added) and an unknown duration.
+    """
     if not FFPROBE_BIN:
-        # If we can't probe, assume no audio and fall back to adding it.
-        return False
+        return False, None
     cmd = [
         FFPROBE_BIN,
         '-v', 'error',
         '-select_streams', 'a',
-        '-show_entries', 'stream=codec_name',
-        '-of', 'csv=p=0',
+        '-show_entries', 'stream=codec_name:format=duration',
+        '-of', 'json',
         str(video_path)
     ]
     try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True).strip()
-        return bool(out)
+        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+        probe = _json_loads(out or '{}')
     except subprocess.CalledProcessError as exc:
         app.logger.warning('ffprobe failed when checking audio streams: %s', exc.output)
-        return False
+        return False, None
+    except ValueError as exc:
+        app.logger.warning('ffprobe returned unparseable output: %s', exc)
+        return False, None
 
+    has_audio = bool(probe.get('streams'))
+    try:
+        duration = float((probe.get('format') or {})['duration'])
+    except (KeyError, TypeError, ValueError):
+        duration = None
+    return has_audio, duration
 
-def _probe_duration_seconds(video_path: Path) -> Optional[float]:
+
+def _probe_duration_seconds(video_path: Path | str) -> Optional[float]:
     """Return the duration in seconds if available."""
     if not FFPROBE_BIN:
         return None
@@ -154,8 +283,9 @@ def _synthesize_voiceover_mp3(text: str, output_path: Path, *, voice_id: str) ->
     if not stream:
         raise RuntimeError('Polly did not return an AudioStream')
 
-    with open(output_path, 'wb') as f:
-        f.write(stream.read())
+    # Copy in fixed-size chunks rather than holding the whole MP3 in memory.
+    with contextlib.closing(stream) as audio, open(output_path, 'wb') as f:
+        shutil.copyfileobj(audio, f, 64 * 1024)
 
 
 def _default_voiceover_text_from_prompt(prompt: str) -> str:
@@ -171,10 +301,48 @@ def _default_voiceover_text_from_prompt(prompt: str) -> str:
     return cleaned
 
 
-def _extract_bedrock_text(payload: Any) -> Optional[str]:
-    """Best-effort extraction of text from various Bedrock model response shapes."""
+# Response shape per model family, so the configured model's text is read directly
+# instead of probing every known key. Matched by id prefix after any
+# cross-region inference-profile prefix ("us.", "eu.", ...).
+_BEDROCK_TEXT_EXTRACTORS: tuple[tuple[str, Callable[[Dict[str, Any]], Any]], ...] = (
+    ('meta.llama', lambda p: p['generation']),
+    ('anthropic.claude', lambda p: p['content'][0]['text']),
+    ('amazon.nova', lambda p: p['output']['message']['content'][0]['text']),
+    ('amazon.titan-text', lambda p: p['results'][0]['outputText']),
+    ('mistral.', lambda p: p['outputs'][0]['text']),
+)
+_INFERENCE_PROFILE_PREFIXES = {'us', 'eu', 'apac', 'global'}
+
+
+def _bedrock_text_extractor(model_id: str) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    region, _, rest = model_id.partition('.')
+    base_id = rest if region in _INFERENCE_PROFILE_PREFIXES else model_id
+    for prefix, extractor in _BEDROCK_TEXT_EXTRACTORS:
+        if base_id.startswith(prefix):
+            return extractor
+    return None
+
+
+_AD_VOICEOVER_TEXT_EXTRACTOR = _bedrock_text_extractor(VIDEO_GEN_AD_VOICEOVER_MODEL_ID)
+
+
+def _extract_bedrock_text(
+    payload: Any, extractor: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> Optional[str]:
+    """Best-effort extraction of text from various Bedrock model response shapes.
+
+    ``extractor`` reads the model family's known shape first; anything it can't
+    find falls through to the generic key probe.
+    """
     if isinstance(payload, str):
         return payload.strip() or None
+    if extractor is not None and isinstance(payload, dict):
+        try:
+            val = extractor(payload)
+        except (KeyError, IndexError, TypeError):
+            val = None
+        if isinstance(val, str) and val.strip():
+            return val.strip()
     if isinstance(payload, dict):
         for key in ('generation', 'output', 'text', 'completion'):
             val = payload.get(key)
@@ -191,30 +359,30 @@ def _extract_bedrock_text(payload: Any) -> Optional[str]:
     return None
 
 
+# Code fences become a space and stray backticks vanish, in one scan of the text.
+_VO_BACKTICKS_RE = re.compile(r'(```)|`')
+VIDEO_GEN_AD_VOICEOVER_MAX_WORDS = int(os.getenv('VIDEO_GEN_AD_VOICEOVER_MAX_WORDS', '35'))
+
+
 def _clean_ad_voiceover_text(text: str) -> str:
     cleaned = (text or '').strip()
     if not cleaned:
         return ''
 
     # Remove common markdown/code-fence artifacts.
-    cleaned = cleaned.replace('```', ' ')
-    cleaned = cleaned.replace('`', '')
+    cleaned = _VO_BACKTICKS_RE.sub(lambda m: ' ' if m.group(1) else '', cleaned)
 
     # Strip surrounding quotes.
     if (cleaned.startswith('"') and cleaned.endswith('"')) or (cleaned.startswith("'") and cleaned.endswith("'")):
-        cleaned = cleaned[1:-1].strip()
+        cleaned = cleaned[1:-1]
 
-    # Collapse whitespace.
-    cleaned = ' '.join(cleaned.replace('\n', ' ').split())
-
-    # Enforce a max word count (approx. 35 words) for ad-style VO.
-    max_words = int(os.getenv('VIDEO_GEN_AD_VOICEOVER_MAX_WORDS', '35'))
-    if max_words > 0:
-        words = cleaned.split()
-        if len(words) > max_words:
-            cleaned = ' '.join(words[:max_words]).rstrip(' ,;:.') + '…'
-
-    return cleaned
+    # Collapse whitespace and enforce a max word count (approx. 35 words) for
+    # ad-style VO from the same split.
+    words = cleaned.split()
+    max_words = VIDEO_GEN_AD_VOICEOVER_MAX_WORDS
+    if max_words > 0 and len(words) > max_words:
+        return ' '.join(words[:max_words]).rstrip(' ,;:.') + '…'
+    return ' '.join(words)
 
 
 def _generate_ad_voiceover_from_prompt(prompt: str) -> str:
@@ -223,10 +391,21 @@ def _generate_ad_voiceover_from_prompt(prompt: str) -> str:
     if not VIDEO_GEN_AD_VOICEOVER_ENABLED:
         return fallback
 
-    cleaned_prompt = (prompt or '').strip()
+    # Retries and re-submits differ at most in whitespace, so they share a cache entry.
+    cleaned_prompt = ' '.join((prompt or '').split())
     if not cleaned_prompt:
         return VIDEO_GEN_DEFAULT_VOICEOVER_TEXT
 
+    try:
+        return _generate_ad_voiceover_cached(cleaned_prompt)
+    except Exception as exc:
+        app.logger.warning('Ad voiceover generation failed; falling back to prompt text: %s', exc)
+        return fallback
+
+
+@lru_cache(maxsize=int(os.getenv('VIDEO_GEN_AD_VOICEOVER_CACHE_SIZE', '512')))
+def _generate_ad_voiceover_cached(cleaned_prompt: str) -> str:
+    # Raises instead of returning the fallback so lru_cache only pins real generations.
     instruction = (
         "You are a creative advertising copywriter.\n"
         "Write a short voiceover script for an advertisement based on the video concept below.\n"
@@ -239,92 +418,232 @@ def _generate_ad_voiceover_from_prompt(prompt: str) -> str:
         f"Video concept: {cleaned_prompt}\n"
     )
 
+    resp = bedrock_runtime.invoke_model(
+        modelId=VIDEO_GEN_AD_VOICEOVER_MODEL_ID,
+        body=_json_dumps_bytes({
+            'prompt': instruction,
+            'max_gen_len': VIDEO_GEN_AD_VOICEOVER_MAX_GEN_LEN,
+            'temperature': VIDEO_GEN_AD_VOICEOVER_TEMPERATURE,
+            'top_p': 0.9,
+        })
+    )
+    raw = resp.get('body').read() if isinstance(resp, dict) and resp.get('body') else None
+    if not raw:
+        raise ValueError('empty Bedrock response body')
+    parsed = _json_loads(raw)
+    text = _extract_bedrock_text(parsed, _AD_VOICEOVER_TEXT_EXTRACTOR) or ''
+    text = _clean_ad_voiceover_text(text)
+    if not text:
+        raise ValueError('Bedrock response contained no voiceover text')
+
+    # Enforce a hard char cap for Polly and UX.
+    if VIDEO_GEN_AD_VOICEOVER_MAX_CHARS > 0 and len(text) > VIDEO_GEN_AD_VOICEOVER_MAX_CHARS:
+        text = text[: VIDEO_GEN_AD_VOICEOVER_MAX_CHARS - 1].rstrip() + '…'
+    return text
+
+
+# Remuxed videos can stream straight from S3 through ffmpeg and back to S3 without
+# touching local disk; set to 0 to download, remux locally and re-upload instead.
+VIDEO_GEN_STREAM_REMUX = os.getenv('VIDEO_GEN_STREAM_REMUX', '1') not in {'0', 'false', 'False'}
+
+# A piped MP4 can't be rewritten in place for +faststart, so streamed output is
+# fragmented: an empty moov up front, media fragments written as they are produced.
+_FRAGMENTED_MP4_FLAGS = ('-movflags', '+frag_keyframe+empty_moov+default_base_moof')
+
+
+# ffmpeg only writes to stderr when something goes wrong, so successful runs
+# don't buffer the banner and per-frame progress lines.
+_FFMPEG_QUIET_FLAGS = ('-hide_banner', '-nostats', '-loglevel', 'error')
+
+
+def _run_ffmpeg(cmd: List[str]) -> None:
+    """Run an ffmpeg command that writes to a file, raising CalledProcessError on failure."""
+    cmd = [cmd[0], *_FFMPEG_QUIET_FLAGS, *cmd[1:]]
+    result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        stderr = result.stderr.decode('utf-8', errors='replace').strip()
+        app.logger.error('ffmpeg exited with %s: %s', result.returncode, stderr[-2000:])
+        raise subprocess.CalledProcessError(result.returncode, cmd, stderr=result.stderr)
+
+
+class _FfmpegStdout(io.RawIOBase):
+    """ffmpeg's stdout as a readable stream that fails at EOF if ffmpeg failed.
+
+    Raising from read() makes the S3 transfer abort instead of completing the
+    upload with a truncated video.
+    """
+
+    def __init__(self, proc: subprocess.Popen, cmd: List[str], stderr_file: Any) -> None:
+        self._proc = proc
+        self._cmd = cmd
+        self._stderr_file = stderr_file
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._proc.stdout.read(size)
+        if not chunk:
+            returncode = self._proc.wait()
+            if returncode != 0:
+                self._stderr_file.seek(0)
+                raise subprocess.CalledProcessError(returncode, self._cmd, stderr=self._stderr_file.read())
+        return chunk
+
+
+def _stream_ffmpeg_to_s3(cmd: List[str], bucket: str, key: str) -> None:
+    """Run ffmpeg with its MP4 output on stdout, uploading it to S3 as it is produced."""
+    cmd = [cmd[0], *_FFMPEG_QUIET_FLAGS, *cmd[1:]]
+    with tempfile.TemporaryFile(dir=VIDEO_GEN_TMPDIR) as stderr_file:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            s3_client.upload_fileobj(
+                _FfmpegStdout(proc, cmd, stderr_file),
+                bucket,
+                key,
+                ExtraArgs={'ContentType': 'video/mp4', 'Metadata': _MUXED_VIDEO_METADATA},
+                Config=_S3_TRANSFER_CONFIG,
+            )
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            proc.stdout.close()
+
+
+# Tone/silence tracks depend only on the audio settings and the clip length, so
+# each is AAC-encoded once and later muxes stream-copy it.
+_FILLER_AUDIO_CACHE_DIR = Path(tempfile.gettempdir()) / 'video_gen_filler_audio'
+
+
+def _encoded_filler_audio(audio_filter: str, duration_seconds: float) -> Optional[Path]:
+    """Return an AAC (.m4a) rendering of a lavfi ``audio_filter``, encoding it on first use."""
+    digest = hashlib.blake2b(audio_filter.encode('utf-8'), digest_size=8).hexdigest()
+    cached = _FILLER_AUDIO_CACHE_DIR / f'{digest}_{duration_seconds:.3f}.m4a'
+    if cached.exists():
+        return cached
     try:
-        resp = bedrock_runtime.invoke_model(
-            modelId=VIDEO_GEN_AD_VOICEOVER_MODEL_ID,
-            body=json.dumps({
-                'prompt': instruction,
-                'max_gen_len': VIDEO_GEN_AD_VOICEOVER_MAX_GEN_LEN,
-                'temperature': VIDEO_GEN_AD_VOICEOVER_TEMPERATURE,
-                'top_p': 0.9,
-            })
-        )
-        raw = resp.get('body').read() if isinstance(resp, dict) and resp.get('body') else None
-        if not raw:
-            return fallback
-        parsed = json.loads(raw)
-        text = _extract_bedrock_text(parsed) or ''
-        text = _clean_ad_voiceover_text(text)
-        if not text:
-            return fallback
-
-        # Enforce a hard char cap for Polly and UX.
-        if VIDEO_GEN_AD_VOICEOVER_MAX_CHARS > 0 and len(text) > VIDEO_GEN_AD_VOICEOVER_MAX_CHARS:
-            text = text[: VIDEO_GEN_AD_VOICEOVER_MAX_CHARS - 1].rstrip() + '…'
-        return text
-    except Exception as exc:
-        app.logger.warning('Ad voiceover generation failed; falling back to prompt text: %s', exc)
-        return fallback
+        _FILLER_AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        staging = cached.with_name(f'.{cached.stem}.{os.getpid()}.{threading.get_ident()}.m4a')
+        _run_ffmpeg([
+            FFMPEG_BIN,
+            '-y',
+            '-f', 'lavfi',
+            '-i', audio_filter,
+            '-t', f'{duration_seconds:.3f}',
+            '-c:a', 'aac',
+            str(staging),
+        ])
+        os.replace(staging, cached)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        app.logger.warning('Unable to pre-encode filler audio; encoding inline instead: %s', exc)
+        return None
+    return cached
+
+
+# Polly narration is synthesized here while the video is downloaded/probed.
+_MEDIA_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv('VIDEO_GEN_MEDIA_WORKERS', '4')),
+    thread_name_prefix='video-gen-media',
+)
+
+
+def _voiceover_settings(
+    kind: str, voiceover_text: Optional[str], voice_id: Optional[str]
+) -> Optional[tuple[str, str]]:
+    """Return the (text, voice_id) to narrate with, or None when the track isn't a voiceover."""
+    if not ((voiceover_text or '').strip() or kind == 'voiceover'):
+        return None
+    final_voice_id = (voice_id or VIDEO_GEN_VOICEOVER_VOICE_ID).strip() or VIDEO_GEN_VOICEOVER_VOICE_ID
+    final_text = (voiceover_text or VIDEO_GEN_DEFAULT_VOICEOVER_TEXT).strip() or VIDEO_GEN_DEFAULT_VOICEOVER_TEXT
+    return final_text, final_voice_id
+
+
+def _start_voiceover_synthesis(directory: Path, text: str, voice_id: str) -> "Future[Path]":
+    """Synthesize ``text`` to ``directory``/voiceover.mp3 on the media pool."""
+    mp3_path = directory / 'voiceover.mp3'
+
+    def _synthesize() -> Path:
+        _synthesize_voiceover_mp3(text, mp3_path, voice_id=voice_id)
+        return mp3_path
+
+    return _MEDIA_POOL.submit(_synthesize)
 
 
 def _mux_generated_audio(
-    input_path: Path,
-    output_path: Path,
+    input_path: Path | str,
+    output_path: Optional[Path],
     *,
     kind: str,
     voiceover_text: Optional[str] = None,
     voice_id: Optional[str] = None,
+    duration_seconds: Optional[float] = None,
+    scratch_dir: Path,
+    upload_to: Optional[tuple[str, str]] = None,
+    voiceover_mp3: Optional["Future[Path]"] = None,
 ) -> str:
     """Mux a generated audio track (tone, silence, or Polly voiceover) into an existing video file.
 
+    ``input_path`` may be a local path or a URL ffmpeg can read. With ``upload_to``
+    set to ``(bucket, key)`` the result is streamed to S3 instead of written to
+    ``output_path``. ``duration_seconds`` skips probing the input again when the
+    caller already knows it, and ``voiceover_mp3`` is a narration synthesis the
+    caller already started. Intermediate files go in the caller's ``scratch_dir``.
     Returns the effective kind used (may fall back to tone on failures).
     """
     if not FFMPEG_BIN:
         raise RuntimeError('ffmpeg is required to add audio to generated videos. Ensure ffmpeg is on PATH.')
 
-    requested_voiceover = bool((voiceover_text or '').strip())
+    def _run(cmd: List[str]) -> None:
+        if upload_to:
+            _stream_ffmpeg_to_s3(cmd + [*_FRAGMENTED_MP4_FLAGS, '-f', 'mp4', 'pipe:1'], *upload_to)
+        else:
+            _run_ffmpeg(cmd + ['-movflags', '+faststart', str(output_path)])
+
+    voiceover = _voiceover_settings(kind, voiceover_text, voice_id)
     effective_kind = kind
-    duration_seconds = _probe_duration_seconds(input_path)
 
     # Voiceover path: generate an MP3 via Polly and pad it so the output keeps the full video duration.
-    if requested_voiceover or kind == 'voiceover':
+    if voiceover is not None:
         effective_kind = 'voiceover'
-        final_voice_id = (voice_id or VIDEO_GEN_VOICEOVER_VOICE_ID).strip() or VIDEO_GEN_VOICEOVER_VOICE_ID
-        final_text = (voiceover_text or VIDEO_GEN_DEFAULT_VOICEOVER_TEXT).strip() or VIDEO_GEN_DEFAULT_VOICEOVER_TEXT
+        # Polly and the duration probe are independent, so they overlap.
+        if voiceover_mp3 is None:
+            voiceover_mp3 = _start_voiceover_synthesis(scratch_dir, *voiceover)
+        if duration_seconds is None:
+            duration_seconds = _probe_duration_seconds(input_path)
 
         if duration_seconds is None:
             app.logger.warning('Unable to determine video duration; falling back to tone audio')
             effective_kind = 'tone'
+            voiceover_mp3.cancel()
         else:
-            with tempfile.TemporaryDirectory(prefix='video_gen_voiceover_') as tmpdir:
-                mp3_path = Path(tmpdir) / 'voiceover.mp3'
-                _synthesize_voiceover_mp3(final_text, mp3_path, voice_id=final_voice_id)
-
-                # Pad audio so we don't truncate the video if voiceover is shorter than the video.
-                volume_db = VIDEO_GEN_VOICEOVER_VOLUME_DB
-                if volume_db == 0:
-                    audio_filter_complex = '[1:a]apad[a]'
-                else:
-                    audio_filter_complex = f'[1:a]volume={volume_db}dB,apad[a]'
-
-                cmd = [
-                    FFMPEG_BIN,
-                    '-y',
-                    '-i', str(input_path),
-                    '-i', str(mp3_path),
-                    '-filter_complex', audio_filter_complex,
-                    '-map', '0:v:0',
-                    '-map', '[a]',
-                    '-t', f'{duration_seconds:.3f}',
-                    '-c:v', 'copy',
-                    '-c:a', 'aac',
-                    '-movflags', '+faststart',
-                    str(output_path)
-                ]
-                subprocess.run(cmd, check=True, capture_output=True)
-                return effective_kind
+            mp3_path = voiceover_mp3.result()
+
+            # Pad audio so we don't truncate the video if voiceover is shorter than the video.
+            volume_db = VIDEO_GEN_VOICEOVER_VOLUME_DB
+            if volume_db == 0:
+                audio_filter_complex = '[1:a]apad[a]'
+            else:
+                audio_filter_complex = f'[1:a]volume={volume_db}dB,apad[a]'
+
+            cmd = [
+                FFMPEG_BIN,
+                '-y',
+                '-i', str(input_path),
+                '-i', str(mp3_path),
+                '-filter_complex', audio_filter_complex,
+                '-map', '0:v:0',
+                '-map', '[a]',
+                '-t', f'{duration_seconds:.3f}',
+                '-c:v', 'copy',
+                '-c:a', 'aac',
+            ]
+            _run(cmd)
+            return effective_kind
 
     # Tone/silence path (lavfi). Using -t keeps output aligned to the video.
+    if duration_seconds is None and voiceover is None:
+        duration_seconds = _probe_duration_seconds(input_path)
     if effective_kind == 'silence':
         audio_filter = f"anullsrc=channel_layout={VIDEO_GEN_AUDIO_CHANNEL_LAYOUT}:sample_rate={VIDEO_GEN_AUDIO_SAMPLE_RATE}"
     else:
@@ -333,6 +652,22 @@ def _mux_generated_audio(
             f",volume={VIDEO_GEN_AUDIO_TONE_VOLUME_DB}dB"
         )
 
+    filler_path = _encoded_filler_audio(audio_filter, duration_seconds) if duration_seconds is not None else None
+    if filler_path is not None:
+        # Both streams are copied, so this ffmpeg run is a pure container remux.
+        _run([
+            FFMPEG_BIN,
+            '-y',
+            '-i', str(input_path),
+            '-i', str(filler_path),
+            '-map', '0:v:0',
+            '-map', '1:a:0',
+            '-c:v', 'copy',
+            '-c:a', 'copy',
+            '-t', f'{duration_seconds:.3f}',
+        ])
+        return effective_kind
+
     cmd = [
         FFMPEG_BIN,
         '-y',
@@ -343,7 +678,6 @@ def _mux_generated_audio(
         '-map', '1:a:0',
         '-c:v', 'copy',
         '-c:a', 'aac',
-        '-movflags', '+faststart',
     ]
 
     if duration_seconds is not None:
@@ -351,11 +685,79 @@ def _mux_generated_audio(
     else:
         cmd.append('-shortest')
 
-    cmd.append(str(output_path))
-    subprocess.run(cmd, check=True, capture_output=True)
+    _run(cmd)
     return effective_kind
 
 
+def _stream_remux_s3_video(
+    bucket: str,
+    key: str,
+    *,
+    force: bool,
+    voiceover_text: Optional[str],
+    voice_id: Optional[str],
+    scratch_dir: Path,
+    voiceover_mp3: Optional["Future[Path]"] = None,
+    known_duration: Optional[float] = None,
+    output_key: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Remux straight from a presigned URL back into S3, overlapping download, mux and upload.
+
+    Returns None when ffprobe couldn't read the URL (e.g. an ffmpeg build without
+    HTTPS), so the caller can fall back to a local download. ``known_duration``
+    marks the video as known to be silent and skips the probe. The result goes to
+    ``output_key`` when given, otherwise it replaces ``key``.
+    """
+    source_url = s3_client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket, 'Key': key},
+        ExpiresIn=3600,
+    )
+    duration_seconds = known_duration
+    if duration_seconds is None:
+        has_audio, duration_seconds = _probe_audio_and_duration(source_url)
+        if duration_seconds is None:
+            return None
+        if (not force) and has_audio:
+            return {"changed": False, "kind": VIDEO_GEN_AUDIO_KIND}
+
+    if force:
+        app.logger.info('Force remux audio for %s/%s (kind=%s)', bucket, key, VIDEO_GEN_AUDIO_KIND)
+    else:
+        app.logger.info('No audio stream detected for %s/%s; muxing audio (kind=%s)', bucket, key, VIDEO_GEN_AUDIO_KIND)
+
+    # The object is only replaced when the upload completes, after ffmpeg has
+    # finished reading the original through the presigned URL.
+    try:
+        effective_kind = _mux_generated_audio(
+            source_url,
+            None,
+            kind=VIDEO_GEN_AUDIO_KIND,
+            voiceover_text=voiceover_text,
+            voice_id=voice_id,
+            duration_seconds=duration_seconds,
+            scratch_dir=scratch_dir,
+            upload_to=(bucket, output_key or key),
+            voiceover_mp3=voiceover_mp3,
+        )
+    except subprocess.CalledProcessError:
+        if known_duration is None:
+            raise
+        # Without the probe nothing has shown that ffmpeg can read the URL.
+        return None
+    return {"changed": True, "kind": effective_kind}
+
+
+def _s3_video_marked_with_audio(bucket: str, key: str) -> bool:
+    """True if the object was written by one of our muxes (see _MUXED_VIDEO_METADATA)."""
+    try:
+        head = s3_client.head_object(Bucket=bucket, Key=key)
+    except ClientError as exc:
+        app.logger.warning('HEAD failed for %s/%s; probing instead: %s', bucket, key, exc)
+        return False
+    return head.get('Metadata', {}).get('has-audio') == 'true'
+
+
 def _ensure_s3_video_has_audio(
     bucket: str,
     key: str,
@@ -363,46 +765,264 @@ def _ensure_s3_video_has_audio(
     force: bool = False,
     voiceover_text: Optional[str] = None,
     voice_id: Optional[str] = None,
+    known_silent: bool = False,
+    duration_seconds: Optional[float] = None,
+    output_key: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Ensure the S3 video object has an audio stream.
 
     If missing (or if force=True), mux a generated audio track based on VIDEO_GEN_AUDIO_KIND.
+    ``known_silent`` with a ``duration_seconds`` (fresh Nova Reel output) skips
+    the ffprobe run; the force path always probes. With ``output_key`` the muxed
+    video is written there and ``key`` is left untouched.
 
     Returns a dict with {changed: bool, kind: str}.
     """
     if not VIDEO_GEN_ENSURE_AUDIO:
         return {"changed": False, "kind": VIDEO_GEN_AUDIO_KIND}
+    if not force and not known_silent and _s3_video_marked_with_audio(bucket, key):
+        return {"changed": False, "kind": VIDEO_GEN_AUDIO_KIND}
 
-    with tempfile.TemporaryDirectory(prefix='video_gen_audio_') as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = tmpdir_path / 'input.mp4'
-        output_path = tmpdir_path / 'output_with_audio.mp4'
-
-        s3_client.download_file(bucket, key, str(input_path))
-
-        if (not force) and _probe_has_audio(input_path):
-            return {"changed": False, "kind": VIDEO_GEN_AUDIO_KIND}
+    voiceover = _voiceover_settings(VIDEO_GEN_AUDIO_KIND, voiceover_text, voice_id)
+    # A narration started below may still be writing into tmpdir if the remux fails.
+    with tempfile.TemporaryDirectory(
+        prefix='video_gen_audio_', dir=VIDEO_GEN_TMPDIR, ignore_cleanup_errors=True
+    ) as tmpdir:
+        scratch_dir = Path(tmpdir)
+        # When the mux is certain (known-silent Nova Reel output, or force) Polly starts
+        # right away instead of after the video has been fetched. Otherwise it waits
+        # for the probe: a running synthesis can't be cancelled, and videos that
+        # already have audio shouldn't pay for one.
+        voiceover_mp3 = (
+            _start_voiceover_synthesis(scratch_dir, *voiceover)
+            if voiceover and (known_silent or force)
+            else None
+        )
+        try:
+            return _remux_s3_video(
+                bucket,
+                key,
+                scratch_dir,
+                force=force,
+                voiceover_text=voiceover_text,
+                voice_id=voice_id,
+                voiceover_mp3=voiceover_mp3,
+                known_duration=duration_seconds if known_silent and not force else None,
+                output_key=output_key,
+            )
+        finally:
+            if voiceover_mp3 is not None:
+                voiceover_mp3.cancel()
 
-        if force:
-            app.logger.info('Force remux audio for %s/%s (kind=%s)', bucket, key, VIDEO_GEN_AUDIO_KIND)
-        else:
-            app.logger.info('No audio stream detected for %s/%s; muxing audio (kind=%s)', bucket, key, VIDEO_GEN_AUDIO_KIND)
 
-        effective_kind = _mux_generated_audio(
-            input_path,
-            output_path,
-            kind=VIDEO_GEN_AUDIO_KIND,
+def _remux_s3_video(
+    bucket: str,
+    key: str,
+    scratch_dir: Path,
+    *,
+    force: bool,
+    voiceover_text: Optional[str],
+    voice_id: Optional[str],
+    voiceover_mp3: Optional["Future[Path]"],
+    known_duration: Optional[float] = None,
+    output_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Probe and remux ``key`` (in place unless ``output_key`` is given), using ``scratch_dir`` for local copies."""
+    if VIDEO_GEN_STREAM_REMUX:
+        streamed = _stream_remux_s3_video(
+            bucket,
+            key,
+            force=force,
             voiceover_text=voiceover_text,
             voice_id=voice_id,
+            scratch_dir=scratch_dir,
+            voiceover_mp3=voiceover_mp3,
+            known_duration=known_duration,
+            output_key=output_key,
         )
+        if streamed is not None:
+            return streamed
+        app.logger.warning('ffmpeg could not read %s/%s over HTTPS; remuxing from a local copy', bucket, key)
 
-        s3_client.upload_file(
-            str(output_path),
-            bucket,
-            key,
-            ExtraArgs={'ContentType': 'video/mp4'}
+    input_path = scratch_dir / 'input.mp4'
+    output_path = scratch_dir / 'output_with_audio.mp4'
+
+    s3_client.download_file(bucket, key, str(input_path), Config=_S3_TRANSFER_CONFIG)
+
+    if known_duration is not None:
+        has_audio, duration_seconds = False, known_duration
+    else:
+        has_audio, duration_seconds = _probe_audio_and_duration(input_path)
+    if (not force) and has_audio:
+        return {"changed": False, "kind": VIDEO_GEN_AUDIO_KIND}
+
+    if force:
+        app.logger.info('Force remux audio for %s/%s (kind=%s)', bucket, key, VIDEO_GEN_AUDIO_KIND)
+    else:
+        app.logger.info('No audio stream detected for %s/%s; muxing audio (kind=%s)', bucket, key, VIDEO_GEN_AUDIO_KIND)
+
+    effective_kind = _mux_generated_audio(
+        input_path,
+        output_path,
+        kind=VIDEO_GEN_AUDIO_KIND,
+        voiceover_text=voiceover_text,
+        voice_id=voice_id,
+        duration_seconds=duration_seconds,
+        scratch_dir=scratch_dir,
+        voiceover_mp3=voiceover_mp3,
+    )
+
+    _upload_video_file(output_path, bucket, output_key or key)
+    return {"changed": True, "kind": effective_kind}
+
+
+def _open_history_db() -> Optional[sqlite3.Connection]:
+    if not VIDEO_GEN_HISTORY_DB:
+        return None
+    try:
+        Path(VIDEO_GEN_HISTORY_DB).parent.mkdir(parents=True, exist_ok=True)
+        # Shared across request/poller/finalize threads; every use holds _history_lock.
+        conn = sqlite3.connect(VIDEO_GEN_HISTORY_DB, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS history ('
+            'id TEXT PRIMARY KEY, json BLOB NOT NULL, created_at INTEGER NOT NULL, status TEXT)'
         )
-        return {"changed": True, "kind": effective_kind}
+        # Serves the newest-first warm-up query and retention pruning without a table scan.
+        conn.execute('CREATE INDEX IF NOT EXISTS history_created_at ON history (created_at)')
+        if VIDEO_GEN_HISTORY_RETENTION_DAYS > 0:
+            cutoff = int(time.time() - VIDEO_GEN_HISTORY_RETENTION_DAYS * 86400)
+            pruned = conn.execute(
+                "DELETE FROM history WHERE created_at < ? AND status IN ('completed', 'failed')",
+                (cutoff,),
+            ).rowcount
+            if pruned:
+                app.logger.info('Pruned %d history entries older than %g days', pruned, VIDEO_GEN_HISTORY_RETENTION_DAYS)
+        return conn
+    except (OSError, sqlite3.Error) as exc:
+        app.logger.warning('History database %s unavailable; keeping history in memory only: %s', VIDEO_GEN_HISTORY_DB, exc)
+        return None
+
+
+_history_db = _open_history_db()
+
+
+def _history_save_locked(entry: Dict[str, Any]) -> None:
+    if _history_db is None:
+        return
+    try:
+        _history_db.execute(
+            'INSERT INTO history (id, json, created_at, status) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT(id) DO UPDATE SET json = excluded.json, status = excluded.status',
+            (entry['id'], _json_dumps_bytes(entry), int(time.time()), entry.get('status')),
+        )
+    except sqlite3.Error as exc:
+        app.logger.warning('Failed to persist history entry %s: %s', entry.get('id'), exc)
+
+
+def _load_history_from_db() -> None:
+    """Warm the in-memory history with the newest MAX_HISTORY persisted entries."""
+    if _history_db is None:
+        return
+    try:
+        rows = _history_db.execute(
+            'SELECT json FROM (SELECT json, created_at, rowid AS seq FROM history '
+            'ORDER BY created_at DESC, seq DESC LIMIT ?) ORDER BY created_at, seq',
+            (MAX_HISTORY,),
+        ).fetchall()
+    except sqlite3.Error as exc:
+        app.logger.warning('Failed to load history from %s: %s', VIDEO_GEN_HISTORY_DB, exc)
+        return
+    for (raw,) in rows:
+        entry = _json_loads(raw)
+        GENERATION_HISTORY[entry['id']] = entry
+        _index_pending_locked(entry)
+
+
+def _index_pending_locked(entry: Dict[str, Any]) -> None:
+    _HISTORY_REVISIONS[entry['id']] = _HISTORY_REVISIONS.get(entry['id'], 0) + 1
+    if entry.get('status') == 'pending':
+        _PENDING_GENERATIONS[entry['id']] = entry
+    else:
+        _PENDING_GENERATIONS.pop(entry['id'], None)
+
+
+def _forget_generation_locked(generation_id: str) -> None:
+    _PENDING_GENERATIONS.pop(generation_id, None)
+    _TERMINAL_DISK_ENTRIES.pop(generation_id, None)
+    _HISTORY_REVISIONS.pop(generation_id, None)
+    _FORMATTED_HISTORY.pop(generation_id, None)
+
+
+def _history_put(entry: Dict[str, Any]) -> None:
+    with _history_lock:
+        GENERATION_HISTORY[entry['id']] = entry
+        GENERATION_HISTORY.move_to_end(entry['id'])
+        _index_pending_locked(entry)
+        while len(GENERATION_HISTORY) > MAX_HISTORY:
+            evicted_id, _ = GENERATION_HISTORY.popitem(last=False)
+            _forget_generation_locked(evicted_id)
+        _history_save_locked(entry)
+
+
+def _history_update(entry: Dict[str, Any], **fields: Any) -> None:
+    """Apply ``fields`` to a history entry and persist it."""
+    with _history_lock:
+        entry.update(fields)
+        if entry['id'] in GENERATION_HISTORY:
+            _index_pending_locked(entry)
+        else:
+            # Served from disk; just drop any formatted copy.
+            _FORMATTED_HISTORY.pop(entry['id'], None)
+        _history_save_locked(entry)
+
+
+def _history_get(generation_id: str) -> Optional[Dict[str, Any]]:
+    with _history_lock:
+        entry = GENERATION_HISTORY.get(generation_id)
+        if entry is not None or _history_db is None:
+            return entry
+        entry = _TERMINAL_DISK_ENTRIES.get(generation_id)
+        if entry is not None:
+            _TERMINAL_DISK_ENTRIES.move_to_end(generation_id)
+            return entry
+        # Older than the in-memory window; served from disk without reordering the LRU.
+        try:
+            row = _history_db.execute('SELECT json FROM history WHERE id = ?', (generation_id,)).fetchone()
+        except sqlite3.Error as exc:
+            app.logger.warning('Failed to read history entry %s: %s', generation_id, exc)
+            return None
+        if not row:
+            return None
+        entry = _json_loads(row[0])
+        if entry.get('status') in {'completed', 'failed'}:
+            _TERMINAL_DISK_ENTRIES[generation_id] = entry
+            if len(_TERMINAL_DISK_ENTRIES) > MAX_HISTORY:
+                evicted_id, _ = _TERMINAL_DISK_ENTRIES.popitem(last=False)
+                _FORMATTED_HISTORY.pop(evicted_id, None)
+        return entry
+
+
+def _history_pop(generation_id: str) -> Optional[Dict[str, Any]]:
+    entry = _history_get(generation_id)
+    with _history_lock:
+        GENERATION_HISTORY.pop(generation_id, None)
+        _forget_generation_locked(generation_id)
+        if _history_db is not None:
+            try:
+                _history_db.execute('DELETE FROM history WHERE id = ?', (generation_id,))
+            except sqlite3.Error as exc:
+                app.logger.warning('Failed to delete history entry %s: %s', generation_id, exc)
+    return entry
+
+
+def _history_newest_first() -> List[Dict[str, Any]]:
+    with _history_lock:
+        return list(reversed(GENERATION_HISTORY.values()))
+
+
+_load_history_from_db()
 
 
 def _sanitize_duration(raw_value) -> int:
@@ -416,6 +1036,7 @@ def _sanitize_duration(raw_value) -> int:
 def upload_reference_images(uploaded_files, generation_id: str) -> List[Dict[str, str]]:
     """Upload reference images to S3 and return metadata."""
     references = []
+    uploads = []
     for file_obj in uploaded_files:
         if not file_obj or file_obj.filename == '':
             continue
@@ -426,14 +1047,18 @@ def upload_reference_images(uploaded_files, generation_id: str) -> List[Dict[str
         safe_key = f"generated-videos/{generation_id}/references/{uuid.uuid4().hex}{extension}"
         content_type = file_obj.mimetype or 'application/octet-stream'
 
-        # Reset stream position before uploading
+        # Read each upload here: the request's file streams aren't safe to share
+        # with worker threads.
         file_obj.stream.seek(0)
-        s3_client.upload_fileobj(
-            file_obj,
+        body = io.BytesIO(file_obj.stream.read())
+        uploads.append(_UPLOAD_POOL.submit(
+            s3_client.upload_fileobj,
+            body,
             S3_BUCKET,
             safe_key,
-            ExtraArgs={'ContentType': content_type}
-        )
+            ExtraArgs={'ContentType': content_type},
+            Config=_S3_TRANSFER_CONFIG,
+        ))
 
         references.append({
             "s3_key": safe_key,
@@ -441,6 +1066,8 @@ def upload_reference_images(uploaded_files, generation_id: str) -> List[Dict[str
             "content_type": content_type
         })
 
+    for upload in uploads:
+        upload.result()
     return references
 
 
@@ -467,10 +1094,59 @@ def build_prompt_with_references(user_prompt: str, references: List[Dict[str, st
     return prompt_with_refs
 
 
+VIDEO_URL_TTL = 3600 * 24 * 7  # 7 days
+
+
+def _presign_get(s3_key: str, content_type: str, expires_in: int) -> str:
+    return s3_client.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': S3_BUCKET,
+            'Key': s3_key,
+            'ResponseContentType': content_type
+        },
+        ExpiresIn=expires_in
+    )
+
+
+@lru_cache(maxsize=4096)
+def _cached_presign_get(s3_key: str, content_type: str, expires_in: int, time_bucket: int) -> str:
+    # time_bucket only partitions the cache; ClientErrors propagate and aren't cached.
+    return _presign_get(s3_key, content_type, expires_in)
+
+
+def _presigned_get_url(s3_key: str, content_type: str, expires_in: int, *, fresh: bool = False) -> str:
+    """Return a presigned GET URL, reusing one signature until shortly before it expires.
+
+    Repeat requests get the identical URL, so browsers can cache the media. A URL
+    is handed out until a day (at most half its lifetime) before expiry. Pass
+    ``fresh`` after the object was rewritten so clients don't see a stale cached copy.
+    """
+    if fresh:
+        return _presign_get(s3_key, content_type, expires_in)
+    return _cached_presign_get(s3_key, content_type, expires_in, _url_rotation_bucket(expires_in))
+
+
+def _url_rotation_bucket(expires_in: int) -> int:
+    rotate_seconds = max(1, expires_in - min(86400, expires_in // 2))
+    return int(time.time() // rotate_seconds)
+
+
 def format_history_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a serializable copy of the history entry with presigned URLs."""
+    """Return a serializable copy of the history entry with presigned URLs.
+
+    The result is cached per entry until the entry changes (see _history_update)
+    or its reference URLs rotate; callers must treat it as read-only.
+    """
+    generation_id = entry.get('id')
+    stamp = (_HISTORY_REVISIONS.get(generation_id, 0), _url_rotation_bucket(REFERENCE_URL_TTL))
+    cached = _FORMATTED_HISTORY.get(generation_id)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
     formatted = dict(entry)
     references_with_urls = []
+    signed_all = True
 
     for ref in entry.get('reference_images', []):
         s3_key = ref.get('s3_key')
@@ -478,17 +1154,10 @@ def format_history_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
             continue
 
         try:
-            url = s3_client.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': S3_BUCKET,
-                    'Key': s3_key,
-                    'ResponseContentType': ref.get('content_type', 'image/jpeg')
-                },
-                ExpiresIn=REFERENCE_URL_TTL
-            )
+            url = _presigned_get_url(s3_key, ref.get('content_type', 'image/jpeg'), REFERENCE_URL_TTL)
         except ClientError:
             url = None
+            signed_all = False
 
         references_with_urls.append({
             **ref,
@@ -496,6 +1165,8 @@ def format_history_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
         })
 
     formatted['reference_images'] = references_with_urls
+    if signed_all and (generation_id in GENERATION_HISTORY or generation_id in _TERMINAL_DISK_ENTRIES):
+        _FORMATTED_HISTORY[generation_id] = (stamp, formatted)
     return formatted
 
 
@@ -533,7 +1204,7 @@ def _save_generation_request_to_s3(generation_id: str, payload: Dict[str, Any])
         s3_client.put_object(
             Bucket=S3_BUCKET,
             Key=_generation_request_s3_key(generation_id),
-            Body=json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+            Body=_json_dumps_bytes(payload),
             ContentType='application/json',
         )
     except Exception as exc:
@@ -542,14 +1213,53 @@ def _save_generation_request_to_s3(generation_id: str, payload: Dict[str, Any])
 
 
 def _load_generation_request_from_s3(generation_id: str) -> Optional[Dict[str, Any]]:
+    """Return the saved request.json for a generation (shared; don't mutate), or None."""
     try:
-        obj = s3_client.get_object(Bucket=S3_BUCKET, Key=_generation_request_s3_key(generation_id))
-        body = obj['Body'].read().decode('utf-8')
-        return json.loads(body)
+        return _fetch_generation_request(generation_id)
     except Exception:
         return None
 
 
+@lru_cache(maxsize=1024)
+def _fetch_generation_request(generation_id: str) -> Dict[str, Any]:
+    # request.json is written once per generation; raising keeps misses uncached.
+    obj = s3_client.get_object(Bucket=S3_BUCKET, Key=_generation_request_s3_key(generation_id))
+    return _json_loads(obj['Body'].read())
+
+
+def _locate_generated_video(generation_id: str, invocation_arn: Optional[str] = None) -> Optional[str]:
+    """Return the S3 key of a generation's MP4, or None if the prefix has none.
+
+    Nova Reel writes ``<output prefix>/<invocation id>/output.mp4``, so a HEAD on
+    that key normally answers without listing the prefix. The audio mux of that
+    video (see _muxed_video_key) is preferred when it exists.
+    """
+    prefix = f"generated-videos/{generation_id}/"
+    if invocation_arn:
+        candidate = f"{prefix}{invocation_arn.rsplit('/', 1)[-1]}/output.mp4"
+    else:
+        candidate = f"{prefix}output.mp4"
+    for key in (_muxed_video_key(candidate), candidate):
+        try:
+            s3_client.head_object(Bucket=S3_BUCKET, Key=key)
+            return key
+        except ClientError as exc:
+            if exc.response.get('Error', {}).get('Code') not in {'404', 'NoSuchKey', 'NotFound'}:
+                raise
+
+    # A generation prefix holds a handful of objects (request.json, the Nova Reel
+    # manifest and the video). No Delimiter: the MP4 sits one level down, under
+    # the invocation id.
+    response_list = s3_client.list_objects_v2(Bucket=S3_BUCKET, Prefix=prefix, MaxKeys=50)
+    contents = response_list.get('Contents') or []
+    videos = [obj['Key'] for obj in contents if obj.get('Key', '').endswith('.mp4')]
+    if videos:
+        # The silent output.mp4 sorts before its mux; prefer the one with audio.
+        return min(videos, key=lambda key: not key.endswith(_MUXED_VIDEO_SUFFIX))
+    app.logger.error('No MP4 file found in S3 prefix %s (files: %s)', prefix, [obj.get('Key') for obj in contents])
+    return None
+
+
 @app.route("/health", methods=["GET"])
 def health_check() -> Any:
     """Health check endpoint."""
@@ -611,8 +1321,7 @@ def generate_video() -> Any:
         app.logger.info(f"Starting async video generation for prompt: {prompt}")
         
         # Generate random seed for unique results
-        import random
-        seed = random.randint(0, 2147483646)
+        seed = _SEED_RNG.randrange(0x7FFFFFFF)
         
         # Prepare request body for Nova Reel (async API)
         model_input = {
@@ -680,7 +1389,7 @@ def generate_video() -> Any:
             "voiceover_text": voiceover_text or None,
             "voice_id": voice_id or None,
         }
-        GENERATION_HISTORY.insert(0, pending_entry)
+        _history_put(pending_entry)
         
         # Return immediately with job ID for frontend polling
         return jsonify({
@@ -708,129 +1417,223 @@ def generate_video() -> Any:
         return jsonify({"error": f"Video generation failed: {str(e)}"}), 500
 
 
+# The audio mux (download/probe/ffmpeg/upload) for finished videos runs here so
+# neither request threads nor the status poller wait on ffmpeg.
+_FINALIZE_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv('VIDEO_GEN_FINALIZE_WORKERS', str(os.cpu_count() or 4))),
+    thread_name_prefix='video-gen-finalize',
+)
+_finalize_jobs: Dict[str, "Future[None]"] = {}
+_finalize_jobs_lock = threading.Lock()
+
+
+def _submit_finalize_job(generation_id: str, fn, *args) -> None:
+    """Run ``fn(*args)`` on the finalize pool unless a job for the generation is still running."""
+    with _finalize_jobs_lock:
+        running = _finalize_jobs.get(generation_id)
+        if running is not None and not running.done():
+            return
+        job = _FINALIZE_POOL.submit(fn, *args)
+        _finalize_jobs[generation_id] = job
+
+    def _forget(done: "Future[None]") -> None:
+        with _finalize_jobs_lock:
+            if _finalize_jobs.get(generation_id) is done:
+                del _finalize_jobs[generation_id]
+
+    job.add_done_callback(_forget)
+
+
+def _wait_for_finalize_job(generation_id: str) -> None:
+    """Block until any finalize job for the generation has finished (its outcome is ignored)."""
+    with _finalize_jobs_lock:
+        running = _finalize_jobs.get(generation_id)
+    if running is not None:
+        with contextlib.suppress(Exception):
+            running.result()
+
+
+_MUXED_VIDEO_SUFFIX = '_with_audio.mp4'
+
+
+def _muxed_video_key(video_s3_key: str) -> str:
+    """Key the audio mux of a published video is written to (next to the silent original)."""
+    stem = video_s3_key[:-4] if video_s3_key.endswith('.mp4') else video_s3_key
+    return f'{stem}{_MUXED_VIDEO_SUFFIX}'
+
+
+def _silent_video_key(video_s3_key: str) -> Optional[str]:
+    """The silent original a muxed key was made from (inverse of _muxed_video_key), else None."""
+    if not video_s3_key.endswith(_MUXED_VIDEO_SUFFIX):
+        return None
+    return f'{video_s3_key[:-len(_MUXED_VIDEO_SUFFIX)]}.mp4'
+
+
+def _ensure_entry_audio(entry: Dict[str, Any], video_s3_key: str) -> None:
+    """Ensure a published video has an audio stream, recording the outcome in ``audio_status``.
+
+    The mux goes to a new key and the entry is switched over to it in a single
+    update, so readers of the published silent video never see a half-rewritten object.
+    """
+    if _silent_video_key(video_s3_key):
+        # Already the mux (e.g. found by _locate_generated_video after a restart).
+        _history_update(entry, audio_ensured=True, audio_status='done')
+        return
+    # Ensure the MP4 has an audio stream (mux silent AAC if missing)
+    muxed_key = _muxed_video_key(video_s3_key)
+    try:
+        # Nova Reel renders silent clips of exactly the requested length.
+        audio_result = _ensure_s3_video_has_audio(
+            S3_BUCKET,
+            video_s3_key,
+            voiceover_text=entry.get('voiceover_text'),
+            voice_id=entry.get('voice_id'),
+            known_silent=True,
+            duration_seconds=entry.get('duration'),
+            output_key=muxed_key,
+        )
+        fields: Dict[str, Any] = {
+            'audio_ensured': True,
+            'audio_status': 'done',
+            'audio_added': bool(audio_result.get('changed')),
+            'audio_kind_used': audio_result.get('kind'),
+        }
+        if fields['audio_added']:
+            app.logger.info('Added audio track (%s) to %s', fields['audio_kind_used'], muxed_key)
+            fields['s3_key'] = muxed_key
+            fields['video_url'] = _presigned_get_url(muxed_key, 'video/mp4', VIDEO_URL_TTL)
+        _history_update(entry, **fields)
+    except Exception as audio_exc:
+        # Non-fatal: return video anyway, but log so we can fix env/ffmpeg.
+        app.logger.error('Failed to ensure audio track for %s: %s', video_s3_key, audio_exc)
+        _history_update(entry, audio_status='failed')
+
+
+# A Completed job whose MP4 still can't be found after this many polls is
+# marked failed instead of being retried forever.
+VIDEO_GEN_LOCATE_MAX_ATTEMPTS = max(1, int(os.getenv('VIDEO_GEN_LOCATE_MAX_ATTEMPTS', '10')))
+
+
+def _poll_generation(generation_id: str, entry: Dict[str, Any]) -> None:
+    """Ask Bedrock for a pending job's status and record the outcome on ``entry``.
+
+    Raises if the finished video can't be located, leaving the entry pending so
+    the next poll retries; after VIDEO_GEN_LOCATE_MAX_ATTEMPTS such polls the
+    entry is marked failed.
+    """
+    invocation_arn = entry['invocation_arn']
+    job_status = bedrock_runtime.get_async_invoke(invocationArn=invocation_arn)
+    status = job_status['status']
+
+    app.logger.info(f"Job {generation_id} status: {status}")
+
+    if status == "Completed":
+        # Get the actual S3 key from the response
+        output_data = job_status.get('outputDataConfig', {})
+        s3_uri = output_data.get('s3OutputDataConfig', {}).get('s3Uri', '')
+
+        app.logger.info(f"Job completed. Output URI: {s3_uri}")
+
+        # Locate the video file (not the manifest.json) under the output prefix
+        video_s3_key = _locate_generated_video(generation_id, invocation_arn)
+        if not video_s3_key:
+            attempts = entry.get('locate_attempts', 0) + 1
+            if attempts >= VIDEO_GEN_LOCATE_MAX_ATTEMPTS:
+                app.logger.error('Giving up on %s: no MP4 found after %d polls', generation_id, attempts)
+                _history_update(entry, error='Video MP4 file not found in S3', status='failed')
+                return
+            _history_update(entry, locate_attempts=attempts)
+            raise LookupError('Video MP4 file not found in S3')
+
+        app.logger.info(f"Found video at: {video_s3_key}")
+        # Publish the video straight away; the audio mux is written to a new key in
+        # the background and clients keep polling while audio_status is 'pending'.
+        video_url = _presigned_get_url(video_s3_key, 'video/mp4', VIDEO_URL_TTL)
+        _history_update(
+            entry,
+            s3_key=video_s3_key,
+            video_url=video_url,
+            status='completed',
+            audio_ensured=False,
+            audio_status='pending',
+        )
+        _submit_finalize_job(generation_id, _ensure_entry_audio, entry, video_s3_key)
+
+    elif status == "Failed":
+        failure_message = job_status.get('failureMessage', 'Unknown error')
+        app.logger.error(f"Video generation failed: {failure_message}")
+
+        # Update history
+        _history_update(entry, error=failure_message, status='failed')
+
+
+# Pending jobs are polled here once per interval instead of once per client
+# request; 0 disables the poller and check-status asks Bedrock itself.
+VIDEO_GEN_POLL_INTERVAL = float(os.getenv('VIDEO_GEN_POLL_INTERVAL', '5'))
+
+
+def _status_poller() -> None:
+    while True:
+        time.sleep(VIDEO_GEN_POLL_INTERVAL)
+        with _history_lock:
+            pending = list(_PENDING_GENERATIONS.items())
+        for generation_id, entry in pending:
+            try:
+                _poll_generation(generation_id, entry)
+            except Exception as exc:
+                app.logger.warning('Status poll failed for %s: %s', generation_id, exc)
+
+
+if VIDEO_GEN_POLL_INTERVAL > 0:
+    threading.Thread(target=_status_poller, name='video-gen-status-poller', daemon=True).start()
+
+
+# Inline polls in flight per generation, so concurrent check-status requests for
+# one job share a single get_async_invoke call.
+_inflight_polls: Dict[str, "Future[None]"] = {}
+_inflight_polls_lock = threading.Lock()
+
+
+def _poll_generation_coalesced(generation_id: str, entry: Dict[str, Any]) -> None:
+    with _inflight_polls_lock:
+        poll = _inflight_polls.get(generation_id)
+        owner = poll is None
+        if owner:
+            poll = Future()
+            _inflight_polls[generation_id] = poll
+    if not owner:
+        poll.result()
+        return
+    try:
+        _poll_generation(generation_id, entry)
+    except BaseException as exc:
+        poll.set_exception(exc)
+        raise
+    else:
+        poll.set_result(None)
+    finally:
+        with _inflight_polls_lock:
+            del _inflight_polls[generation_id]
+
+
 @app.route("/check-status/<generation_id>", methods=["GET"])
 def check_status(generation_id):
     """Check the status of a video generation job."""
     try:
-        # Find the entry in history
-        entry = None
-        entry_idx = None
-        for idx, item in enumerate(GENERATION_HISTORY):
-            if item['id'] == generation_id:
-                entry = item
-                entry_idx = idx
-                break
-        
+        entry = _history_get(generation_id)
         if not entry:
             return jsonify({"error": "Generation not found"}), 404
         
-        # If already completed/failed, return the entry (but ensure audio for completed videos)
+        # If already completed/failed, return the entry (retrying audio in the
+        # background for completed videos whose first attempt failed)
         if entry.get('status') != 'pending':
             if entry.get('status') == 'completed' and entry.get('s3_key') and not entry.get('audio_ensured'):
-                try:
-                    audio_result = _ensure_s3_video_has_audio(
-                        S3_BUCKET,
-                        entry['s3_key'],
-                        voiceover_text=entry.get('voiceover_text'),
-                        voice_id=entry.get('voice_id'),
-                    )
-                    entry['audio_ensured'] = True
-                    entry['audio_added'] = bool(audio_result.get('changed'))
-                    entry['audio_kind_used'] = audio_result.get('kind')
-                    if entry_idx is not None:
-                        GENERATION_HISTORY[entry_idx] = entry
-                except Exception as audio_exc:
-                    app.logger.error('Failed to ensure audio track for %s: %s', entry.get('s3_key'), audio_exc)
+                _submit_finalize_job(generation_id, _ensure_entry_audio, entry, entry['s3_key'])
             return jsonify(format_history_entry(entry)), 200
         
-        # Check job status with AWS
-        invocation_arn = entry['invocation_arn']
-        job_status = bedrock_runtime.get_async_invoke(invocationArn=invocation_arn)
-        status = job_status['status']
-        
-        app.logger.info(f"Job {generation_id} status: {status}")
-        
-        if status == "Completed":
-            # Get the actual S3 key from the response
-            output_data = job_status.get('outputDataConfig', {})
-            s3_uri = output_data.get('s3OutputDataConfig', {}).get('s3Uri', '')
-            
-            app.logger.info(f"Job completed. Output URI: {s3_uri}")
-            
-            # List files in the S3 prefix to find the actual video file
-            prefix = f"generated-videos/{generation_id}/"
-            try:
-                response_list = s3_client.list_objects_v2(Bucket=S3_BUCKET, Prefix=prefix)
-                if 'Contents' in response_list:
-                    # Find the MP4 file (not the manifest.json)
-                    video_s3_key = None
-                    for obj in response_list['Contents']:
-                        if obj['Key'].endswith('.mp4'):
-                            video_s3_key = obj['Key']
-                            break
-                    
-                    if not video_s3_key:
-                        app.logger.error(f"No MP4 file found in S3 prefix: {prefix}")
-                        app.logger.error(f"Files found: {[obj['Key'] for obj in response_list['Contents']]}")
-                        return jsonify({"error": "Video MP4 file not found in S3", "status": "failed"}), 500
-                    
-                    app.logger.info(f"Found video at: {video_s3_key}")
-                else:
-                    app.logger.error(f"No files found in S3 prefix: {prefix}")
-                    return jsonify({"error": "Video file not found in S3", "status": "failed"}), 500
-            except Exception as e:
-                app.logger.error(f"Error listing S3 files: {e}")
-                return jsonify({"error": f"Failed to locate video: {str(e)}", "status": "failed"}), 500
-
-            # Ensure the MP4 has an audio stream (mux silent AAC if missing)
-            try:
-                audio_result = _ensure_s3_video_has_audio(
-                    S3_BUCKET,
-                    video_s3_key,
-                    voiceover_text=entry.get('voiceover_text'),
-                    voice_id=entry.get('voice_id'),
-                )
-                entry['audio_ensured'] = True
-                entry['audio_added'] = bool(audio_result.get('changed'))
-                entry['audio_kind_used'] = audio_result.get('kind')
-                if entry['audio_added']:
-                    app.logger.info('Added audio track (%s) to %s', entry.get('audio_kind_used'), video_s3_key)
-            except Exception as audio_exc:
-                # Non-fatal: return video anyway, but log so we can fix env/ffmpeg.
-                app.logger.error('Failed to ensure audio track for %s: %s', video_s3_key, audio_exc)
-            
-            # Generate presigned URL
-            video_url = s3_client.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': S3_BUCKET, 
-                    'Key': video_s3_key,
-                    'ResponseContentType': 'video/mp4'
-                },
-                ExpiresIn=3600 * 24 * 7  # 7 days
-            )
-            
-            # Update history entry
-            entry['status'] = 'completed'
-            entry['video_url'] = video_url
-            entry['s3_key'] = video_s3_key
-            GENERATION_HISTORY[entry_idx] = entry
-            
-            return jsonify(format_history_entry(entry)), 200
-            
-        elif status == "Failed":
-            failure_message = job_status.get('failureMessage', 'Unknown error')
-            app.logger.error(f"Video generation failed: {failure_message}")
-            
-            # Update history
-            entry['status'] = 'failed'
-            entry['error'] = failure_message
-            GENERATION_HISTORY[entry_idx] = entry
-            
-            return jsonify(format_history_entry(entry)), 200
-        
-        # Still in progress
-        entry['status'] = 'pending'
+        # Pending jobs are refreshed by _status_poller; report its last observation.
+        if VIDEO_GEN_POLL_INTERVAL <= 0:
+            _poll_generation_coalesced(generation_id, entry)
         return jsonify(format_history_entry(entry)), 200
         
     except Exception as e:
@@ -843,27 +1646,20 @@ def check_status(generation_id):
 def get_history() -> Any:
     """Get generation history."""
     # Filter out failed entries, only show pending and completed
-    filtered_history = [h for h in GENERATION_HISTORY if h.get('status') != 'failed']
+    history = [format_history_entry(h) for h in _history_newest_first() if h.get('status') != 'failed']
     return jsonify({
-        "history": [format_history_entry(h) for h in filtered_history],
-        "total": len(filtered_history)
+        "history": history,
+        "total": len(history)
     }), 200
 
 
 @app.route("/history/<generation_id>", methods=["DELETE"])
 def delete_from_history(generation_id: str) -> Any:
     """Delete a generation from history."""
-    entry_idx = None
-    for idx, entry in enumerate(GENERATION_HISTORY):
-        if entry['id'] == generation_id:
-            entry_idx = idx
-            break
-    
-    if entry_idx is None:
+    entry = _history_pop(generation_id)
+    if entry is None:
         return jsonify({"error": "Generation not found"}), 404
     
-    entry = GENERATION_HISTORY.pop(entry_idx)
-    
     # Optionally delete from S3
     delete_from_s3 = request.args.get('delete_s3', 'false').lower() == 'true'
     if delete_from_s3:
@@ -872,15 +1668,30 @@ def delete_from_history(generation_id: str) -> Any:
             primary_key = entry.get('s3_key', '')
             if primary_key:
                 keys_to_delete.append(primary_key)
+                # A muxed video's silent Nova Reel original sits next to it.
+                silent_key = _silent_video_key(primary_key)
+                if silent_key:
+                    keys_to_delete.append(silent_key)
 
             for ref in entry.get('reference_images', []):
                 ref_key = ref.get('s3_key')
                 if ref_key:
                     keys_to_delete.append(ref_key)
 
-            for key in keys_to_delete:
-                s3_client.delete_object(Bucket=S3_BUCKET, Key=key)
-                app.logger.info(f"Deleted from S3: {key}")
+            if keys_to_delete:
+                # One round trip for the video and all reference images.
+                result = s3_client.delete_objects(
+                    Bucket=S3_BUCKET,
+                    Delete={'Objects': [{'Key': key} for key in keys_to_delete], 'Quiet': True},
+                )
+                failed = {err.get('Key') for err in result.get('Errors', [])}
+                for key in keys_to_delete:
+                    if key not in failed:
+                        app.logger.info(f"Deleted from S3: {key}")
+                for key in failed:
+                    # Retry the keys the batch reported individually.
+                    s3_client.delete_object(Bucket=S3_BUCKET, Key=key)
+                    app.logger.info(f"Deleted from S3: {key}")
         except Exception as e:
             app.logger.error(f"Failed to delete from S3: {e}")
     
@@ -890,6 +1701,26 @@ def delete_from_history(generation_id: str) -> Any:
     }), 200
 
 
+def _resolve_voiceover(
+    generation_id: str, history_item: Optional[Dict[str, Any]], fallback_prompt: str
+) -> tuple[str, str]:
+    """Return (voiceover_text, voice_id) for a generation whose caller supplied no narration.
+
+    Sources, first hit wins: the history entry, the persisted S3 request.json,
+    then ``fallback_prompt``. Narration stored at generation time is reused
+    as-is; it is only re-derived from a prompt when none was saved.
+    """
+    # Only fetch request.json when this process has no history entry for the id.
+    record = history_item or _load_generation_request_from_s3(generation_id)
+    if not record:
+        return _generate_ad_voiceover_from_prompt(fallback_prompt), ''
+    voice_id = str(record.get('voice_id') or '').strip()
+    stored_text = str(record.get('voiceover_text') or '').strip()
+    if stored_text:
+        return stored_text, voice_id
+    return _generate_ad_voiceover_from_prompt(str(record.get('prompt', '') or '')), voice_id
+
+
 @app.route('/ensure-audio/<generation_id>', methods=['POST'])
 def ensure_audio_for_generation(generation_id: str) -> Any:
     """Retrofit audio for an existing generation by scanning its S3 prefix for an MP4 and muxing silent audio if needed."""
@@ -899,66 +1730,42 @@ def ensure_audio_for_generation(generation_id: str) -> Any:
         voiceover_text = (payload.get('voiceover_text') or '').strip()
         voice_id = (payload.get('voice_id') or '').strip()
 
-        # If caller didn't supply narration text, try to derive it from:
-        # 1) stored in-memory history (current process)
-        # 2) persisted S3 request.json
-        # 3) request payload prompt
+        # A background finalize job may still be muxing this generation (and
+        # switching its s3_key); wait for it so the entry is read settled.
+        _wait_for_finalize_job(generation_id)
+        history_item = _history_get(generation_id)
         if VIDEO_GEN_AUDIO_KIND == 'voiceover' and not voiceover_text:
-            for item in GENERATION_HISTORY:
-                if item.get('id') == generation_id:
-                    voiceover_text = _generate_ad_voiceover_from_prompt(item.get('prompt', ''))
-                    if not voice_id:
-                        voice_id = (item.get('voice_id') or '').strip()
-                    break
-
-        if VIDEO_GEN_AUDIO_KIND == 'voiceover' and not voiceover_text:
-            saved = _load_generation_request_from_s3(generation_id)
-            if saved:
-                saved_prompt = str(saved.get('prompt', '') or '')
-                voiceover_text = _generate_ad_voiceover_from_prompt(saved_prompt)
-                if not voice_id:
-                    voice_id = str(saved.get('voice_id', '') or '').strip()
-
-        if VIDEO_GEN_AUDIO_KIND == 'voiceover' and not voiceover_text:
-            voiceover_text = _generate_ad_voiceover_from_prompt(str(payload.get('prompt', '') or ''))
-
-        # If caller didn't supply narration text, try to derive it from the stored prompt.
-        if VIDEO_GEN_AUDIO_KIND == 'voiceover' and not voiceover_text:
-            for item in GENERATION_HISTORY:
-                if item.get('id') == generation_id:
-                    voiceover_text = _default_voiceover_text_from_prompt(item.get('prompt', ''))
-                    if not voice_id:
-                        voice_id = (item.get('voice_id') or '').strip()
-                    break
-        prefix = f"generated-videos/{generation_id}/"
-        response_list = s3_client.list_objects_v2(Bucket=S3_BUCKET, Prefix=prefix)
-        if 'Contents' not in response_list:
-            return jsonify({"error": "No files found for generation", "generation_id": generation_id}), 404
-
-        video_s3_key = None
-        for obj in response_list['Contents']:
-            if obj.get('Key', '').endswith('.mp4'):
-                video_s3_key = obj['Key']
-                break
-
+            voiceover_text, stored_voice_id = _resolve_voiceover(
+                generation_id, history_item, str(payload.get('prompt', '') or '')
+            )
+            voice_id = voice_id or stored_voice_id
+        video_s3_key = history_item.get('s3_key') if history_item else None
         if not video_s3_key:
-            return jsonify({"error": "Video MP4 file not found in S3", "generation_id": generation_id}), 404
-
-        audio_result = _ensure_s3_video_has_audio(
-            S3_BUCKET,
+            video_s3_key = _locate_generated_video(
+                generation_id,
+                history_item.get('invocation_arn') if history_item else None,
+            )
+            if not video_s3_key:
+                return jsonify({"error": "Video MP4 file not found in S3", "generation_id": generation_id}), 404
+            if history_item is not None:
+                _history_update(history_item, s3_key=video_s3_key)
+
+        if not force and history_item is not None and history_item.get('audio_status') == 'done':
+            # The finalize job already muxed (or confirmed) the audio track.
+            audio_result = {"changed": False, "kind": history_item.get('audio_kind_used') or VIDEO_GEN_AUDIO_KIND}
+        else:
+            audio_result = _ensure_s3_video_has_audio(
+                S3_BUCKET,
+                video_s3_key,
+                force=force,
+                voiceover_text=voiceover_text or None,
+                voice_id=voice_id or None,
+            )
+        video_url = _presigned_get_url(
             video_s3_key,
-            force=force,
-            voiceover_text=voiceover_text or None,
-            voice_id=voice_id or None,
-        )
-        video_url = s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': S3_BUCKET,
-                'Key': video_s3_key,
-                'ResponseContentType': 'video/mp4'
-            },
-            ExpiresIn=3600 * 24 * 7
+            'video/mp4',
+            VIDEO_URL_TTL,
+            fresh=bool(audio_result.get('changed')),
         )
 
         return jsonify({
@@ -979,17 +1786,81 @@ def ensure_audio_for_generation(generation_id: str) -> Any:
         return jsonify({"error": f"Failed to ensure audio: {str(exc)}"}), 500
 
 
+# By default /video redirects the player to a presigned S3 URL so the bytes never
+# pass through this service; set to 0 where clients can't reach S3 directly. The
+# bucket sends no CORS headers, so players must load /video without crossOrigin
+# (as the frontend does); the proxied stream below is the path for CORS-mode clients.
+VIDEO_GEN_STREAM_VIDEO_REDIRECT = os.getenv('VIDEO_GEN_STREAM_VIDEO_REDIRECT', '1') not in {'0', 'false', 'False'}
+_VIDEO_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+# Proxied responses larger than one part are fetched as this many ranged GETs in
+# flight at once (part size _S3_MULTIPART_CHUNK_BYTES); 1 streams a single GET.
+VIDEO_GEN_PROXY_PARALLEL_GETS = max(1, int(os.getenv('VIDEO_GEN_PROXY_PARALLEL_GETS', '4')))
+_PROXY_POOL = ThreadPoolExecutor(max_workers=VIDEO_GEN_PROXY_PARALLEL_GETS * 4, thread_name_prefix='video-gen-proxy')
+_CONTENT_RANGE_RE = re.compile(r'bytes (\d+)-(\d+)/')
+
+
+def _iter_s3_body(body: Any, limit: Optional[int] = None) -> Iterator[bytes]:
+    """Yield the streaming body in chunks, stopping after ``limit`` bytes if given."""
+    try:
+        for chunk in body.iter_chunks(_VIDEO_STREAM_CHUNK_BYTES):
+            if limit is not None:
+                if len(chunk) >= limit:
+                    yield chunk[:limit]
+                    return
+                limit -= len(chunk)
+            yield chunk
+    finally:
+        body.close()
+
+
+def _get_s3_range(bucket: str, key: str, first: int, last: int) -> bytes:
+    body = s3_client.get_object(Bucket=bucket, Key=key, Range=f'bytes={first}-{last}')['Body']
+    try:
+        return body.read()
+    finally:
+        body.close()
+
+
+def _iter_s3_object_parallel(bucket: str, key: str, response: Dict[str, Any]) -> Iterator[bytes]:
+    """Stream a get_object response, fetching the bytes after its first part as parallel ranged GETs.
+
+    The first part is relayed from ``response`` itself while up to
+    VIDEO_GEN_PROXY_PARALLEL_GETS following parts download in the background;
+    parts are yielded strictly in order.
+    """
+    match = _CONTENT_RANGE_RE.match(response.get('ContentRange') or '')
+    first, last = (int(match[1]), int(match[2])) if match else (0, response['ContentLength'] - 1)
+    part = _S3_MULTIPART_CHUNK_BYTES
+    starts = iter(range(first + part, last + 1, part))
+    window: "deque[Future[bytes]]" = deque()
+
+    def _fill() -> None:
+        while len(window) < VIDEO_GEN_PROXY_PARALLEL_GETS:
+            start = next(starts, None)
+            if start is None:
+                return
+            window.append(_PROXY_POOL.submit(_get_s3_range, bucket, key, start, min(start + part, last + 1) - 1))
+
+    try:
+        _fill()
+        yield from _iter_s3_body(response['Body'], limit=part)
+        while window:
+            data = window.popleft().result()
+            _fill()
+            yield data
+    finally:
+        # Client went away mid-stream; don't keep fetching parts nobody reads.
+        for pending in window:
+            pending.cancel()
+
+
 @app.route('/video/<generation_id>', methods=['GET'])
 def stream_video(generation_id):
     """Proxy endpoint to stream video from S3 with proper headers"""
     try:
-        # Find the video in history
-        entry = None
-        for item in GENERATION_HISTORY:
-            if item['id'] == generation_id:
-                entry = item
-                break
-        
+        entry = _history_get(generation_id)
         if not entry:
             return jsonify({"error": "Video not found"}), 404
         
@@ -1000,18 +1871,50 @@ def stream_video(generation_id):
         s3_key = entry.get('s3_key')
         if not s3_key:
             return jsonify({"error": "Video file not found"}), 404
-            
-        response = s3_client.get_object(Bucket=S3_BUCKET, Key=s3_key)
-        
-        # Return video with proper headers
+
+        if VIDEO_GEN_STREAM_VIDEO_REDIRECT:
+            # The cached signature keeps the target stable across refreshes; while
+            # the audio mux is pending the target is about to move, so don't cache it.
+            target = redirect(_presigned_get_url(s3_key, 'video/mp4', VIDEO_URL_TTL), code=302)
+            if entry.get('audio_status') == 'pending':
+                target.headers['Cache-Control'] = 'no-store'
+            else:
+                target.headers['Cache-Control'] = 'private, max-age=3000'
+            return target
+
+        # Forward the player's Range so seeking fetches only the bytes it needs.
+        get_kwargs = {'Bucket': S3_BUCKET, 'Key': s3_key}
+        range_header = request.headers.get('Range')
+        if range_header:
+            get_kwargs['Range'] = range_header
+        try:
+            response = s3_client.get_object(**get_kwargs)
+        except ClientError as exc:
+            if exc.response.get('Error', {}).get('Code') == 'InvalidRange':
+                return Response(status=416, headers={'Accept-Ranges': 'bytes'})
+            raise
+
+        headers = {
+            'Accept-Ranges': 'bytes',
+            'Content-Type': 'video/mp4',
+            'Content-Length': str(response['ContentLength']),
+            'Access-Control-Allow-Origin': '*'
+        }
+        content_range = response.get('ContentRange')
+        if content_range:
+            headers['Content-Range'] = content_range
+
+        # Return video with proper headers, relaying S3 chunks as they arrive
+        if VIDEO_GEN_PROXY_PARALLEL_GETS > 1 and response['ContentLength'] > _S3_MULTIPART_CHUNK_BYTES:
+            body = _iter_s3_object_parallel(S3_BUCKET, s3_key, response)
+        else:
+            body = _iter_s3_body(response['Body'])
         return Response(
-            response['Body'].read(),
+            body,
+            status=206 if content_range else 200,
             mimetype='video/mp4',
-            headers={
-                'Accept-Ranges': 'bytes',
-                'Content-Type': 'video/mp4',
-                'Access-Control-Allow-Origin': '*'
-            }
+            headers=headers,
+            direct_passthrough=True,
         )
     except Exception as e:
         app.logger.error(f"Error streaming video: {e}")
@@ -1026,5 +1929,9 @@ if __name__ == "__main__":
     # Ensure S3 bucket exists
     ensure_s3_bucket()
     
-    # Start Flask app
-    app.run(host="0.0.0.0", port=5009, debug=False)
+    # Start Flask app. History, finalize jobs and caches are lock-guarded, so
+    # requests can run on a thread pool; the dev server is the fallback.
+    if serve is not None:
+        serve(app, host="0.0.0.0", port=5009, threads=int(os.getenv('VIDEO_GEN_THREADS', '16')))
+    else:
+        app.run(host="0.0.0.0", port=5009, debug=False, threaded=True)
@@ -6,6 +6,7 @@ Check available AWS Bedrock models, especially video generation models
 import os
 import boto3
 import json
+from collections import defaultdict
 
 # Initialize Bedrock client
 region = os.environ.get('AWS_REGION')
@@ -24,8 +25,17 @@ try:
     
     print(f"Total models available: {len(all_models)}\n")
     
-    # Filter for video models
-    video_models = [m for m in all_models if 'VIDEO' in m.get('outputModalities', [])]
+    # Bucket models for every report below in a single pass
+    video_models = []
+    nova_models = []
+    modality_groups = defaultdict(list)
+    for model in all_models:
+        output_modalities = model.get('outputModalities', [])
+        if 'VIDEO' in output_modalities:
+            video_models.append(model)
+        if 'nova' in model['modelId'].lower():
+            nova_models.append(model)
+        modality_groups[', '.join(sorted(output_modalities))].append(model['modelId'])
     
     print("=" * 80)
     print("VIDEO GENERATION MODELS:")
@@ -51,21 +61,11 @@ try:
     print("ALL AVAILABLE MODELS (showing output modalities):")
     print("=" * 80)
     
-    modality_groups = {}
-    for model in all_models:
-        output_mods = ', '.join(sorted(model.get('outputModalities', [])))
-        if output_mods not in modality_groups:
-            modality_groups[output_mods] = []
-        modality_groups[output_mods].append(model['modelId'])
-    
-    for modality, models in sorted(modality_groups.items()):
+    for modality in sorted(modality_groups):
         print(f"\n{modality}:")
-        for model_id in sorted(models):
+        for model_id in sorted(modality_groups[modality]):
             print(f"  - {model_id}")
     
-    # Check for Nova models specifically
-    nova_models = [m for m in all_models if 'nova' in m['modelId'].lower()]
-    
     print("\n" + "=" * 80)
     print("AMAZON NOVA MODELS:")
     print("=" * 80)
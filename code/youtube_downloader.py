@@ -6,6 +6,7 @@ can run it manually when needed. The script will NOT run on import.
 
 Dependencies:
   pip install pytube==12.1.0
+  pip install yt-dlp   # optional fallback; used in-process when importable
 
 Usage (CLI):
   python code/youtube_downloader.py --url "https://youtube.com/watch?v=..." --output . --filename myvideo.mp4
@@ -23,6 +24,7 @@ import re
 import sys
 import subprocess
 import shutil
+from functools import lru_cache
 from typing import Callable, Optional
 
 # Default download directory requested by the user
@@ -33,9 +35,49 @@ try:
 except Exception as exc:  # pragma: no cover - user environment
     YouTube = None
 
-# Optional fallback using yt-dlp via subprocess for robustness
+try:
+    import yt_dlp
+except ImportError:  # pragma: no cover - optional dependency
+    yt_dlp = None
+
+# yt-dlp errors that no other format selection can get around; retrying them just
+# repeats the same request against YouTube.
+_YTDLP_FATAL_MARKERS = (
+    "Sign in to confirm",
+    "HTTP Error 403",
+    "HTTP Error 429",
+    "Video unavailable",
+    "Private video",
+)
+
+
+@lru_cache(maxsize=16)
+def _which_on_path(binary_name: str, search_path: str) -> Optional[str]:
+    return shutil.which(binary_name, path=search_path)
+
+
+def _which(binary_name: str) -> Optional[str]:
+    # Keyed on PATH because _check_ffmpeg_available may extend it at runtime.
+    return _which_on_path(binary_name, os.environ.get("PATH", os.defpath))
+
+
+# Provide a common browser UA to avoid trivial bot blocks
+_YTDLP_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+# Try progressively simpler format selections to avoid 403/unsupported combos.
+# Priority: 1080p with audio merge, fallback to 720p, then any quality
+_YTDLP_FORMAT_CANDIDATES = (
+    "bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]",
+    "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=720]+bestaudio/best[height<=720]",
+    "bestvideo*+bestaudio/best",
+    "bv*[ext=mp4]+ba[ext=m4a]/best[ext=mp4]/best",
+    "22/18/best",
+)
+
+
+# Optional fallback using yt-dlp for robustness
 def _download_with_ytdlp(url: str, output_path: str, filename: Optional[str] = None, cookies: Optional[str] = None) -> str:
-    """Fallback downloader using yt-dlp CLI. Returns absolute path to saved file."""
+    """Fallback downloader using yt-dlp. Returns absolute path to saved file."""
     # Build output template
     os.makedirs(output_path, exist_ok=True)
     if filename:
@@ -44,13 +86,82 @@ def _download_with_ytdlp(url: str, output_path: str, filename: Optional[str] = N
         out_template = os.path.join(output_path, '%(title)s.%(ext)s')
 
     # ffmpeg availability should already be checked and PATH set by caller
-    ffmpeg_path = shutil.which("ffmpeg")
-    has_ffmpeg = ffmpeg_path is not None
+    ffmpeg_path = _which("ffmpeg")
 
+    # The in-process API keeps one YoutubeDL session (extractor state, cookies,
+    # connections) across format attempts; the CLI is the last resort.
+    if yt_dlp is not None:
+        saved_path = _download_with_ytdlp_api(url, out_template, ffmpeg_path, cookies)
+    else:
+        _download_with_ytdlp_cli(url, out_template, ffmpeg_path, cookies)
+        saved_path = None
+
+    # If filename provided, return that path; otherwise try to find the file
+    if filename:
+        return os.path.abspath(os.path.join(output_path, filename))
+    if saved_path:
+        return os.path.abspath(saved_path)
+    # Attempt to find the most recently modified file in output_path
+    with os.scandir(output_path) as entries:
+        newest = max(
+            (entry for entry in entries if entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime,
+            default=None,
+        )
+    return os.path.abspath(newest.path) if newest else os.path.abspath(output_path)
+
+
+def _download_with_ytdlp_api(url: str, out_template: str, ffmpeg_path: Optional[str], cookies: Optional[str]) -> Optional[str]:
+    """Download through the yt_dlp package; returns the saved file path when yt-dlp reports it."""
+    options = {
+        "outtmpl": out_template,
+        "quiet": True,
+        "no_warnings": True,
+        # Try to bypass geo-restrictions and ignore certificate issues if present
+        "geo_bypass": True,
+        "nocheckcertificate": True,
+        "http_headers": {"User-Agent": _YTDLP_USER_AGENT},
+    }
+    if ffmpeg_path:
+        options.update({
+            "merge_output_format": "mp4",
+            "hls_prefer_native": False,
+            "ffmpeg_location": ffmpeg_path,  # Explicitly tell yt-dlp where ffmpeg is
+        })
+    else:
+        # Native muxing avoids ffmpeg requirement; yt-dlp will warn if merging isn't possible
+        options["hls_prefer_native"] = True
+    # If a cookies file is provided (exported from your browser), pass it to yt-dlp
+    if cookies:
+        options["cookiefile"] = cookies
+
+    last_exc: Optional[Exception] = None
+    with yt_dlp.YoutubeDL(options) as ydl:
+        for fmt in _YTDLP_FORMAT_CANDIDATES:
+            # YoutubeDL compiles its format selector once in __init__, so swap the
+            # compiled selector along with the param; the session is reused across candidates.
+            ydl.params["format"] = fmt
+            ydl.format_selector = ydl.build_format_selector(fmt)
+            for attempt in range(1, 3):
+                try:
+                    info = ydl.extract_info(url, download=True)
+                except yt_dlp.utils.DownloadError as exc:
+                    last_exc = RuntimeError(f"yt-dlp failed (format {fmt}, attempt {attempt}): {exc}")
+                    if any(marker in str(exc) for marker in _YTDLP_FATAL_MARKERS):
+                        raise RuntimeError(f"yt-dlp fallback failed after retries: {last_exc}") from exc
+                    continue
+                downloads = (info or {}).get("requested_downloads") or [{}]
+                return downloads[0].get("filepath")
+
+    raise RuntimeError(f"yt-dlp fallback failed after retries: {last_exc}") from last_exc
+
+
+def _download_with_ytdlp_cli(url: str, out_template: str, ffmpeg_path: Optional[str], cookies: Optional[str]) -> None:
+    """Download by running the yt-dlp executable (or ``python -m yt_dlp``)."""
     # Request yt-dlp to merge best video + best audio into an MP4 when possible.
     # Add flags to improve robustness for restricted/geoblocked content and
     # capture stderr/stdout for better diagnostics.
-    yt_dlp_exe = shutil.which("yt-dlp")
+    yt_dlp_exe = _which("yt-dlp")
     if yt_dlp_exe:
         base_cmd = [
             yt_dlp_exe,
@@ -65,13 +176,12 @@ def _download_with_ytdlp(url: str, output_path: str, filename: Optional[str] = N
         # Try to bypass geo-restrictions and ignore certificate issues if present
         "--geo-bypass",
         "--no-check-certificate",
-        # Provide a common browser UA to avoid trivial bot blocks
-        "--user-agent", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+        "--user-agent", _YTDLP_USER_AGENT,
         # Let yt-dlp auto-select the best client strategy
         # (defaults to trying android, ios, web in order based on availability)
     ])
 
-    if has_ffmpeg:
+    if ffmpeg_path:
         base_cmd.extend([
             "--merge-output-format", "mp4",
             "--hls-prefer-ffmpeg",
@@ -85,21 +195,12 @@ def _download_with_ytdlp(url: str, output_path: str, filename: Optional[str] = N
     if cookies:
         base_cmd.extend(["--cookies", cookies])
 
-    # Try progressively simpler format selections to avoid 403/unsupported combos.
-    # Priority: 1080p with audio merge, fallback to 720p, then any quality
-    format_candidates = [
-        "bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=1080]+bestaudio/best[height<=1080]",
-        "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/bestvideo[height<=720]+bestaudio/best[height<=720]",
-        "bestvideo*+bestaudio/best",
-        "bv*[ext=mp4]+ba[ext=m4a]/best[ext=mp4]/best",
-        "22/18/best",
-    ]
-
     # Pass the modified environment with ffmpeg PATH to subprocess
     env = os.environ.copy()
     
     last_exc: Optional[Exception] = None
-    for fmt in format_candidates:
+    fatal = False
+    for fmt in _YTDLP_FORMAT_CANDIDATES:
         cmd = base_cmd + ["-f", fmt, url]
         for attempt in range(1, 3):
             try:
@@ -110,40 +211,43 @@ def _download_with_ytdlp(url: str, output_path: str, filename: Optional[str] = N
                 last_exc = RuntimeError(
                     f"yt-dlp failed (format {fmt}, attempt {attempt}): returncode={proc.returncode}\nstdout:\n{proc.stdout}\nstderr:\n{proc.stderr}"
                 )
+                if any(marker in proc.stderr for marker in _YTDLP_FATAL_MARKERS):
+                    fatal = True
+                    break
             except Exception as exc:
                 last_exc = exc
-        if last_exc is None:
+        if last_exc is None or fatal:
             break
 
     if last_exc is not None:
         raise RuntimeError(f"yt-dlp fallback failed after retries: {last_exc}") from last_exc
 
-    # If filename provided, return that path; otherwise try to find the file
-    if filename:
-        return os.path.abspath(os.path.join(output_path, filename))
-    # Attempt to find the most recently modified file in output_path
-    candidates = sorted(
-        (os.path.join(output_path, p) for p in os.listdir(output_path)),
-        key=lambda p: os.path.getmtime(p),
-        reverse=True,
-    )
-    return os.path.abspath(candidates[0]) if candidates else os.path.abspath(output_path)
+
+_UNSAFE_FILENAME_RE = re.compile(r"[\\/:*?\"<>|]+")
 
 
 def _sanitize_filename(name: str) -> str:
     """Make a filesystem-safe filename from a video title."""
-    name = name.strip()
     # Replace path separators and control chars
-    name = re.sub(r"[\\/:*?\"<>|]+", "_", name)
+    name = _UNSAFE_FILENAME_RE.sub("_", name.strip())
     # Collapse whitespace
-    name = re.sub(r"\s+", " ", name)
-    return name
+    return " ".join(name.split())
+
+
+def _progressive_stream_rank(stream) -> tuple[int, int]:
+    """Sort key for pytube streams: numeric height (e.g. "720p" -> 720), then filesize."""
+    resolution = getattr(stream, "resolution", None) or "0p"
+    try:
+        height = int(resolution.rstrip("p"))
+    except ValueError:
+        height = 0
+    return height, getattr(stream, "filesize", 0) or 0
 
 
 def _check_ffmpeg_available() -> bool:
     """Check if ffmpeg is available, adding venv bin to PATH if needed."""
     # First check if already in PATH
-    if shutil.which("ffmpeg") is not None:
+    if _which("ffmpeg") is not None:
         return True
     
     # Try to find ffmpeg in venv and add to PATH
@@ -154,7 +258,7 @@ def _check_ffmpeg_available() -> bool:
     if os.path.isdir(venv_bin) and venv_bin not in os.environ.get('PATH', ''):
         os.environ['PATH'] = venv_bin + os.pathsep + os.environ.get('PATH', '')
     
-    return shutil.which("ffmpeg") is not None
+    return _which("ffmpeg") is not None
 
 
 def download_youtube(
@@ -197,17 +301,9 @@ def download_youtube(
         yt = YouTube(url)
         
         # Otherwise, try pytube progressive streams as fallback
-        progressive_streams = list(yt.streams.filter(progressive=True, file_extension="mp4"))
-        if progressive_streams:
-            # Sort by resolution first, then filesize for best quality
-            progressive_streams.sort(
-                key=lambda s: (getattr(s, "resolution", "0p").rstrip("p") if hasattr(s, "resolution") else 0, 
-                              getattr(s, "filesize", 0) or 0),
-                reverse=True
-            )
-            stream = progressive_streams[0]
-        else:
-            stream = None
+        progressive_streams = yt.streams.filter(progressive=True, file_extension="mp4")
+        # Highest resolution first, then filesize for best quality
+        stream = max(progressive_streams, key=_progressive_stream_rank, default=None)
 
         if stream is None:
             # No suitable progressive mp4 stream available through pytube.
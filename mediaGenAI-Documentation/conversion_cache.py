@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache shared by the Markdown converters.
+
+Maps each generated file to a hash of the Markdown (and the converter,
+including its source code, see builder_version) it was built from, stored as
+.cache.json in the output directory, so unchanged files can be skipped. Outputs
+are written through open_output so the cache never vouches for a half-written
+file.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+
+CACHE_FILENAME = '.cache.json'
+
+def builder_version(name, *source_files):
+    """Builder id for source_digest: name plus a hash of the files that render the output
+    
+    Pass the converter's own module (template, CSS and rendering code), so any
+    edit to it invalidates the outputs it cached earlier.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for path in source_files:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return f"{name}:{digest.hexdigest()}"
+
+def source_digest(md_content, builder):
+    """Hash of a Markdown source as rendered by the named converter"""
+    digest = hashlib.blake2b(builder.encode('utf-8') + b'\0', digest_size=16)
+    digest.update(md_content.encode('utf-8'))
+    return digest.hexdigest()
+
+def load_cache(output_dir):
+    """Return the {output path: source digest} map for output_dir (empty if missing)"""
+    try:
+        with open(os.path.join(output_dir, CACHE_FILENAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def is_current(cache, output_path, md_content, builder):
+    """True if output_path exists and builder last made it from exactly md_content"""
+    return cache.get(output_path) == source_digest(md_content, builder) and os.path.exists(output_path)
+
+@contextlib.contextmanager
+def open_output(path):
+    """Open a temp file next to path for binary writing; it replaces path only on success"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+def save_cache(output_dir, cache):
+    """Write the cache atomically so an interrupted run never leaves it half-written"""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, CACHE_FILENAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def record(cache, output_path, md_content, builder):
+    """Remember that builder just made output_path from md_content"""
+    cache[output_path] = source_digest(md_content, builder)
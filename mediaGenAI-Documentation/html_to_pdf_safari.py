@@ -4,8 +4,170 @@ HTML to PDF Converter using macOS Safari/Chrome
 """
 
 import os
+import base64
+import json
+import shutil
 import subprocess
 import glob
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import websocket  # websocket-client
+except ImportError:  # pragma: no cover - optional dependency
+    websocket = None
+
+CHROME_CANDIDATES = [
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    'google-chrome',
+    'chromium',
+]
+
+def find_chrome():
+    """Return a Chrome/Chromium executable, or None if none is installed"""
+    for candidate in CHROME_CANDIDATES:
+        if os.path.isfile(candidate) or shutil.which(candidate):
+            return candidate
+    return None
+
+def convert_html_to_pdf_chrome(chrome, html_file):
+    """Convert HTML to PDF with headless Chrome (no UI, no fixed delays)"""
+    
+    pdf_file = html_file.replace('.html', '.pdf')
+    abs_html_path = os.path.abspath(html_file)
+    
+    try:
+        subprocess.run([
+            chrome,
+            '--headless',
+            '--disable-gpu',
+            '--no-pdf-header-footer',
+            f'--print-to-pdf={os.path.abspath(pdf_file)}',
+            f'file://{abs_html_path}',
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+        if os.path.exists(pdf_file):
+            return pdf_file
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    
+    return None
+
+class ChromePrintSession:
+    """One headless Chrome driven over the DevTools protocol, reused for every file"""
+    
+    def __init__(self, chrome, timeout=30):
+        self.timeout = timeout
+        self._profile = tempfile.mkdtemp(prefix='chrome-pdf-')
+        self._proc = subprocess.Popen([
+            chrome,
+            '--headless',
+            '--disable-gpu',
+            '--remote-debugging-port=0',
+            f'--user-data-dir={self._profile}',
+            'about:blank',
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self._ws = None
+        self._next_id = 0
+        self._events = []
+        try:
+            self._ws = websocket.create_connection(self._browser_ws_url(), timeout=timeout, suppress_origin=True)
+        except Exception:
+            self.close()
+            raise
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _browser_ws_url(self):
+        # With port 0 Chrome picks a free port and records it in the profile
+        port_file = os.path.join(self._profile, 'DevToolsActivePort')
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                raise RuntimeError('Chrome exited during startup')
+            try:
+                with open(port_file, 'r', encoding='utf-8') as f:
+                    port, path = f.read().split()[:2]
+                return f'ws://127.0.0.1:{port}{path}'
+            except (OSError, ValueError):
+                time.sleep(0.05)
+        raise TimeoutError('Chrome did not open its DevTools port')
+    
+    def _call(self, method, params=None, session_id=None):
+        self._next_id += 1
+        message = {'id': self._next_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        self._ws.send(json.dumps(message))
+        while True:
+            reply = json.loads(self._ws.recv())
+            if reply.get('id') == self._next_id:
+                if 'error' in reply:
+                    raise RuntimeError(f"{method}: {reply['error'].get('message')}")
+                return reply.get('result', {})
+            if 'method' in reply:
+                self._events.append(reply)
+    
+    def _wait_for_event(self, method, session_id):
+        while True:
+            for i, event in enumerate(self._events):
+                if event['method'] == method and event.get('sessionId') == session_id:
+                    return self._events.pop(i)
+            reply = json.loads(self._ws.recv())
+            if 'method' in reply:
+                self._events.append(reply)
+    
+    def print_to_pdf(self, html_file):
+        """Print one HTML file to PDF in a fresh tab; returns the PDF path or None"""
+        pdf_file = html_file.replace('.html', '.pdf')
+        target_id = self._call('Target.createTarget', {'url': 'about:blank'})['targetId']
+        try:
+            session_id = self._call('Target.attachToTarget', {'targetId': target_id, 'flatten': True})['sessionId']
+            self._call('Page.enable', session_id=session_id)
+            self._call('Page.navigate', {'url': f'file://{os.path.abspath(html_file)}'}, session_id)
+            self._wait_for_event('Page.loadEventFired', session_id)
+            result = self._call('Page.printToPDF', {'printBackground': True, 'displayHeaderFooter': False}, session_id)
+        except RuntimeError:
+            return None
+        finally:
+            self._call('Target.closeTarget', {'targetId': target_id})
+            self._events.clear()
+        with open(pdf_file, 'wb') as f:
+            f.write(base64.b64decode(result['data']))
+        return pdf_file
+    
+    def close(self):
+        if self._ws is not None:
+            self._ws.close()
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+        shutil.rmtree(self._profile, ignore_errors=True)
+
+def print_html_files_with_chrome(chrome, html_files):
+    """Print HTML files to PDF with Chrome; returns a PDF path (or None) per file
+    
+    With websocket-client installed a single Chrome prints every file, so its
+    startup is paid once; otherwise one Chrome process per file runs in parallel.
+    """
+    if websocket is not None:
+        try:
+            with ChromePrintSession(chrome) as session:
+                return [session.print_to_pdf(html_file) for html_file in html_files]
+        except Exception as e:
+            print(f"⚠️  Shared Chrome session failed ({e}); starting one Chrome per file")
+    
+    # Each file is an independent Chrome process, so convert them side by side.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+        return list(pool.map(lambda html_file: convert_html_to_pdf_chrome(chrome, html_file), html_files))
 
 def convert_html_to_pdf_safari(html_file):
     """Convert HTML to PDF using macOS tools"""
@@ -13,7 +175,7 @@ def convert_html_to_pdf_safari(html_file):
     pdf_file = html_file.replace('.html', '.pdf')
     abs_html_path = os.path.abspath(html_file)
     
-    # Method 1: Try using Safari's print-to-pdf (via AppleScript)
+    # Fallback: Safari's print-to-pdf (via AppleScript UI scripting)
     applescript = f'''
     tell application "Safari"
         activate
@@ -55,9 +217,15 @@ def main():
     
     success_count = 0
     
-    for html_file in html_files:
+    chrome = find_chrome()
+    if chrome:
+        results = print_html_files_with_chrome(chrome, html_files)
+    else:
+        # Safari is driven through its UI, one window at a time.
+        results = map(convert_html_to_pdf_safari, html_files)
+    
+    for html_file, pdf_file in zip(html_files, results):
         print(f"📄 Converting: {html_file}")
-        pdf_file = convert_html_to_pdf_safari(html_file)
         
         if pdf_file:
             success_count += 1
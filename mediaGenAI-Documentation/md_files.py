@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Markdown file discovery shared by the converters
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Directories that never hold documentation sources
+SKIP_DIRS = {'node_modules', 'pdfs', '__pycache__'}
+
+def find_markdown_files(root='.'):
+    """Return the .md files under root (like glob("**/*.md", recursive=True))
+    
+    Walks with os.scandir so directory entries don't need an extra stat, skips
+    hidden directories and SKIP_DIRS, and doesn't follow directory symlinks.
+    """
+    found = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        pending.append(entry.path)
+                elif entry.name.endswith('.md'):
+                    found.append(os.path.relpath(entry.path, root) if root == '.' else entry.path)
+    return sorted(found)
+
+def _read_markdown(md_file_path):
+    try:
+        with open(md_file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        print(f"Error reading {md_file_path}: {e}")
+        return None
+
+def read_markdown_files(md_files, max_workers=16):
+    """Return the contents of md_files in order (None for any that can't be read)
+    
+    Reads are issued together on a thread pool so disk latency overlaps, rather
+    than each conversion worker blocking on its own read before starting work.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_read_markdown, md_files))
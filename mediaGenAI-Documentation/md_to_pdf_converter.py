@@ -5,32 +5,28 @@ Converts all .md files in the workspace to PDF format
 """
 
 import os
-import glob
+import re
 import markdown
-from weasyprint import HTML, CSS
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from string import Template
 import sys
 
-def convert_md_to_pdf(md_file_path, output_dir="pdfs"):
-    """Convert a single markdown file to PDF"""
-    
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Read markdown file
-    try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-    except Exception as e:
-        print(f"Error reading {md_file_path}: {e}")
-        return False
-    
-    # Convert markdown to HTML
-    html = markdown.markdown(md_content, extensions=['tables', 'fenced_code', 'toc'])
-    
-    # Add CSS styling for better PDF appearance
-    css_styles = """
-    <style>
+from conversion_cache import builder_version, is_current, load_cache, open_output, record, save_cache
+from md_files import find_markdown_files, read_markdown_files
+import html_to_pdf_safari
+from html_to_pdf_safari import find_chrome, print_html_files_with_chrome
+
+try:
+    from weasyprint import HTML, CSS, default_url_fetcher
+except ImportError:  # pragma: no cover - optional dependency
+    HTML = CSS = default_url_fetcher = None
+
+# Add CSS styling for better PDF appearance. Split by the elements each block
+# styles so WeasyPrint only parses and cascades rules a document can match.
+_CSS_BASE = """
     body {
         font-family: Arial, sans-serif;
         line-height: 1.6;
@@ -50,23 +46,47 @@ def convert_md_to_pdf(md_file_path, output_dir="pdfs"):
         border-bottom: 2px solid #e74c3c;
         padding-bottom: 5px;
     }
+    ul, ol {
+        margin: 15px 0;
+        padding-left: 30px;
+    }
+    li {
+        margin: 5px 0;
+    }
+"""
+
+# (tag that must appear in the body, rules for it)
+_CSS_FRAGMENTS = (
+    ("<code", """
+    /* Keep code on WeasyPrint's normal line breaking: break-all/anywhere make it
+       lay out every letter separately, which is pathologically slow */
+    pre, code {
+        overflow-wrap: normal;
+        word-break: normal;
+        white-space: pre;
+    }
     code {
         background-color: #f8f9fa;
         padding: 2px 4px;
         border-radius: 3px;
         font-family: 'Courier New', monospace;
     }
+"""),
+    ("<pre", """
     pre {
         background-color: #f8f9fa;
         border: 1px solid #e9ecef;
         border-radius: 5px;
         padding: 15px;
-        overflow-x: auto;
     }
+"""),
+    ("<table", """
     table {
         border-collapse: collapse;
         width: 100%;
         margin: 20px 0;
+        /* Column widths come from the first row instead of measuring every cell */
+        table-layout: fixed;
     }
     table, th, td {
         border: 1px solid #ddd;
@@ -79,49 +99,143 @@ def convert_md_to_pdf(md_file_path, output_dir="pdfs"):
         background-color: #f2f2f2;
         font-weight: bold;
     }
+"""),
+    ("<blockquote", """
     blockquote {
         border-left: 4px solid #3498db;
         margin: 20px 0;
         padding: 10px 20px;
         background-color: #f8f9fa;
     }
-    ul, ol {
-        margin: 15px 0;
-        padding-left: 30px;
-    }
-    li {
-        margin: 5px 0;
-    }
-    </style>
-    """
-    
-    # Create full HTML document
-    html_content = f"""
+"""),
+)
+
+# Full HTML document; only the title, stylesheet and body vary per file
+_HTML_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
-        <title>{Path(md_file_path).stem}</title>
-        {css_styles}
+        <title>$title</title>
+        <style>$css</style>
     </head>
     <body>
-        {html}
+        $body
     </body>
     </html>
-    """
+    """)
+
+# Unbroken prose tokens (URLs, hashes) that need explicit break opportunities
+_LONG_TOKEN_RE = re.compile(r'\S{40,}')
+_URL_BREAK_RE = re.compile(r'([/._?=-])')
+# Tags and code spans/blocks, which must pass through untouched
+_MARKUP_RE = re.compile(r'(<pre\b.*?</pre>|<code\b.*?</code>|<[^>]+>)', re.DOTALL)
+
+def _break_long_token(match):
+    token = match.group(0)
+    if _URL_BREAK_RE.search(token):
+        return _URL_BREAK_RE.sub(r'\1<wbr>', token)
+    if '&' in token:
+        # Could split an entity; leave it to the default overflow handling
+        return token
+    return '<wbr>'.join(token[i:i + 32] for i in range(0, len(token), 32))
+
+def add_break_opportunities(html):
+    """Insert <wbr> into long unbroken words in prose, leaving tags and code alone"""
+    parts = _MARKUP_RE.split(html)
+    for i in range(0, len(parts), 2):
+        if len(parts[i]) >= 40:
+            parts[i] = _LONG_TOKEN_RE.sub(_break_long_token, parts[i])
+    return "".join(parts)
+
+def css_for(html):
+    """Return the stylesheet rules needed by the elements present in html"""
+    return _CSS_BASE + "".join(rules for tag, rules in _CSS_FRAGMENTS if tag in html)
+
+# Cache ids for each backend; they change whenever the code that renders the PDFs does
+_WEASYPRINT_BUILDER = builder_version('weasyprint', __file__)
+_CHROME_BUILDER = builder_version('chrome', __file__, html_to_pdf_safari.__file__)
+
+# Built once per process: extension setup and regex compilation aren't repeated per file
+_MD = markdown.Markdown(extensions=['tables', 'fenced_code', 'toc'])
+
+@lru_cache(maxsize=256)
+def _fetch_resource(url):
+    # Failed fetches raise, so only successful downloads are cached
+    resource = default_url_fetcher(url)
+    if 'file_obj' in resource:
+        with resource.pop('file_obj') as f:
+            resource['string'] = f.read()
+    return resource
+
+def cached_url_fetcher(url):
+    """WeasyPrint url_fetcher that downloads each image/font once per worker process"""
+    return dict(_fetch_resource(url))
+
+def render_html(md_file_path, md_content):
+    """Return the full styled HTML document for a markdown source"""
+    html = add_break_opportunities(_MD.reset().convert(md_content))
+    return _HTML_TEMPLATE.substitute(title=Path(md_file_path).stem, css=css_for(html), body=html)
+
+def convert_md_to_pdf(md_file_path, md_content, output_dir="pdfs", cache=None):
+    """Convert a single markdown file, already read into md_content, to PDF (skipped if cache shows it unchanged)"""
+    
+    # Source couldn't be read (already reported by read_markdown_files)
+    if md_content is None:
+        return False
     
     # Generate PDF filename
     pdf_filename = os.path.join(output_dir, Path(md_file_path).stem + '.pdf')
     
+    if cache is not None and is_current(cache, pdf_filename, md_content, _WEASYPRINT_BUILDER):
+        print(f"⏭️  Unchanged: {md_file_path} → {pdf_filename}")
+        return True
+    
+    # Convert markdown to a full HTML document
+    html_content = render_html(md_file_path, md_content)
+    
     try:
         # Convert HTML to PDF
-        HTML(string=html_content).write_pdf(pdf_filename)
+        with open_output(pdf_filename) as f:
+            HTML(string=html_content, url_fetcher=cached_url_fetcher).write_pdf(target=f)
         print(f"✅ Converted: {md_file_path} → {pdf_filename}")
         return True
     except Exception as e:
         print(f"❌ Error converting {md_file_path}: {e}")
         return False
 
+def convert_all_with_chrome(chrome, md_files, contents, output_dir="pdfs", cache=None):
+    """Convert markdown files to PDF by printing their HTML with headless Chrome
+    
+    Chrome lays out the same HTML much faster than WeasyPrint, and every stale
+    file goes through one shared browser. Returns True/False per file, like
+    convert_md_to_pdf.
+    """
+    results = [md_content is not None for md_content in contents]
+    pending = {}  # HTML file -> (index, PDF path)
+    with tempfile.TemporaryDirectory(dir=output_dir) as tmp_dir:
+        for i, (md_file_path, md_content) in enumerate(zip(md_files, contents)):
+            if md_content is None:
+                continue
+            pdf_filename = os.path.join(output_dir, Path(md_file_path).stem + '.pdf')
+            if cache is not None and is_current(cache, pdf_filename, md_content, _CHROME_BUILDER):
+                print(f"⏭️  Unchanged: {md_file_path} → {pdf_filename}")
+                continue
+            html_file = os.path.join(tmp_dir, f"{i}.html")
+            with open(html_file, 'w', encoding='utf-8') as f:
+                f.write(render_html(md_file_path, md_content))
+            pending[html_file] = (i, pdf_filename)
+        
+        for html_file, pdf_file in zip(pending, print_html_files_with_chrome(chrome, list(pending))):
+            i, pdf_filename = pending[html_file]
+            if pdf_file:
+                os.replace(pdf_file, pdf_filename)
+                print(f"✅ Converted: {md_files[i]} → {pdf_filename}")
+            else:
+                results[i] = False
+                print(f"❌ Error converting {md_files[i]}: Chrome could not print it")
+    return results
+
 def main():
     """Main function to convert all markdown files"""
     
@@ -130,7 +244,7 @@ def main():
     print(f"🔍 Searching for .md files in: {current_dir}")
     
     # Find all markdown files recursively
-    md_files = glob.glob("**/*.md", recursive=True)
+    md_files = find_markdown_files()
     
     if not md_files:
         print("❌ No .md files found in the current directory and subdirectories")
@@ -142,13 +256,32 @@ def main():
     
     print("\n🔄 Starting conversion process...")
     
-    success_count = 0
     total_files = len(md_files)
     
-    # Convert each file
-    for md_file in md_files:
-        if convert_md_to_pdf(md_file):
-            success_count += 1
+    # Create the output directory once; the per-file converters assume it exists
+    os.makedirs("pdfs", exist_ok=True)
+    
+    contents = read_markdown_files(md_files)
+    cache = load_cache("pdfs")
+    chrome = find_chrome()
+    if chrome:
+        # Headless Chrome when installed; WeasyPrint is only the fallback
+        builder = _CHROME_BUILDER
+        results = convert_all_with_chrome(chrome, md_files, contents, cache=cache)
+    elif HTML is not None:
+        # Convert each file; WeasyPrint layout is CPU-bound, so use one process per core
+        builder = _WEASYPRINT_BUILDER
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = list(pool.map(partial(convert_md_to_pdf, cache=cache), md_files, contents))
+    else:
+        print("❌ Neither Chrome nor WeasyPrint is available; install one of them")
+        return
+    success_count = sum(results)
+    
+    for md_file, md_content, converted in zip(md_files, contents, results):
+        if converted:
+            record(cache, os.path.join("pdfs", Path(md_file).stem + '.pdf'), md_content, builder)
+    save_cache("pdfs", cache)
     
     print(f"\n📊 Conversion Summary:")
     print(f"   ✅ Successfully converted: {success_count}/{total_files} files")
@@ -1,33 +1,40 @@
 #!/usr/bin/env python3
 """
-HTML File Opener - Opens all HTML files in browser for manual PDF conversion
+HTML File Opener - Converts all HTML files to PDF with headless Chrome, or
+opens them in the browser for manual PDF conversion when Chrome is missing
 """
 
 import os
 import webbrowser
 import glob
-import time
 
-def main():
+from html_to_pdf_safari import find_chrome, print_html_files_with_chrome
+
+def convert_all_headless(chrome, html_files):
+    """Print every HTML file to PDF with headless Chrome"""
+    print(f"🖨️  Printing {len(html_files)} files to PDF with headless Chrome...")
+    
+    results = print_html_files_with_chrome(chrome, html_files)
+    
+    success_count = 0
+    for html_file, pdf_file in zip(html_files, results):
+        if pdf_file:
+            success_count += 1
+            print(f"   ✅ {os.path.basename(html_file)} → {pdf_file}")
+        else:
+            print(f"   ❌ Failed: {os.path.basename(html_file)}")
+    
+    print()
+    print(f"🎉 {success_count}/{len(html_files)} HTML files converted to PDF")
+
+def open_all_in_browser(html_files):
+    """Open every HTML file in the default browser for manual printing"""
     print("🌐 Opening HTML files in your default browser...")
     print("💡 For each file that opens:")
     print("   1. Press Cmd+P (or Ctrl+P)")  
     print("   2. Choose 'Save as PDF' or 'Print to PDF'")
     print("   3. Save the PDF to your desired location")
     print()
-    
-    html_files = glob.glob("pdfs/*.html")
-    
-    if not html_files:
-        print("❌ No HTML files found in pdfs/ directory")
-        return
-    
-    print(f"📄 Found {len(html_files)} HTML files to convert:")
-    for i, html_file in enumerate(html_files, 1):
-        filename = os.path.basename(html_file)
-        print(f"   {i}. {filename}")
-    
-    print()
     input("Press Enter to start opening files in browser...")
     
     for i, html_file in enumerate(html_files, 1):
@@ -39,10 +46,6 @@ def main():
         try:
             webbrowser.open(file_url)
             print("   ✅ Opened in browser")
-            
-            if i < len(html_files):
-                print("   ⏳ Waiting 3 seconds before opening next file...")
-                time.sleep(3)
         except Exception as e:
             print(f"   ❌ Error opening: {e}")
     
@@ -50,5 +53,24 @@ def main():
     print("🎉 All HTML files opened!")
     print("💾 Remember to save each one as PDF using Cmd+P → Save as PDF")
 
+def main():
+    html_files = glob.glob("pdfs/*.html")
+    
+    if not html_files:
+        print("❌ No HTML files found in pdfs/ directory")
+        return
+    
+    print(f"📄 Found {len(html_files)} HTML files to convert:")
+    for i, html_file in enumerate(html_files, 1):
+        filename = os.path.basename(html_file)
+        print(f"   {i}. {filename}")
+    
+    print()
+    chrome = find_chrome()
+    if chrome:
+        convert_all_headless(chrome, html_files)
+    else:
+        open_all_in_browser(html_files)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
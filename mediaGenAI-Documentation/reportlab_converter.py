@@ -4,8 +4,9 @@ Advanced Markdown to PDF Converter using ReportLab
 """
 
 import os
-import glob
-import markdown
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from html.parser import HTMLParser
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -15,144 +16,225 @@ from reportlab.lib.colors import HexColor
 from pathlib import Path
 import re
 
+from conversion_cache import builder_version, is_current, load_cache, open_output, record, save_cache
+from md_files import find_markdown_files, read_markdown_files
+
+# Convert code markup to ReportLab-compatible format, in order; each rewrite
+# only runs when its marker substring is present
+_HTML_REWRITES = [
+    ('<pre>', re.compile(r'<pre><code[^>]*>'), '<pre>'),
+    ('</pre>', re.compile(r'</code></pre>'), '</pre>'),
+    ('<code', re.compile(r'<code[^>]*>'), '<font name="Courier">'),
+    ('</code>', re.compile(r'</code>'), '</font>'),
+]
+
+class _UnsupportedTagStripper(HTMLParser):
+    """Re-emit HTML without table subtrees (unsupported for now) and images
+    
+    A single streaming pass, instead of a lazy DOTALL regex that can backtrack
+    across the whole document.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts = []
+        self.table_depth = 0
+
+    def emit(self, text):
+        if not self.table_depth:
+            self.parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            self.table_depth += 1
+        elif tag != 'img':
+            self.emit(self.get_starttag_text())
+
+    def handle_startendtag(self, tag, attrs):
+        if tag != 'img':
+            self.emit(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if tag == 'table':
+            self.table_depth = max(self.table_depth - 1, 0)
+        else:
+            self.emit(f'</{tag}>')
+
+    def handle_data(self, data):
+        self.emit(data)
+
+    def handle_entityref(self, name):
+        self.emit(f'&{name};')
+
+    def handle_charref(self, name):
+        self.emit(f'&#{name};')
+
+    def handle_comment(self, data):
+        self.emit(f'<!--{data}-->')
+
+def strip_unsupported_tags(html_text):
+    """Remove tables and images from HTML"""
+    stripper = _UnsupportedTagStripper()
+    stripper.feed(html_text)
+    stripper.close()
+    return ''.join(stripper.parts)
+
+# Block markers recognised at the start of a line: first token -> line kind
+_LINE_PREFIXES = {
+    '#': 'h1',
+    '##': 'h2',
+    '###': 'h3',
+    '-': 'bullet',
+    '*': 'bullet',
+}
+
+# First characters that can start a non-text line; anything else is plain text
+_MARKER_CHARS = frozenset('#-*`')
+
+# Vertical space before each heading level
+_SPACE_BEFORE = {'h1': 12, 'h2': 10, 'h3': 8}
+
+# Cache id; changes whenever this converter's code or styles do
+_BUILDER = builder_version('reportlab', __file__)
+
+# Style sheet built once per process and shared by every document
+_STYLES = getSampleStyleSheet()
+_STYLES.add(ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=HexColor('#2c3e50'),
+    alignment=1  # Center alignment
+))
+_STYLES.add(ParagraphStyle(
+    'CustomHeading1',
+    parent=_STYLES['Heading1'],
+    fontSize=18,
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=HexColor('#2c3e50')
+))
+_STYLES.add(ParagraphStyle(
+    'CustomHeading2',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    spaceAfter=10,
+    spaceBefore=15,
+    textColor=HexColor('#34495e')
+))
+
+# Style for each block kind
+_BLOCK_STYLES = {
+    'h1': _STYLES['CustomHeading1'],
+    'h2': _STYLES['CustomHeading2'],
+    'h3': _STYLES['Heading3'],
+    'paragraph': _STYLES['Normal'],
+    'bullet': _STYLES['Normal'],
+    'numbered': _STYLES['Normal'],
+}
+
 def clean_html_for_reportlab(html_text):
     """Clean HTML for ReportLab compatibility"""
-    # Remove unsupported tags and convert to ReportLab-compatible format
-    html_text = re.sub(r'<pre><code[^>]*>', '<pre>', html_text)
-    html_text = re.sub(r'</code></pre>', '</pre>', html_text)
-    html_text = re.sub(r'<code[^>]*>', '<font name="Courier">', html_text)
-    html_text = re.sub(r'</code>', '</font>', html_text)
-    html_text = re.sub(r'<table[^>]*>.*?</table>', '', html_text, flags=re.DOTALL)  # Remove tables for now
-    html_text = re.sub(r'<img[^>]*>', '', html_text)  # Remove images
+    for marker, pattern, replacement in _HTML_REWRITES:
+        if marker in html_text:
+            html_text = pattern.sub(replacement, html_text)
+    if '<table' in html_text or '<img' in html_text:
+        html_text = strip_unsupported_tags(html_text)
     return html_text
 
-def convert_md_to_pdf_reportlab(md_file_path, output_dir="pdfs"):
-    """Convert markdown to PDF using ReportLab"""
+def classify_line(line):
+    """Return (kind, text) for a stripped Markdown line
+    
+    kind is one of 'blank', 'h1', 'h2', 'h3', 'bullet', 'numbered', 'fence' or 'text'.
+    """
+    if not line:
+        return 'blank', ''
+    prefix, sep, rest = line.partition(' ')
+    if sep:
+        kind = _LINE_PREFIXES.get(prefix)
+        if kind:
+            return kind, rest
+        if prefix[-1:] == '.' and prefix[:-1].isdecimal():
+            return 'numbered', line
+    if line.startswith('```'):
+        return 'fence', ''
+    return 'text', line
+
+def parse_blocks(md_content):
+    """Group Markdown lines into (kind, text) blocks
     
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    Consecutive text lines are joined into one 'paragraph'; a blank line after a
+    paragraph becomes a 'gap'; code fences are dropped (ReportLab has limited code
+    support). Other kinds are those of classify_line.
+    """
+    blocks = []
+    paragraph = []
+    for line in map(str.strip, md_content.split('\n')):
+        if not line:
+            kind, text = 'blank', ''
+        elif line[0] not in _MARKER_CHARS and not line[0].isdecimal():
+            # Most lines are prose: skip classify_line for them
+            paragraph.append(line)
+            continue
+        else:
+            kind, text = classify_line(line)
+            if kind == 'text':
+                paragraph.append(text)
+                continue
+            if kind == 'fence':
+                continue
+        if paragraph:
+            blocks.append(('paragraph', " ".join(paragraph)))
+            paragraph = []
+            if kind == 'blank':
+                blocks.append(('gap', ''))
+        if kind != 'blank':
+            blocks.append((kind, text))
+    if paragraph:
+        blocks.append(('paragraph', " ".join(paragraph)))
+    return blocks
+
+def layout_blocks(blocks, block_styles):
+    """Yield the ReportLab flowables for parsed blocks"""
+    for kind, text in blocks:
+        if kind == 'gap':
+            yield Spacer(1, 6)
+            continue
+        if kind in _SPACE_BEFORE:
+            yield Spacer(1, _SPACE_BEFORE[kind])
+        if kind == 'bullet':
+            text = f"• {text}"
+        yield Paragraph(text, block_styles[kind])
+
+def convert_md_to_pdf_reportlab(md_file_path, md_content, output_dir="pdfs", cache=None):
+    """Convert markdown, already read into md_content, to PDF using ReportLab (skipped if cache shows it unchanged)"""
     
-    # Read markdown file
-    try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-    except Exception as e:
-        print(f"Error reading {md_file_path}: {e}")
+    # Source couldn't be read (already reported by read_markdown_files)
+    if md_content is None:
         return False
     
-    # Convert markdown to HTML
-    html = markdown.markdown(md_content, extensions=['fenced_code'])
-    
     # Generate PDF filename
     pdf_filename = os.path.join(output_dir, Path(md_file_path).stem + '.pdf')
     
+    if cache is not None and is_current(cache, pdf_filename, md_content, _BUILDER):
+        print(f"⏭️  Unchanged: {md_file_path} → {pdf_filename}")
+        return True
+    
     try:
-        # Create PDF document
-        doc = SimpleDocTemplate(pdf_filename, pagesize=A4)
-        
-        # Define styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=HexColor('#2c3e50'),
-            alignment=1  # Center alignment
-        )
-        
-        heading1_style = ParagraphStyle(
-            'CustomHeading1',
-            parent=styles['Heading1'],
-            fontSize=18,
-            spaceAfter=12,
-            spaceBefore=20,
-            textColor=HexColor('#2c3e50')
-        )
-        
-        heading2_style = ParagraphStyle(
-            'CustomHeading2',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=10,
-            spaceBefore=15,
-            textColor=HexColor('#34495e')
-        )
-        
         # Story to hold document content
         story = []
         
         # Add title
         title = Path(md_file_path).stem.replace('_', ' ').title()
-        story.append(Paragraph(title, title_style))
+        story.append(Paragraph(title, _STYLES['CustomTitle']))
         story.append(Spacer(1, 20))
         
-        # Split content by lines and process
-        lines = md_content.split('\n')
-        current_paragraph = ""
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                if current_paragraph:
-                    story.append(Paragraph(current_paragraph, styles['Normal']))
-                    story.append(Spacer(1, 6))
-                    current_paragraph = ""
-                continue
-            
-            if line.startswith('# '):
-                if current_paragraph:
-                    story.append(Paragraph(current_paragraph, styles['Normal']))
-                    current_paragraph = ""
-                story.append(Spacer(1, 12))
-                story.append(Paragraph(line[2:], heading1_style))
-                
-            elif line.startswith('## '):
-                if current_paragraph:
-                    story.append(Paragraph(current_paragraph, styles['Normal']))
-                    current_paragraph = ""
-                story.append(Spacer(1, 10))
-                story.append(Paragraph(line[3:], heading2_style))
-                
-            elif line.startswith('### '):
-                if current_paragraph:
-                    story.append(Paragraph(current_paragraph, styles['Normal']))
-                    current_paragraph = ""
-                story.append(Spacer(1, 8))
-                story.append(Paragraph(line[4:], styles['Heading3']))
-                
-            elif line.startswith('```'):
-                # Skip code blocks for now (ReportLab has limited code support)
-                continue
-                
-            elif line.startswith('- ') or line.startswith('* '):
-                if current_paragraph:
-                    story.append(Paragraph(current_paragraph, styles['Normal']))
-                    current_paragraph = ""
-                bullet_text = f"• {line[2:]}"
-                story.append(Paragraph(bullet_text, styles['Normal']))
-                
-            elif line.startswith('1. ') or re.match(r'^\d+\. ', line):
-                if current_paragraph:
-                    story.append(Paragraph(current_paragraph, styles['Normal']))
-                    current_paragraph = ""
-                story.append(Paragraph(line, styles['Normal']))
-                
-            else:
-                if current_paragraph:
-                    current_paragraph += " " + line
-                else:
-                    current_paragraph = line
-        
-        # Add any remaining paragraph
-        if current_paragraph:
-            story.append(Paragraph(current_paragraph, styles['Normal']))
+        # Parse the whole document into blocks, then lay them out in one batch
+        story.extend(layout_blocks(parse_blocks(md_content), _BLOCK_STYLES))
         
         # Build PDF
-        doc.build(story)
+        with open_output(pdf_filename) as f:
+            SimpleDocTemplate(f, pagesize=A4).build(story)
         print(f"✅ Converted: {md_file_path} → {pdf_filename}")
         return True
         
@@ -166,7 +248,7 @@ def main():
     print("🔍 Searching for .md files...")
     
     # Find all markdown files recursively
-    md_files = glob.glob("**/*.md", recursive=True)
+    md_files = find_markdown_files()
     
     if not md_files:
         print("❌ No .md files found")
@@ -175,11 +257,20 @@ def main():
     print(f"📄 Found {len(md_files)} markdown files")
     print("\n🔄 Converting to PDF using ReportLab...")
     
-    success_count = 0
+    # Create the output directory once; the per-file converters assume it exists
+    os.makedirs("pdfs", exist_ok=True)
+    
+    # Files are independent and CPU-bound, so build them one process per core
+    contents = read_markdown_files(md_files)
+    cache = load_cache("pdfs")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = list(pool.map(partial(convert_md_to_pdf_reportlab, cache=cache), md_files, contents))
+    success_count = sum(results)
     
-    for md_file in md_files:
-        if convert_md_to_pdf_reportlab(md_file):
-            success_count += 1
+    for md_file, md_content, converted in zip(md_files, contents, results):
+        if converted:
+            record(cache, os.path.join("pdfs", Path(md_file).stem + '.pdf'), md_content, _BUILDER)
+    save_cache("pdfs", cache)
     
     print(f"\n📊 Conversion Summary:")
     print(f"   ✅ Successfully converted: {success_count}/{len(md_files)} files to PDF")
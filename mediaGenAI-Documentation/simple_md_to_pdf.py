@@ -5,31 +5,21 @@ Uses markdown and built-in html2text capabilities
 """
 
 import os
-import glob
 import markdown
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from string import Template
 
-def convert_md_to_html(md_file_path, output_dir="pdfs"):
-    """Convert markdown to HTML first"""
-    
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Read markdown file
-    try:
-        with open(md_file_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-    except Exception as e:
-        print(f"Error reading {md_file_path}: {e}")
-        return None
-    
-    # Convert markdown to HTML
-    html = markdown.markdown(md_content, extensions=['tables', 'fenced_code', 'toc'])
-    
-    # Add CSS styling for better appearance
-    css_styles = """
+from conversion_cache import builder_version, is_current, load_cache, record, save_cache
+from md_files import find_markdown_files, read_markdown_files
+from html_to_pdf_safari import find_chrome, print_html_files_with_chrome
+
+# Add CSS styling for better appearance
+_CSS_STYLES = """
     <style>
     body {
         font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
@@ -80,6 +70,8 @@ def convert_md_to_html(md_file_path, output_dir="pdfs"):
         border-collapse: collapse;
         width: 100%;
         margin: 20px 0;
+        /* Column widths come from the first row instead of measuring every cell */
+        table-layout: fixed;
         box-shadow: 0 1px 3px rgba(0,0,0,0.2);
     }
     table, th, td {
@@ -131,26 +123,48 @@ def convert_md_to_html(md_file_path, output_dir="pdfs"):
     }
     </style>
     """
-    
-    # Create full HTML document
-    html_content = f"""
+
+# Full HTML document; the CSS is spliced in once and only title/body vary per file
+_HTML_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
-        <title>{Path(md_file_path).stem}</title>
-        {css_styles}
+        <title>$title</title>
+        """ + _CSS_STYLES + """
     </head>
     <body>
-        <h1 style="text-align: center; color: #2c3e50; margin-bottom: 30px;">{Path(md_file_path).stem.replace('_', ' ').title()}</h1>
-        {html}
+        <h1 style="text-align: center; color: #2c3e50; margin-bottom: 30px;">$heading</h1>
+        $body
     </body>
     </html>
-    """
+    """)
+
+# Cache id; changes whenever this converter's template, CSS or code does
+_BUILDER = builder_version('html', __file__)
+
+# Built once per process: extension setup and regex compilation aren't repeated per file
+_MD = markdown.Markdown(extensions=['tables', 'fenced_code', 'toc'])
+
+def convert_md_to_html(md_file_path, md_content, output_dir="pdfs", cache=None):
+    """Convert markdown, already read into md_content, to HTML first (skipped if cache shows it unchanged)"""
+    
+    # Source couldn't be read (already reported by read_markdown_files)
+    if md_content is None:
+        return None
     
-    # Save HTML file
     html_filename = os.path.join(output_dir, Path(md_file_path).stem + '.html')
+    if cache is not None and is_current(cache, html_filename, md_content, _BUILDER):
+        return html_filename
+    
+    # Convert markdown to HTML
+    html = _MD.reset().convert(md_content)
+    
+    # Create full HTML document
+    stem = Path(md_file_path).stem
+    html_content = _HTML_TEMPLATE.substitute(title=stem, heading=stem.replace('_', ' ').title(), body=html)
     
+    # Save HTML file
     try:
         with open(html_filename, 'w', encoding='utf-8') as f:
             f.write(html_content)
@@ -159,29 +173,41 @@ def convert_md_to_html(md_file_path, output_dir="pdfs"):
         print(f"❌ Error creating HTML for {md_file_path}: {e}")
         return None
 
+def pdf_is_current(html_file):
+    """True if the HTML wasn't rewritten since its PDF was printed from it"""
+    pdf_file = html_file.replace('.html', '.pdf')
+    return os.path.exists(pdf_file) and os.path.getmtime(pdf_file) >= os.path.getmtime(html_file)
+
 def convert_html_to_pdf_via_browser(html_file):
     """Convert HTML to PDF using system's print-to-PDF capability"""
     
     pdf_file = html_file.replace('.html', '.pdf')
     
-    # Try different methods to convert HTML to PDF
+    if pdf_is_current(html_file):
+        return pdf_file
+    
+    html_url = f"file://{os.path.abspath(html_file)}"
+    
+    # Try different methods to convert HTML to PDF; argument lists run without a
+    # shell, so filenames need no quoting and a missing tool is just FileNotFoundError
     methods = [
         # Method 1: Try using wkhtmltopdf if available
-        f"wkhtmltopdf --page-size A4 --margin-top 20mm --margin-bottom 20mm --margin-left 15mm --margin-right 15mm '{html_file}' '{pdf_file}'",
+        ["wkhtmltopdf", "--page-size", "A4", "--margin-top", "20mm", "--margin-bottom", "20mm",
+         "--margin-left", "15mm", "--margin-right", "15mm", html_file, pdf_file],
         
         # Method 2: Try using Chrome/Chromium headless
-        f"google-chrome --headless --disable-gpu --print-to-pdf='{pdf_file}' --print-to-pdf-no-header 'file://{os.path.abspath(html_file)}'",
+        ["google-chrome", "--headless", "--disable-gpu", f"--print-to-pdf={pdf_file}", "--print-to-pdf-no-header", html_url],
         
         # Method 3: Try using Chromium
-        f"chromium --headless --disable-gpu --print-to-pdf='{pdf_file}' --print-to-pdf-no-header 'file://{os.path.abspath(html_file)}'",
+        ["chromium", "--headless", "--disable-gpu", f"--print-to-pdf={pdf_file}", "--print-to-pdf-no-header", html_url],
         
         # Method 4: Try using Safari (macOS)
-        f"Safari --headless --print-to-pdf '{pdf_file}' '{html_file}'" # Note: This might not work
+        ["Safari", "--headless", "--print-to-pdf", pdf_file, html_file]  # Note: This might not work
     ]
     
     for method in methods:
         try:
-            result = subprocess.run(method, shell=True, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(method, capture_output=True, text=True, timeout=30)
             if result.returncode == 0 and os.path.exists(pdf_file):
                 return pdf_file
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
@@ -197,7 +223,7 @@ def main():
     print(f"🔍 Searching for .md files in: {current_dir}")
     
     # Find all markdown files recursively
-    md_files = glob.glob("**/*.md", recursive=True)
+    md_files = find_markdown_files()
     
     if not md_files:
         print("❌ No .md files found in the current directory and subdirectories")
@@ -213,10 +239,22 @@ def main():
     html_files = []
     success_count = 0
     
-    # Convert each file to HTML first
-    for md_file in md_files:
+    # Create the output directory once; the per-file converters assume it exists
+    os.makedirs("pdfs", exist_ok=True)
+    
+    # Convert each file to HTML first, one process per core
+    contents = read_markdown_files(md_files)
+    cache = load_cache("pdfs")
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = list(pool.map(partial(convert_md_to_html, cache=cache), md_files, contents))
+    
+    for md_content, html_file in zip(contents, results):
+        if html_file:
+            record(cache, html_file, md_content, _BUILDER)
+    save_cache("pdfs", cache)
+    
+    for md_file, html_file in zip(md_files, results):
         print(f"   Processing: {md_file}")
-        html_file = convert_md_to_html(md_file)
         if html_file:
             html_files.append(html_file)
             success_count += 1
@@ -237,13 +275,9 @@ def main():
     tools_to_check = ['wkhtmltopdf', 'google-chrome', 'chromium']
     
     for tool in tools_to_check:
-        try:
-            result = subprocess.run(f"which {tool}", shell=True, capture_output=True)
-            if result.returncode == 0:
-                tools_available.append(tool)
-                print(f"   ✅ Found: {tool}")
-        except:
-            pass
+        if shutil.which(tool):
+            tools_available.append(tool)
+            print(f"   ✅ Found: {tool}")
     
     if not tools_available:
         print(f"\n⚠️  No PDF conversion tools found.")
@@ -256,8 +290,19 @@ def main():
     
     # Try to convert HTML files to PDF
     pdf_success_count = 0
-    for html_file in html_files:
-        pdf_file = convert_html_to_pdf_via_browser(html_file)
+    chrome = find_chrome() if 'wkhtmltopdf' not in tools_available else None
+    if chrome:
+        # Chrome is the first tool that works here: print everything stale through
+        # one browser instead of launching it per file
+        stale = [html_file for html_file in html_files if not pdf_is_current(html_file)]
+        printed = dict(zip(stale, print_html_files_with_chrome(chrome, stale)))
+        results = [printed.get(html_file, html_file.replace('.html', '.pdf')) for html_file in html_files]
+    else:
+        # Each conversion is an external process, so threads are enough to overlap them
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+            results = list(pool.map(convert_html_to_pdf_via_browser, html_files))
+    
+    for html_file, pdf_file in zip(html_files, results):
         if pdf_file:
             pdf_success_count += 1
             print(f"   ✅ PDF created: {pdf_file}")